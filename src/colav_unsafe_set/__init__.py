@@ -1,7 +1,25 @@
-from colav_unsafe_set.unsafe_set import create_unsafe_set
+from colav_unsafe_set.unsafe_set import (
+    create_unsafe_set,
+    create_unsafe_sets,
+    create_multi_horizon_unsafe_sets,
+    create_clustered_unsafe_sets,
+    evaluate_many,
+    UnsafeSetTracker,
+    UnsafeSet,
+    UnsafeSetQuality,
+    OccupancyGrid
+)
 from colav_unsafe_set.risk_assessment import calculate_obstacle_metrics_for_agent
 
 __all__ = [
     'create_unsafe_set',
+    'create_unsafe_sets',
+    'create_multi_horizon_unsafe_sets',
+    'create_clustered_unsafe_sets',
+    'evaluate_many',
+    'UnsafeSetTracker',
+    'UnsafeSet',
+    'UnsafeSetQuality',
+    'OccupancyGrid',
     'calculate_obstacle_metrics_for_agent'
 ]
\ No newline at end of file
@@ -1,3 +1,11 @@
-from .collision_geometry import gen_uIoI_convhull
+from .collision_geometry import (
+    gen_uIoI_convhull,
+    gen_uIoI_convhull_array,
+    gen_disc_convhull,
+    gen_disc_convhull_array
+)
+from .disc_hull import disc_convex_hull
 
-__all__ = ['gen_uIOI_convhull']
\ No newline at end of file
+__all__ = [
+    'gen_uIoI_convhull', 'gen_uIoI_convhull_array', 'gen_disc_convhull', 'gen_disc_convhull_array', 'disc_convex_hull'
+]
\ No newline at end of file
@@ -1,65 +1,237 @@
 import numpy as np
-from typing import List, Sequence
-from scipy.spatial import ConvexHull
-from colav_unsafe_set.objects import DynamicObstacleWithMetrics
-from colav_unsafe_set.position_prediction import predict_position
+from typing import List, Optional, Sequence, Tuple
+from .disc_hull import disc_convex_hull
+from colav_unsafe_set.instrumentation import stage_timer
+from colav_unsafe_set.objects import DynamicObstacleWithMetrics, ObstacleBatch
+from colav_unsafe_set.position_prediction import predict_trajectories
 
-def gen_uIoI_convhull(uIoI: List[DynamicObstacleWithMetrics]) -> List[List[float]]:
+def gen_uIoI_convhull(
+    uIoI: List[DynamicObstacleWithMetrics],
+    exact: bool = False,
+    arc_resolution: float = np.pi / 18,
+    swept_steps: int = 0,
+    swept_horizon: Optional[float] = None,
+) -> List[List[float]]:
+    """
+    Generate the convex hull points of the union of safety regions from a list of dynamic obstacles.
+
+    List form of gen_uIoI_convhull_array, kept for compatibility.
+
+    Args:
+        uIoI (List[DynamicObstacleWithMetrics]): A list of dynamic obstacles with associated metrics.
+        exact (bool): Compute the exact convex hull of the discs instead of sampling each circle.
+        arc_resolution (float): Maximum angular step in radians along hull arcs when exact is set.
+        swept_steps (int): Number of predicted discs per obstacle along its trajectory (0 to use the TCPA disc only).
+        swept_horizon (Optional[float]): Sweep end time for obstacles without a future TCPA
+                                         (those are not swept if None).
+
+    Returns:
+        List[List[float]]: A list of coordinate pairs representing the convex hull vertices.
+    """
+    return gen_uIoI_convhull_array(
+        uIoI, exact=exact, arc_resolution=arc_resolution, swept_steps=swept_steps, swept_horizon=swept_horizon
+    ).tolist()
+
+
+def gen_uIoI_convhull_array(
+    uIoI: List[DynamicObstacleWithMetrics],
+    exact: bool = False,
+    arc_resolution: float = np.pi / 18,
+    swept_steps: int = 0,
+    swept_horizon: Optional[float] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Generate the convex hull points of the union of safety regions from a list of dynamic obstacles.
     
-    Each dynamic obstacle's safety region is approximated as a circle (using _generate_circle_vertices). 
-    The union of all vertices from these circles is then used to compute the convex hull, and the function 
-    returns the coordinates of the hull's vertices.
+    Each dynamic obstacle contributes a safety disc at its current position and, when its TCPA lies
+    in the future, another at its position predicted at TCPA. By default each disc is approximated
+    as a circle (using _generate_discs_vertices) and the convex hull of all these vertices is
+    returned. With exact=True the hull of the discs themselves is computed (see disc_convex_hull)
+    and emitted as a polygon that circumscribes it at the given arc resolution.
+
+    A turning obstacle's trajectory between its current and TCPA positions can bulge outside
+    those two discs. With swept_steps = K > 0 the trajectory is instead sampled at K evenly
+    spaced times up to TCPA, all obstacles and steps being predicted in one array operation.
     
     Args:
         uIoI (List[DynamicObstacleWithMetrics]): A list of dynamic obstacles with associated metrics.
+        exact (bool): Compute the exact convex hull of the discs instead of sampling each circle.
+        arc_resolution (float): Maximum angular step in radians along hull arcs when exact is set.
+        swept_steps (int): Number of predicted discs per obstacle along its trajectory (0 to use the TCPA disc only).
+        swept_horizon (Optional[float]): Sweep end time for obstacles without a future TCPA
+                                         (those are not swept if None).
+        out (Optional[np.ndarray]): Preallocated (rows, 2) float64 buffer to write the vertices into
+                                    (see gen_disc_convhull_array).
     
+    Returns:
+        np.ndarray: The (H, 2) float64 convex hull vertices, a view of out if given.
+    """
+    centres, radii = _uIoI_discs(uIoI, swept_steps=swept_steps, swept_horizon=swept_horizon)
+    return gen_disc_convhull_array(centres, radii, exact=exact, arc_resolution=arc_resolution, out=out)
+
+
+def gen_disc_convhull(
+    centres: np.ndarray,
+    radii: np.ndarray,
+    exact: bool = False,
+    arc_resolution: float = np.pi / 18,
+    coarse_points: Optional[int] = None,
+) -> List[List[float]]:
+    """
+    Generate the convex hull points of a set of safety discs.
+
+    List form of gen_disc_convhull_array, kept for compatibility.
+
+    Args:
+        centres (np.ndarray): The (n, 2) disc centres.
+        radii (np.ndarray): The (n,) disc radii.
+        exact (bool): Compute the exact convex hull of the discs instead of sampling each circle.
+        arc_resolution (float): Maximum angular step in radians along hull arcs when exact is set.
+        coarse_points (Optional[int]): If set (and exact is not), approximate each disc by the
+                                       circumscribed polygon with this many vertices.
+
     Returns:
         List[List[float]]: A list of coordinate pairs representing the convex hull vertices.
     """
-    # Collect vertices for current positions
-    unsafe_set_vertices: List[List[float]] = [
-        vertex
+    return gen_disc_convhull_array(
+        centres, radii, exact=exact, arc_resolution=arc_resolution, coarse_points=coarse_points
+    ).tolist()
+
+
+def gen_disc_convhull_array(
+    centres: np.ndarray,
+    radii: np.ndarray,
+    exact: bool = False,
+    arc_resolution: float = np.pi / 18,
+    coarse_points: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Generate the convex hull points of a set of safety discs as an array.
+
+    Args:
+        centres (np.ndarray): The (n, 2) disc centres.
+        radii (np.ndarray): The (n,) disc radii.
+        exact (bool): Compute the exact convex hull of the discs instead of sampling each circle.
+        arc_resolution (float): Maximum angular step in radians along hull arcs when exact is set.
+        coarse_points (Optional[int]): If set (and exact is not), approximate each disc by the
+                                       circumscribed polygon with this many vertices, a cheaper
+                                       hull that still covers every disc.
+        out (Optional[np.ndarray]): Preallocated (rows, 2) float64 buffer to write the vertices into,
+                                    so a caller can reuse one array across calls. It must have at
+                                    least as many rows as the hull has vertices.
+
+    Returns:
+        np.ndarray: The (H, 2) float64 convex hull vertices, or out[:H] if out is given.
+
+    Raises:
+        ValueError: If out is not a (rows, 2) float64 array or has fewer than H rows.
+    """
+    if out is not None and (out.dtype != np.float64 or out.ndim != 2 or out.shape[1] != 2):
+        raise ValueError("out must be a (rows, 2) float64 array")
+    if len(radii) == 0:
+        return np.empty((0, 2), dtype=np.float64) if out is None else out[:0]
+
+    if exact:
+        with stage_timer('hull'):
+            hull_points = disc_convex_hull(centres, radii, arc_resolution=arc_resolution)
+        if out is None:
+            return hull_points
+        _check_out_rows(out, len(hull_points))
+        out[:len(hull_points)] = hull_points
+        return out[:len(hull_points)]
+
+    with stage_timer('vertex_generation'):
+        if coarse_points is not None:
+            if coarse_points < 3:
+                raise ValueError("coarse_points must be at least 3")
+            circumradii = np.asarray(radii, dtype=np.float64) / np.cos(np.pi / coarse_points)
+            unsafe_set_vertices = _generate_discs_vertices(centres, circumradii, num_points=coarse_points)
+        else:
+            unsafe_set_vertices = _generate_discs_vertices(centres, radii)
+    return _vertices_convhull_array(unsafe_set_vertices, out=out)
+
+
+def _vertices_convhull(vertices: np.ndarray) -> List[List[float]]:
+    """Return the convex hull vertices of an (m, 2) point array as a list of coordinate pairs."""
+    return _vertices_convhull_array(vertices).tolist()
+
+
+def _vertices_convhull_array(vertices: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return the convex hull vertices of an (m, 2) point array, gathered into out[:H] if given."""
+    from scipy.spatial import ConvexHull
+
+    with stage_timer('hull'):
+        hull_indices = ConvexHull(vertices).vertices
+        if out is None:
+            hull_points = vertices[hull_indices]
+        else:
+            _check_out_rows(out, len(hull_indices))
+            hull_points = np.take(vertices, hull_indices, axis=0, out=out[:len(hull_indices)])
+
+    return hull_points
+
+
+def _check_out_rows(out: np.ndarray, rows: int) -> None:
+    """Raise a ValueError if out cannot hold a hull with the given number of vertices."""
+    if out.shape[0] < rows:
+        raise ValueError(f"out has {out.shape[0]} rows but the hull has {rows} vertices")
+
+
+def _uIoI_discs(
+    uIoI: List[DynamicObstacleWithMetrics],
+    swept_steps: int = 0,
+    swept_horizon: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Collect the safety discs of the uIoI: every current position first, then the positions
+    predicted at TCPA for obstacles whose TCPA lies in the future.
+
+    With swept_steps = K > 0 each obstacle instead contributes K predicted discs, evenly spaced
+    in time along its trajectory up to its TCPA (or up to swept_horizon for obstacles without a
+    future TCPA), grouped obstacle by obstacle. K = 1 gives the same discs as K = 0.
+    """
+    if swept_steps < 0:
+        raise ValueError("swept_steps must be a non-negative integer")
+    if swept_horizon is not None and not swept_horizon > 0:
+        raise ValueError("swept_horizon must be a positive number")
+
+    current_centres = [
+        [dynamic_obstacle.dynamic_obstacle.position[0], dynamic_obstacle.dynamic_obstacle.position[1]]
         for dynamic_obstacle in uIoI
-        for vertex in _generate_circle_vertices(
-            centroid=[
-                dynamic_obstacle.dynamic_obstacle.position[0],
-                dynamic_obstacle.dynamic_obstacle.position[1]
-            ],
-            radius=dynamic_obstacle.dynamic_obstacle.safety_radius
-        )
     ]
+    current_radii = [dynamic_obstacle.dynamic_obstacle.safety_radius for dynamic_obstacle in uIoI]
 
-    # Collect vertices for predicted future positions
-    for dynamic_obstacle in uIoI:
-        if dynamic_obstacle.tcpa > 0 and not np.isnan(dynamic_obstacle.tcpa):
-            future_position = predict_position(
-                position=dynamic_obstacle.dynamic_obstacle.position,
-                quaternion_orientation=dynamic_obstacle.dynamic_obstacle.orientation,
-                velocity=dynamic_obstacle.dynamic_obstacle.velocity,
-                yaw_rate=dynamic_obstacle.dynamic_obstacle.yaw_rate,
-                dt=dynamic_obstacle.tcpa
-            ) 
-            # Use extend to avoid nested lists
-            unsafe_set_vertices.extend(
-                _generate_circle_vertices(
-                    centroid=[future_position[0], future_position[1]],
-                    radius=dynamic_obstacle.dynamic_obstacle.safety_radius
-                )
-            )
-
-    if not unsafe_set_vertices:
-        return []
-    
-    unsafe_set_vertices = np.array(unsafe_set_vertices, dtype=np.float64)  # Ensure float type
-    hull_indices = ConvexHull(unsafe_set_vertices).vertices
-    hull_points = unsafe_set_vertices[hull_indices].tolist()  # Convert back to a list of lists
+    # Prediction end time of every obstacle, NaN for obstacles that are not predicted
+    tcpa = np.array([dynamic_obstacle.tcpa for dynamic_obstacle in uIoI], dtype=np.float64)
+    end_times = np.where(np.isfinite(tcpa) & (tcpa > 0), tcpa, np.nan)
+    if swept_steps > 0 and swept_horizon is not None:
+        end_times[np.isnan(end_times)] = swept_horizon
+    predicted = np.flatnonzero(~np.isnan(end_times))
 
-    return hull_points
+    # Predict all future positions (obstacles x steps) at once
+    steps = max(swept_steps, 1)
+    future_centres = np.empty((0, 2), dtype=np.float64)
+    if predicted.size:
+        times = end_times[predicted, None] * np.linspace(0.0, 1.0, steps + 1)[1:]
+        with stage_timer('prediction'):
+            future_centres = predict_trajectories(
+                obstacles=ObstacleBatch.from_obstacles(
+                    [uIoI[i].dynamic_obstacle for i in predicted]
+                ),
+                times=times,
+            )[:, :, :2].reshape(-1, 2)
+    future_radii = [uIoI[i].dynamic_obstacle.safety_radius for i in predicted for _ in range(steps)]
+
+    centres = np.concatenate(
+        [np.array(current_centres, dtype=np.float64).reshape(-1, 2), future_centres]
+    )
+    radii = np.array(current_radii + future_radii, dtype=np.float64)
+    return centres, radii
 
 
-def _generate_circle_vertices(centroid: Sequence[float], radius: float, num_points: int = 10) -> List[List[float]]:
+def _generate_circle_vertices(centroid: Sequence[float], radius: float, num_points: int = 10) -> np.ndarray:
     """
     Generate vertices approximating a circle in the XY plane.
     
@@ -71,11 +243,22 @@ def _generate_circle_vertices(centroid: Sequence[float], radius: float, num_poin
         num_points (int): The number of vertices to generate (default is 10).
         
     Returns:
-        List[List[float]]: A list of [x, y] vertices representing the circle.
+        np.ndarray: The (num_points, 2) vertices representing the circle.
+    """
+    return _generate_discs_vertices(centroid, [radius], num_points=num_points)
+
+
+def _generate_discs_vertices(centres: np.ndarray, radii: np.ndarray, num_points: int = 10) -> np.ndarray:
+    """
+    Generate the vertices approximating many circles at once.
+
+    Returns the (n * num_points, 2) vertices of every circle, circle by circle, each circle
+    sampled at num_points evenly spaced angles starting from the +x axis.
     """
-    x_c, y_c = centroid
+    centres = np.asarray(centres, dtype=np.float64).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1, 1)
     theta = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
-    x = x_c + radius * np.cos(theta)
-    y = y_c + radius * np.sin(theta)
-    circle_vertices = np.column_stack((x, y))
-    return circle_vertices.tolist()
+    vertices = np.empty((centres.shape[0], num_points, 2), dtype=np.float64)
+    vertices[:, :, 0] = centres[:, 0:1] + radii * np.cos(theta)
+    vertices[:, :, 1] = centres[:, 1:2] + radii * np.sin(theta)
+    return vertices.reshape(-1, 2)
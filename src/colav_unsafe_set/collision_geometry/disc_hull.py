@@ -0,0 +1,115 @@
+import math
+import numpy as np
+from typing import List, Tuple
+
+TWO_PI = 2 * math.pi
+
+# An envelope is a list of (start_angle, disc_index) pieces sorted by angle, the first
+# starting at 0. Piece k owns the outward normal directions [start_k, start_k+1), the
+# last one running up to 2π.
+Envelope = List[Tuple[float, int]]
+
+
+def disc_convex_hull(centres: np.ndarray, radii: np.ndarray, arc_resolution: float = math.pi / 18) -> np.ndarray:
+    """
+    Compute the convex hull of a set of discs exactly and emit it as a polygon.
+
+    The hull boundary is the upper envelope of the discs' support functions
+    h_i(θ) = c_i · u(θ) + r_i, found by divide and conquer in O(n log n). Each envelope
+    piece is an arc of one disc; consecutive pieces are joined by their common tangent.
+
+    The arcs are replaced by tangent lines spaced at most arc_resolution apart, so the
+    returned polygon circumscribes the true hull: it is guaranteed to cover every disc.
+
+    Args:
+        centres (np.ndarray): The (n, 2) disc centres.
+        radii (np.ndarray): The (n,) disc radii.
+        arc_resolution (float): Maximum angular step in radians between tangent lines (capped at π/2).
+
+    Returns:
+        np.ndarray: The (H, 2) polygon vertices in counter-clockwise order.
+    """
+    centres = np.asarray(centres, dtype=np.float64).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+    if radii.size == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    if not arc_resolution > 0:
+        raise ValueError("arc_resolution must be a positive number")
+    arc_resolution = min(arc_resolution, math.pi / 2)
+
+    envelope = _support_envelope(centres[:, 0].tolist(), centres[:, 1].tolist(), radii.tolist(), 0, radii.size)
+    return _envelope_polygon(envelope, centres, radii, arc_resolution)
+
+
+def _support_envelope(cx: List[float], cy: List[float], r: List[float], lo: int, hi: int) -> Envelope:
+    """Upper envelope of the support functions of discs lo..hi-1, by divide and conquer."""
+    if hi - lo == 1:
+        return [(0.0, lo)]
+    mid = (lo + hi) // 2
+    return _merge_envelopes(
+        _support_envelope(cx, cy, r, lo, mid), _support_envelope(cx, cy, r, mid, hi), cx, cy, r
+    )
+
+
+def _merge_envelopes(first: Envelope, second: Envelope, cx: List[float], cy: List[float], r: List[float]) -> Envelope:
+    """Merge two envelopes in time linear in their number of pieces."""
+    merged: Envelope = []
+    i = j = 0
+    start = 0.0
+    while start < TWO_PI:
+        a, b = first[i][1], second[j][1]
+        next_first = first[i + 1][0] if i + 1 < len(first) else TWO_PI
+        next_second = second[j + 1][0] if j + 1 < len(second) else TWO_PI
+        end = min(next_first, next_second)
+
+        # h_a - h_b = dx cos θ + dy sin θ + dr changes sign at most twice over the circle.
+        dx, dy, dr = cx[a] - cx[b], cy[a] - cy[b], r[a] - r[b]
+        bounds = [start]
+        amplitude = math.hypot(dx, dy)
+        if amplitude > abs(dr):
+            phase = math.atan2(dy, dx)
+            offset = math.acos(-dr / amplitude)
+            roots = sorted(
+                (phase + sign * offset) % TWO_PI for sign in (-1.0, 1.0)
+            )
+            bounds.extend(root for root in roots if start < root < end)
+        bounds.append(end)
+
+        for lower, upper in zip(bounds[:-1], bounds[1:]):
+            theta = 0.5 * (lower + upper)
+            winner = a if dx * math.cos(theta) + dy * math.sin(theta) + dr >= 0 else b
+            if not merged or merged[-1][1] != winner:
+                merged.append((lower, winner))
+
+        if end == next_first:
+            i += 1
+        if end == next_second:
+            j += 1
+        start = end
+    return merged
+
+
+def _envelope_polygon(envelope: Envelope, centres: np.ndarray, radii: np.ndarray, arc_resolution: float) -> np.ndarray:
+    """Emit the circumscribing polygon of an envelope, one vertex per tangent-line intersection."""
+    pieces = [
+        (start, envelope[k + 1][0] if k + 1 < len(envelope) else TWO_PI, disc)
+        for k, (start, disc) in enumerate(envelope)
+    ]
+    # The envelope is periodic: a disc owning both ends of [0, 2π) is a single arc.
+    if len(pieces) > 1 and pieces[0][2] == pieces[-1][2]:
+        first = pieces.pop(0)
+        pieces[-1] = (pieces[-1][0], first[1] + TWO_PI, first[2])
+
+    starts = np.array([piece[0] for piece in pieces])
+    spans = np.array([piece[1] - piece[0] for piece in pieces])
+    discs = np.array([piece[2] for piece in pieces], dtype=np.intp)
+
+    steps = np.maximum(np.ceil(spans / arc_resolution - 1e-12), 1).astype(np.intp)
+    step_angles = spans / steps
+    piece_of_vertex = np.repeat(np.arange(len(pieces)), steps)
+    vertex_in_piece = np.arange(piece_of_vertex.size) - np.repeat(np.cumsum(steps) - steps, steps)
+
+    theta = starts[piece_of_vertex] + (vertex_in_piece + 0.5) * step_angles[piece_of_vertex]
+    reach = radii[discs[piece_of_vertex]] / np.cos(0.5 * step_angles[piece_of_vertex])
+    vertices = centres[discs[piece_of_vertex]] + reach[:, None] * np.column_stack((np.cos(theta), np.sin(theta)))
+    return vertices
@@ -4,5 +4,17 @@ from .indices_of_interest import (
 from .unionise_indices_of_interest import (
     unionise_indices_of_interest
 )
+from .indices_of_interest_masks import (
+    IndicesOfInterestMasks,
+    PairSearchReport,
+    calc_I1_mask, calc_I2_mask, calc_I3_mask,
+    unionise_indices_of_interest_masks,
+    calc_indices_of_interest_masks,
+    calc_reachable_mask
+)
 
-__all__ = ["calc_I1", "calc_I2", "calc_I3", "unionise_indices_of_interest"]
\ No newline at end of file
+__all__ = [
+    "calc_I1", "calc_I2", "calc_I3", "unionise_indices_of_interest",
+    "IndicesOfInterestMasks", "PairSearchReport", "calc_I1_mask", "calc_I2_mask", "calc_I3_mask",
+    "unionise_indices_of_interest_masks", "calc_indices_of_interest_masks", "calc_reachable_mask"
+]
\ No newline at end of file
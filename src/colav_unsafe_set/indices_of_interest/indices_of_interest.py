@@ -3,15 +3,18 @@ from colav_unsafe_set.objects import (
     DynamicObstacle,
     DynamicObstacleWithMetrics
 )
-from scipy.spatial.distance import euclidean
-from typing import List
+from colav_unsafe_set.instrumentation import record_count
+from typing import Iterator, List, Optional
+import math
+import numpy as np
+from .indices_of_interest_masks import PAIR_BYTES, PairSearchReport, _count_blocks
 
 def compute_agent_obstacle_distance(agent: Agent, obstacle: DynamicObstacleWithMetrics) -> float:
     """
     Compute the adjusted Euclidean distance between an agent and a dynamic obstacle,
     subtracting both their safety radii.
     """
-    return euclidean(agent.position, obstacle.dynamic_obstacle.position) - (
+    return math.dist(agent.position, obstacle.dynamic_obstacle.position) - (
         agent.safety_radius + obstacle.dynamic_obstacle.safety_radius
     )
 
@@ -22,7 +25,7 @@ def compute_obstacle_distance(
     Compute the adjusted Euclidean distance between two dynamic obstacles,
     subtracting their safety radii.
     """
-    return euclidean(obstacle1.dynamic_obstacle.position, obstacle2.dynamic_obstacle.position) - (
+    return math.dist(obstacle1.dynamic_obstacle.position, obstacle2.dynamic_obstacle.position) - (
         obstacle1.dynamic_obstacle.safety_radius + obstacle2.dynamic_obstacle.safety_radius
     )
 
@@ -42,19 +45,44 @@ def calc_I2(
     I1: List[DynamicObstacleWithMetrics],
     dynamic_obstacles_with_metrics: List[DynamicObstacleWithMetrics],
     dsf: float,
+    max_bytes: Optional[int] = None,
+    report: Optional[PairSearchReport] = None,
 ) -> List[DynamicObstacleWithMetrics]:
     """
     Calculate the set of obstacles from I1 that have at least one other dynamic obstacle
     (from dynamic_obstacles_with_metrics) within the distance safety threshold.
+
+    The search is backed by a KD-tree over obstacle positions, so only obstacles within
+    dsf plus both safety radii of an operand are checked exactly. With max_bytes set, the
+    candidates are generated for blocks of I1 at a time, keeping their memory under it.
+    The search's working set is recorded in report if given (see PairSearchReport).
     """
+    if not I1 or not dynamic_obstacles_with_metrics:
+        return []
+
+    candidates = _neighbour_candidates(
+        query_positions=[operand.dynamic_obstacle.position for operand in I1],
+        query_radii=[operand.dynamic_obstacle.safety_radius for operand in I1],
+        positions=[arg.dynamic_obstacle.position for arg in dynamic_obstacles_with_metrics],
+        radii=[arg.dynamic_obstacle.safety_radius for arg in dynamic_obstacles_with_metrics],
+        dsf=dsf,
+        max_bytes=max_bytes,
+        report=report,
+    )
+
     I2 = []
-    for operand in I1:
-        for arg in dynamic_obstacles_with_metrics:
+    for operand, operand_candidates in zip(I1, candidates):
+        for index in operand_candidates:
+            arg = dynamic_obstacles_with_metrics[index]
             if operand == arg:
                 continue
             if compute_obstacle_distance(operand, arg) <= dsf:
                 I2.append(operand)
                 break  # add each operand only once and move to the next
+    # zip stops before asking for more candidates, and the search only fills in report and
+    # records its working set once exhausted, so finish it explicitly.
+    for _ in candidates:
+        pass
     return I2
 
 def calc_I3(
@@ -66,4 +94,55 @@ def calc_I3(
     return [
         dob for dob in dynamic_obstacles_with_metrics 
         if dob.dcpa <= dsf and dob.tcpa <= time_of_interest
-    ]
\ No newline at end of file
+    ]
+
+
+def _neighbour_candidates(
+    query_positions,
+    query_radii,
+    positions,
+    radii,
+    dsf: float,
+    max_bytes: Optional[int] = None,
+    report: Optional[PairSearchReport] = None,
+) -> Iterator[List[int]]:
+    """
+    Yield, for each query point, the indices of positions that may lie within dsf of it
+    once both safety radii are subtracted.
+
+    The search radius is widened by a small tolerance so that the exact distance check
+    applied by the caller decides every borderline case. With max_bytes set, candidates are
+    counted first and generated for blocks of query points holding at most
+    max_bytes // PAIR_BYTES candidates each. Once exhausted, and only then, the largest block's
+    estimated working set (see PairSearchReport) is recorded in report and as the
+    'pair_peak_bytes' instrumentation count.
+    """
+    from scipy.spatial import cKDTree
+
+    positions = np.asarray(positions, dtype=np.float64)
+    radii = np.asarray(radii, dtype=np.float64)
+    query_radii = np.asarray(query_radii, dtype=np.float64)
+    search_radii = dsf + query_radii + radii.max()
+    search_radii = np.maximum(search_radii, 0.0) * (1.0 + 1e-9) + 1e-9
+    tree = cKDTree(positions)
+    query_positions = np.asarray(query_positions, dtype=np.float64)
+    if max_bytes is None:
+        bounds = [(0, len(query_positions))]
+    else:
+        counts = tree.query_ball_point(query_positions, r=search_radii, return_length=True)
+        bounds = _count_blocks(counts, max(int(max_bytes) // PAIR_BYTES, 1))
+
+    peak_bytes = 0
+    candidate_pairs = 0
+    for start, stop in bounds:
+        candidates = tree.query_ball_point(query_positions[start:stop], r=search_radii[start:stop])
+        block_pairs = sum(len(operand_candidates) for operand_candidates in candidates)
+        candidate_pairs += block_pairs
+        peak_bytes = max(peak_bytes, block_pairs * PAIR_BYTES)
+        yield from candidates
+
+    if report is not None:
+        report.blocks = len(bounds)
+        report.candidate_pairs = candidate_pairs
+        report.peak_bytes = peak_bytes
+    record_count('pair_peak_bytes', peak_bytes)
@@ -0,0 +1,246 @@
+from colav_unsafe_set.objects import Agent, ObstacleBatch
+from colav_unsafe_set.instrumentation import record_count
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+
+# Estimated bytes held per candidate obstacle pair while a block is checked: the KD-tree
+# candidate records, gathered indices, position differences, distances and masks.
+PAIR_BYTES = 128
+
+@dataclass
+class IndicesOfInterestMasks:
+    """Boolean membership masks of the indices of interest over an obstacle batch."""
+    I1: np.ndarray                                # Within dsf of the agent
+    I2: np.ndarray                                # In I1 with another obstacle within dsf
+    I3: np.ndarray                                # DCPA within dsf before the time of interest
+    uIoI: np.ndarray                              # Union of I1, I2 and I3
+
+@dataclass
+class PairSearchReport:
+    """
+    Working-set report of an obstacle pair search, filled in by the functions accepting one.
+
+    peak_bytes is an estimate, the largest block's candidate pairs times PAIR_BYTES, not a
+    measurement of the memory actually allocated.
+    """
+    blocks: int = 0                               # Number of query blocks processed
+    candidate_pairs: int = 0                      # Candidate pairs checked exactly
+    peak_bytes: int = 0                           # Largest block's candidate pairs * PAIR_BYTES, in bytes
+
+def compute_agent_obstacle_distances(agent: Agent, obstacles: ObstacleBatch) -> np.ndarray:
+    """
+    Compute the adjusted Euclidean distances between an agent and every obstacle in a batch,
+    subtracting both their safety radii.
+    """
+    dx = agent.position[0] - obstacles.x
+    dy = agent.position[1] - obstacles.y
+    dz = (agent.position[2] if len(agent.position) > 2 else 0.0) - (
+        obstacles.z if obstacles.z is not None else 0.0
+    )
+    return np.sqrt(dx * dx + dy * dy + dz * dz) - (agent.safety_radius + obstacles.safety_radius)
+
+def compute_agents_obstacle_distances(agents: List[Agent], obstacles: ObstacleBatch) -> np.ndarray:
+    """
+    Compute the adjusted Euclidean distances between every agent and every obstacle in a batch,
+    subtracting both their safety radii, as an (agents x obstacles) array.
+    """
+    agent_positions = np.array(
+        [tuple(agent.position) + (0.0,) * (3 - len(agent.position)) for agent in agents], dtype=np.float64
+    ).reshape(-1, 3)
+    agent_radii = np.array([agent.safety_radius for agent in agents], dtype=np.float64)[:, None]
+    dx = agent_positions[:, 0:1] - obstacles.x
+    dy = agent_positions[:, 1:2] - obstacles.y
+    dz = agent_positions[:, 2:3] - (obstacles.z if obstacles.z is not None else 0.0)
+    return np.sqrt(dx * dx + dy * dy + dz * dz) - (agent_radii + obstacles.safety_radius)
+
+def calc_reachable_mask(
+    agent: Agent,
+    obstacles: ObstacleBatch,
+    dsf: float,
+    time_of_interest: float,
+) -> np.ndarray:
+    """
+    Conservative mask of the obstacles that may belong to the uIoI, computable before any CPA.
+
+    An obstacle is dropped only if d - (|v_a| + |v_j|) * toi - r_a - r_j > dsf, where d is its
+    planar distance from the agent. Such an obstacle is in neither I1 nor I3:
+      - I1 needs the 3D distance minus both radii to be at most dsf, and it is at least d - r_a - r_j.
+      - I3 needs DCPA <= dsf with TCPA <= toi. Both vessels travel at most |v| * t, so their
+        distance at any t <= toi is at least d - (|v_a| + |v_j|) * toi.
+    I2 is a subset of I1, so the uIoI is unchanged. I2 membership itself can depend on dropped
+    obstacles (as neighbours), but only for obstacles already in I1.
+    """
+    dx = agent.position[0] - obstacles.x
+    dy = agent.position[1] - obstacles.y
+    distance = np.sqrt(dx * dx + dy * dy)
+    reach = (abs(agent.velocity) + np.abs(obstacles.speed)) * max(time_of_interest, 0.0)
+    bound = distance - reach - (agent.safety_radius + obstacles.safety_radius)
+    # Widened slightly so rounding in the exact checks can never disagree with the bound.
+    return bound <= dsf + 1e-9 * (1.0 + abs(dsf) + reach + distance)
+
+def calc_I1_mask(agent: Agent, obstacles: ObstacleBatch, dsf: float) -> np.ndarray:
+    """Mask of the obstacles that are within the distance safety threshold (dsf) from the agent."""
+    return compute_agent_obstacle_distances(agent, obstacles) <= dsf
+
+def calc_I2_mask(
+    I1: np.ndarray,
+    obstacles: ObstacleBatch,
+    dsf: float,
+    max_bytes: Optional[int] = None,
+    report: Optional[PairSearchReport] = None,
+) -> np.ndarray:
+    """
+    Mask of the obstacles in I1 that have at least one other obstacle of the batch within
+    the distance safety threshold.
+
+    Unlike calc_I2, an obstacle is only excluded from its own neighbourhood by row, so
+    exact duplicate rows count as neighbours of each other.
+
+    With max_bytes set, the I1 obstacles are processed in blocks whose candidate pairs fit
+    the memory ceiling (see _neighbour_pair_blocks), and each block is reduced into the mask
+    before the next, so the working set stays flat as the batch grows.
+    """
+    I2 = np.zeros(len(obstacles), dtype=bool)
+    query_index = np.flatnonzero(I1)
+    if query_index.size == 0:
+        return I2
+    for operands, _ in _neighbour_pair_blocks(obstacles, dsf, query_index, max_bytes=max_bytes, report=report):
+        I2[operands] = True
+    return I2
+
+def calc_I3_mask(dcpa: np.ndarray, tcpa: np.ndarray, dsf: float, time_of_interest: float) -> np.ndarray:
+    """
+    Mask of the obstacles whose DCPA at the time of TCPA is within the distance safety threshold.
+
+    NaN DCPA/TCPA compare as False, so obstacles whose CPA lies in the past are excluded.
+    """
+    return (np.asarray(dcpa) <= dsf) & (np.asarray(tcpa) <= time_of_interest)
+
+def unionise_indices_of_interest_masks(I1: np.ndarray, I2: np.ndarray, I3: np.ndarray) -> np.ndarray:
+    """Unionise the indices of interest masks."""
+    return I1 | I2 | I3
+
+def calc_indices_of_interest_masks(
+    agent: Agent,
+    obstacles: ObstacleBatch,
+    dcpa: np.ndarray,
+    tcpa: np.ndarray,
+    dsf: float,
+    time_of_interest: float,
+    max_bytes: Optional[int] = None,
+    report: Optional[PairSearchReport] = None,
+) -> IndicesOfInterestMasks:
+    """
+    Calculate I1, I2, I3 and their union as boolean masks over an obstacle batch.
+
+    Args:
+        agent (Agent): The agent vessel.
+        obstacles (ObstacleBatch): The obstacles, in the same order as dcpa and tcpa.
+        dcpa (np.ndarray): DCPA of each obstacle relative to the agent.
+        tcpa (np.ndarray): TCPA of each obstacle relative to the agent.
+        dsf (float): The distance safety threshold.
+        time_of_interest (float): The TCPA horizon used for I3.
+        max_bytes (Optional[int]): Memory ceiling of the I2 pair search, unbounded if None.
+        report (Optional[PairSearchReport]): Filled in with the I2 pair search's working set if given.
+
+    Returns:
+        IndicesOfInterestMasks: The per-set and union membership masks.
+    """
+    I1 = calc_I1_mask(agent, obstacles, dsf)
+    I2 = calc_I2_mask(I1, obstacles, dsf, max_bytes=max_bytes, report=report)
+    I3 = calc_I3_mask(dcpa, tcpa, dsf, time_of_interest)
+    return IndicesOfInterestMasks(I1=I1, I2=I2, I3=I3, uIoI=unionise_indices_of_interest_masks(I1, I2, I3))
+
+def _neighbour_pairs(
+    obstacles: ObstacleBatch,
+    dsf: float,
+    query_index: Optional[np.ndarray] = None,
+    max_bytes: Optional[int] = None,
+    report: Optional[PairSearchReport] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the (operand, neighbour) row pairs of distinct obstacles that are within dsf of
+    each other once both safety radii are subtracted.
+
+    Only operands listed in query_index are considered (all rows if None). Candidate pairs
+    come from a KD-tree search widened by the largest safety radius and are then checked
+    exactly, in blocks bounded by max_bytes if set (see _neighbour_pair_blocks).
+    """
+    blocks = list(_neighbour_pair_blocks(obstacles, dsf, query_index, max_bytes=max_bytes, report=report))
+    if not blocks:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    if len(blocks) == 1:
+        return blocks[0]
+    return np.concatenate([block[0] for block in blocks]), np.concatenate([block[1] for block in blocks])
+
+def _neighbour_pair_blocks(
+    obstacles: ObstacleBatch,
+    dsf: float,
+    query_index: Optional[np.ndarray] = None,
+    max_bytes: Optional[int] = None,
+    report: Optional[PairSearchReport] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Yield the (operand, neighbour) pairs of _neighbour_pairs block by block.
+
+    Without max_bytes all operands form a single block. With it, the number of candidate pairs
+    of every operand is counted first (without materialising them), and consecutive operands
+    are grouped so that each block holds at most max_bytes // PAIR_BYTES candidates; an operand
+    with more candidates than that forms a block on its own. The largest block's estimated
+    working set is recorded in report and as the 'pair_peak_bytes' instrumentation count.
+    """
+    from scipy.spatial import cKDTree
+
+    positions = obstacles.positions
+    radii = obstacles.safety_radius
+    if query_index is None:
+        query_index = np.arange(len(obstacles))
+    if query_index.size == 0 or len(obstacles) == 0:
+        return
+
+    max_distance = max(dsf + radii[query_index].max() + radii.max(), 0.0) * (1.0 + 1e-9) + 1e-9
+    tree = cKDTree(positions)
+    if max_bytes is None:
+        bounds = [(0, query_index.size)]
+    else:
+        counts = tree.query_ball_point(positions[query_index], r=max_distance, return_length=True)
+        bounds = _count_blocks(counts, max(int(max_bytes) // PAIR_BYTES, 1))
+
+    peak_bytes = 0
+    candidate_pairs = 0
+    for start, stop in bounds:
+        block_index = query_index[start:stop]
+        candidates = cKDTree(positions[block_index]).sparse_distance_matrix(
+            tree, max_distance=max_distance, output_type='ndarray'
+        )
+        operands = block_index[candidates['i']]
+        neighbours = candidates['j'].astype(np.intp)
+
+        difference = positions[operands] - positions[neighbours]
+        distances = np.sqrt(np.einsum('ij,ij->i', difference, difference))
+        within = (distances - (radii[operands] + radii[neighbours]) <= dsf) & (operands != neighbours)
+
+        candidate_pairs += candidates.size
+        peak_bytes = max(peak_bytes, candidates.size * PAIR_BYTES)
+        yield operands[within], neighbours[within]
+
+    if report is not None:
+        report.blocks = len(bounds)
+        report.candidate_pairs = candidate_pairs
+        report.peak_bytes = peak_bytes
+    record_count('pair_peak_bytes', peak_bytes)
+
+def _count_blocks(counts: np.ndarray, max_count: int) -> List[Tuple[int, int]]:
+    """Split consecutive items into (start, stop) blocks whose counts sum to at most max_count."""
+    cumulative = np.cumsum(counts)
+    bounds = []
+    start = 0
+    while start < counts.size:
+        offset = cumulative[start - 1] if start > 0 else 0
+        stop = int(np.searchsorted(cumulative, offset + max_count, side='right'))
+        stop = max(stop, start + 1)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
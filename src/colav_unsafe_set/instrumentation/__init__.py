@@ -0,0 +1,21 @@
+from .instrumentation import (
+    Histogram,
+    InstrumentationRegistry,
+    enable_instrumentation,
+    disable_instrumentation,
+    is_instrumentation_enabled,
+    get_registry,
+    stage_timer,
+    record_count
+)
+
+__all__ = [
+    'Histogram',
+    'InstrumentationRegistry',
+    'enable_instrumentation',
+    'disable_instrumentation',
+    'is_instrumentation_enabled',
+    'get_registry',
+    'stage_timer',
+    'record_count'
+]
\ No newline at end of file
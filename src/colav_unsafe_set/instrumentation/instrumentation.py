@@ -0,0 +1,201 @@
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+_enabled = False
+
+# Log-spaced histogram buckets: 20 per decade (about 12% resolution) from 1e-9 upwards.
+_BUCKET_FLOOR = 1e-9
+_BUCKETS_PER_DECADE = 20
+_NUM_BUCKETS = 21 * _BUCKETS_PER_DECADE + 2
+_LOG_GROWTH = math.log(10) / _BUCKETS_PER_DECADE
+
+
+class Histogram:
+    """
+    Fixed-size log-bucketed histogram of non-negative values.
+
+    Recording is O(1) and memory is constant, at the cost of percentiles being accurate to
+    the bucket resolution (about 12%). Exact count, total, minimum and maximum are also kept.
+    """
+
+    __slots__ = ('buckets', 'count', 'total', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.buckets = [0] * _NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram."""
+        if value <= _BUCKET_FLOOR:
+            index = 0
+        else:
+            index = min(int(math.log(value / _BUCKET_FLOOR) / _LOG_GROWTH) + 1, _NUM_BUCKETS - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the q-th percentile (0 <= q <= 100)."""
+        if not self.count:
+            return math.nan
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                upper = _BUCKET_FLOOR * math.exp(index * _LOG_GROWTH)
+                return min(max(upper, self.minimum), self.maximum)
+        return self.maximum
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def summary(self) -> Dict[str, float]:
+        """Return the count, mean, extrema and p50/p90/p99 of the recorded values."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.minimum if self.count else math.nan,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.maximum if self.count else math.nan,
+        }
+
+
+class InstrumentationRegistry:
+    """In-process registry of per-stage wall times (seconds) and per-stage counts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages: Dict[str, Histogram] = {}
+        self.counts: Dict[str, Histogram] = {}
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Record the wall time of one execution of a stage."""
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = Histogram()
+            histogram.record(seconds)
+
+    def record_count(self, name: str, value: float) -> None:
+        """Record a count, such as the number of obstacles entering a stage."""
+        with self._lock:
+            histogram = self.counts.get(name)
+            if histogram is None:
+                histogram = self.counts[name] = Histogram()
+            histogram.record(value)
+
+    def reset(self) -> None:
+        """Discard every recorded value."""
+        with self._lock:
+            self.stages.clear()
+            self.counts.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return the summaries of every stage (times in milliseconds) and count."""
+        with self._lock:
+            stages = {name: histogram.summary() for name, histogram in self.stages.items()}
+            counts = {name: histogram.summary() for name, histogram in self.counts.items()}
+        for summary in stages.values():
+            for key in ('mean', 'min', 'p50', 'p90', 'p99', 'max'):
+                summary[key] *= 1e3
+        return {'stages_ms': stages, 'counts': counts}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Dump the snapshot as JSON."""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_text(self) -> str:
+        """Dump the snapshot as a fixed-width text table."""
+        snapshot = self.snapshot()
+        header = f"{'':<22}{'count':>8}{'mean':>12}{'p50':>12}{'p90':>12}{'p99':>12}{'max':>12}"
+        lines = ['Stage wall time (ms)', header]
+        for title, section in (('stages_ms', None), ('counts', 'Counts')):
+            if section:
+                lines.extend(['', section, header])
+            for name, summary in snapshot[title].items():
+                lines.append(
+                    f"{name:<22}{summary['count']:>8}"
+                    + ''.join(f"{summary[key]:>12.3f}" for key in ('mean', 'p50', 'p90', 'p99', 'max'))
+                )
+        return '\n'.join(lines)
+
+
+_registry = InstrumentationRegistry()
+
+
+class _NullTimer:
+    """Context manager that does nothing, returned by stage_timer while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def enable_instrumentation() -> None:
+    """Start recording stage timings and counts into the registry."""
+    global _enabled
+    _enabled = True
+
+
+def disable_instrumentation() -> None:
+    """Stop recording; already recorded values are kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_instrumentation_enabled() -> bool:
+    return _enabled
+
+
+def get_registry() -> InstrumentationRegistry:
+    """Return the process-wide instrumentation registry."""
+    return _registry
+
+
+@contextmanager
+def _timed_stage(stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _registry.record_stage(stage, time.perf_counter() - start)
+
+
+def stage_timer(stage: str):
+    """
+    Time the enclosed block as one execution of `stage`.
+
+    While instrumentation is disabled this returns a shared no-op context manager, so an
+    instrumented block costs one function call and a flag check.
+    """
+    if not _enabled:
+        return _NULL_TIMER
+    return _timed_stage(stage)
+
+
+def record_count(name: str, value: float) -> None:
+    """Record a count for `name` if instrumentation is enabled."""
+    if _enabled:
+        _registry.record_count(name, value)
@@ -1,7 +1,12 @@
 from .objects import (
     Agent,
+    FrozenAgent,
     DynamicObstacle,
+    FrozenDynamicObstacle,
     DynamicObstacleWithMetrics
 )
+from .obstacle_batch import ObstacleBatch
 
-__all__ = ['Agent', 'DynamicObstacle', 'DynamicObstacleWithMetrics']
\ No newline at end of file
+__all__ = [
+    'Agent', 'FrozenAgent', 'DynamicObstacle', 'FrozenDynamicObstacle', 'DynamicObstacleWithMetrics', 'ObstacleBatch'
+]
\ No newline at end of file
@@ -1,18 +1,58 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Tuple
 
+# The object model declares __slots__ by hand (dataclass(slots=True) needs Python 3.10), so
+# instances carry no per-instance __dict__ and cannot grow unexpected attributes.
+
+
+def _frozen_getstate(self):
+    return tuple(getattr(self, field.name) for field in fields(self))
+
+
+def _frozen_setstate(self, state):
+    # Pickle restores slot state with setattr, which frozen dataclasses refuse.
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
 @dataclass
 class Agent:
     """Represents an agent with position, orientation, velocity, yaw rate, and safety radius."""
+    __slots__ = ('position', 'orientation', 'velocity', 'yaw_rate', 'safety_radius')
     position: Tuple[float, float, float]         # Cartesian position (x, y, z)
     orientation: Tuple[float, float, float, float]  # Quaternion orientation (x, y, z, w)
     velocity: float                                # Velocity in m/s
     yaw_rate: float                                # Yaw rate in rad/s
     safety_radius: float                           # Safety radius in meters
 
+@dataclass(frozen=True)
+class FrozenAgent:
+    """Immutable, hashable variant of Agent, accepted wherever an Agent is."""
+    __slots__ = ('position', 'orientation', 'velocity', 'yaw_rate', 'safety_radius')
+    position: Tuple[float, float, float]         # Cartesian position (x, y, z)
+    orientation: Tuple[float, float, float, float]  # Quaternion orientation (x, y, z, w)
+    velocity: float                                # Velocity in m/s
+    yaw_rate: float                                # Yaw rate in rad/s
+    safety_radius: float                           # Safety radius in meters
+
+    __getstate__ = _frozen_getstate
+    __setstate__ = _frozen_setstate
+
 @dataclass
 class DynamicObstacle:
     """Represents a dynamic obstacle with its kinematic properties and safety radius."""
+    __slots__ = ('tag', 'position', 'orientation', 'velocity', 'yaw_rate', 'safety_radius')
+    tag: str
+    position: Tuple[float, float, float]          # Cartesian position (x, y, z)
+    orientation: Tuple[float, float, float, float]  # Quaternion orientation (x, y, z, w)
+    velocity: float                               # Velocity in m/s
+    yaw_rate: float                               # Yaw rate in rad/s
+    safety_radius: float                          # Safety radius in meters
+
+@dataclass(frozen=True)
+class FrozenDynamicObstacle:
+    """Immutable, hashable variant of DynamicObstacle, accepted wherever a DynamicObstacle is."""
+    __slots__ = ('tag', 'position', 'orientation', 'velocity', 'yaw_rate', 'safety_radius')
     tag: str
     position: Tuple[float, float, float]          # Cartesian position (x, y, z)
     orientation: Tuple[float, float, float, float]  # Quaternion orientation (x, y, z, w)
@@ -20,9 +60,13 @@ class DynamicObstacle:
     yaw_rate: float                               # Yaw rate in rad/s
     safety_radius: float                          # Safety radius in meters
 
+    __getstate__ = _frozen_getstate
+    __setstate__ = _frozen_setstate
+
 @dataclass
 class DynamicObstacleWithMetrics:
     """Associates a dynamic obstacle with additional metrics like TCPA and DCPA."""
+    __slots__ = ('dynamic_obstacle', 'tcpa', 'dcpa')
     dynamic_obstacle: DynamicObstacle
     tcpa: float                                   # Time to Closest Point of Approach
     dcpa: float                                   # Distance at Closest Point of Approach
@@ -0,0 +1,187 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from .objects import DynamicObstacle
+
+
+def quaternions_to_headings(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 4) array of (x, y, z, w) quaternions to heading angles in radians.
+
+    Vectorised counterpart of risk_assessment.quaternion_to_heading, using the same
+    normalisation and yaw formula so the two agree element-wise.
+    """
+    q = np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)
+    qx, qy, qz, qw = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    norm = np.sqrt(qx * qx + qy * qy + qz * qz + qw * qw)
+    qx, qy, qz, qw = qx / norm, qy / norm, qz / norm, qw / norm
+    siny_cosp = 2.0 * (qw * qz + qx * qy)
+    cosy_cosp = 1.0 - 2.0 * (qy * qy + qz * qz)
+    return np.arctan2(siny_cosp, cosy_cosp)
+
+
+def _as_float_array(values) -> np.ndarray:
+    """Return values as a contiguous 1-D float64 array, without copying if it already is one."""
+    array = np.ascontiguousarray(values, dtype=np.float64)
+    return array if array.ndim == 1 else array.reshape(-1)
+
+
+@dataclass
+class ObstacleBatch:
+    """
+    Struct-of-arrays representation of a set of dynamic obstacles.
+
+    Every per-obstacle attribute is held in its own contiguous float64 array so that
+    the unsafe set stages can operate on whole obstacle sets at once. Row i of every
+    array describes the same obstacle.
+
+    z is None when all positions are planar (x, y); orientation is None when the batch
+    was built from headings alone, in which case a yaw-only quaternion is synthesised
+    on conversion back to DynamicObstacle.
+    """
+    x: np.ndarray                                 # x positions in meters
+    y: np.ndarray                                 # y positions in meters
+    heading: np.ndarray                           # Heading in radians
+    speed: np.ndarray                             # Velocity in m/s
+    yaw_rate: np.ndarray                          # Yaw rate in rad/s
+    safety_radius: np.ndarray                     # Safety radius in meters
+    tag: np.ndarray                               # Obstacle tags (object array)
+    z: Optional[np.ndarray] = None                # z positions in meters, None if planar
+    orientation: Optional[np.ndarray] = None      # (N, 4) quaternions (x, y, z, w)
+
+    def __post_init__(self):
+        self.x = _as_float_array(self.x)
+        self.y = _as_float_array(self.y)
+        self.heading = _as_float_array(self.heading)
+        self.speed = _as_float_array(self.speed)
+        self.yaw_rate = _as_float_array(self.yaw_rate)
+        self.safety_radius = _as_float_array(self.safety_radius)
+        if not isinstance(self.tag, np.ndarray) or self.tag.dtype != object:
+            tags = np.empty(len(self.tag), dtype=object)
+            tags[:] = list(self.tag)
+            self.tag = tags
+        if self.z is not None:
+            self.z = _as_float_array(self.z)
+        if self.orientation is not None:
+            self.orientation = np.ascontiguousarray(self.orientation, dtype=np.float64).reshape(-1, 4)
+
+        n = self.x.shape[0]
+        columns = [self.y, self.heading, self.speed, self.yaw_rate, self.safety_radius, self.tag]
+        if self.z is not None:
+            columns.append(self.z)
+        if self.orientation is not None:
+            columns.append(self.orientation)
+        if any(column.shape[0] != n for column in columns):
+            raise ValueError("All ObstacleBatch arrays must have the same length")
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Return the obstacle positions as an (N, 2) array, or (N, 3) if z is present."""
+        if self.z is None:
+            return np.column_stack((self.x, self.y))
+        return np.column_stack((self.x, self.y, self.z))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        x: np.ndarray,
+        y: np.ndarray,
+        heading: np.ndarray,
+        speed: np.ndarray,
+        yaw_rate: np.ndarray,
+        safety_radius: np.ndarray,
+        tag: Sequence[str],
+        z: Optional[np.ndarray] = None,
+        orientation: Optional[np.ndarray] = None,
+    ) -> "ObstacleBatch":
+        """
+        Build a batch from per-attribute arrays.
+
+        Contiguous float64 inputs are used as-is (no copy), so the batch shares memory
+        with the caller's arrays.
+        """
+        return cls(
+            x=x, y=y, heading=heading, speed=speed, yaw_rate=yaw_rate,
+            safety_radius=safety_radius, tag=tag, z=z, orientation=orientation
+        )
+
+    @classmethod
+    def from_obstacles(cls, dynamic_obstacles: List[DynamicObstacle]) -> "ObstacleBatch":
+        """Build a batch from a list of DynamicObstacle objects."""
+        n = len(dynamic_obstacles)
+        x = np.empty(n, dtype=np.float64)
+        y = np.empty(n, dtype=np.float64)
+        z = np.zeros(n, dtype=np.float64)
+        orientation = np.empty((n, 4), dtype=np.float64)
+        speed = np.empty(n, dtype=np.float64)
+        yaw_rate = np.empty(n, dtype=np.float64)
+        safety_radius = np.empty(n, dtype=np.float64)
+        tag = np.empty(n, dtype=object)
+        planar = True
+        for i, dynamic_obstacle in enumerate(dynamic_obstacles):
+            position = dynamic_obstacle.position
+            x[i], y[i] = position[0], position[1]
+            if len(position) > 2:
+                z[i] = position[2]
+                planar = False
+            orientation[i] = dynamic_obstacle.orientation
+            speed[i] = dynamic_obstacle.velocity
+            yaw_rate[i] = dynamic_obstacle.yaw_rate
+            safety_radius[i] = dynamic_obstacle.safety_radius
+            tag[i] = dynamic_obstacle.tag
+
+        return cls(
+            x=x,
+            y=y,
+            heading=quaternions_to_headings(orientation),
+            speed=speed,
+            yaw_rate=yaw_rate,
+            safety_radius=safety_radius,
+            tag=tag,
+            z=None if planar else z,
+            orientation=orientation,
+        )
+
+    def to_obstacles(self) -> List[DynamicObstacle]:
+        """Convert the batch back to a list of DynamicObstacle objects."""
+        if self.orientation is not None:
+            orientation = self.orientation
+        else:
+            orientation = np.zeros((len(self), 4), dtype=np.float64)
+            orientation[:, 2] = np.sin(self.heading / 2.0)
+            orientation[:, 3] = np.cos(self.heading / 2.0)
+
+        x, y = self.x.tolist(), self.y.tolist()
+        z = self.z.tolist() if self.z is not None else None
+        orientation = orientation.tolist()
+        speed, yaw_rate = self.speed.tolist(), self.yaw_rate.tolist()
+        safety_radius = self.safety_radius.tolist()
+
+        return [
+            DynamicObstacle(
+                tag=self.tag[i],
+                position=(x[i], y[i]) if z is None else (x[i], y[i], z[i]),
+                orientation=tuple(orientation[i]),
+                velocity=speed[i],
+                yaw_rate=yaw_rate[i],
+                safety_radius=safety_radius[i],
+            )
+            for i in range(len(self))
+        ]
+
+    def subset(self, index) -> "ObstacleBatch":
+        """Return a new batch holding the rows selected by a boolean mask or index array."""
+        return ObstacleBatch(
+            x=self.x[index],
+            y=self.y[index],
+            heading=self.heading[index],
+            speed=self.speed[index],
+            yaw_rate=self.yaw_rate[index],
+            safety_radius=self.safety_radius[index],
+            tag=self.tag[index],
+            z=self.z[index] if self.z is not None else None,
+            orientation=self.orientation[index] if self.orientation is not None else None,
+        )
@@ -1,5 +1,7 @@
-from .position_prediction import predict_position
+from .position_prediction import predict_position, predict_positions, predict_trajectories
 
 __all__ = [
-    'predict_position'
+    'predict_position',
+    'predict_positions',
+    'predict_trajectories'
 ]
\ No newline at end of file
@@ -1,6 +1,23 @@
 import numpy as np
-from scipy.spatial.transform import Rotation as R
-from typing import Tuple
+from typing import Tuple, Union
+from colav_unsafe_set.objects import ObstacleBatch
+
+def quaternions_to_yaws(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Extract yaw from (x, y, z, w) quaternions in closed form.
+
+    Equivalent to the first angle of scipy's Rotation.as_euler('zyx') away from gimbal lock.
+    The expression is invariant to the quaternion's scale, so no normalisation is needed.
+
+    Args:
+        quaternions: np.ndarray - Quaternions of shape (4,) or (N, 4)
+
+    Returns:
+        np.ndarray: Yaw angles in radians, of shape () or (N,)
+    """
+    q = np.asarray(quaternions, dtype=np.float64)
+    qx, qy, qz, qw = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.arctan2(2.0 * (qw * qz - qx * qy), qw * qw + qx * qx - qy * qy - qz * qz)
 
 def predict_position(
     position: Tuple[float, ...], 
@@ -31,23 +48,89 @@ def predict_position(
     if np.isnan(dt) or dt <= 0:
         raise ValueError("Time step (dt) must be a positive number")
     
-    # Normalize the quaternion if it's not normalized
-    norm = np.linalg.norm(quaternion_orientation)
-    if norm != 1.0:
-        quaternion_orientation = tuple(np.array(quaternion_orientation) / norm)
-    
-    # Convert quaternion to Euler angles (yaw, pitch, roll)
-    r = R.from_quat(quaternion_orientation)
-    yaw, _, _ = r.as_euler('zyx', degrees=False)  # yaw is the first Euler angle
-    
-    # Update yaw based on yaw_rate and dt
-    yaw_new = yaw + yaw_rate * dt
+    # Extract yaw from the quaternion
+    yaw = quaternions_to_yaws(quaternion_orientation)
     
     # Compute displacement in the XY plane
-    dx = velocity * np.cos(yaw_new) * dt
-    dy = velocity * np.sin(yaw_new) * dt
+    dx, dy = _displacement(yaw, velocity, yaw_rate, dt)
     
     # Update position (assuming no change in z for 2D)
     new_position = pos_array + np.array([dx, dy, 0.0])
     
     return new_position
+
+def predict_positions(
+    obstacles: ObstacleBatch,
+    dt: Union[float, np.ndarray],
+) -> np.ndarray:
+    """
+    Predicts the future positions of every obstacle in a batch in one vectorised pass.
+
+    Uses the batch quaternions when present and its heading array otherwise. Semantics
+    match predict_position applied row by row.
+
+    Args:
+        obstacles: ObstacleBatch - The obstacles to predict
+        dt: Union[float, np.ndarray] - Time step for prediction, scalar or one per obstacle
+
+    Returns:
+        np.ndarray: Predicted positions as an (N, 3) array of [x_new, y_new, z_new]
+    """
+    dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), (len(obstacles),))
+    if np.any(np.isnan(dt) | (dt <= 0)):
+        raise ValueError("Time step (dt) must be a positive number")
+
+    if obstacles.orientation is not None:
+        yaw = quaternions_to_yaws(obstacles.orientation)
+    else:
+        yaw = obstacles.heading
+
+    dx, dy = _displacement(yaw, obstacles.speed, obstacles.yaw_rate, dt)
+
+    new_positions = np.empty((len(obstacles), 3), dtype=np.float64)
+    new_positions[:, 0] = obstacles.x + dx
+    new_positions[:, 1] = obstacles.y + dy
+    new_positions[:, 2] = obstacles.z if obstacles.z is not None else 0.0
+    return new_positions
+
+def predict_trajectories(
+    obstacles: ObstacleBatch,
+    times: np.ndarray,
+) -> np.ndarray:
+    """
+    Predicts every obstacle in a batch at several times in one vectorised pass.
+
+    Equivalent to calling predict_positions once per column of times, without the per-step
+    overhead, e.g. to sample turning trajectories.
+
+    Args:
+        obstacles: ObstacleBatch - The obstacles to predict
+        times: np.ndarray - (N, K) prediction times per obstacle, or (K,) shared by all obstacles
+
+    Returns:
+        np.ndarray: Predicted positions as an (N, K, 3) array of [x_new, y_new, z_new]
+    """
+    times = np.asarray(times, dtype=np.float64)
+    times = np.broadcast_to(times if times.ndim == 2 else times.reshape(1, -1), (len(obstacles), times.shape[-1]))
+    if np.any(np.isnan(times) | (times <= 0)):
+        raise ValueError("Time step (dt) must be a positive number")
+
+    if obstacles.orientation is not None:
+        yaw = quaternions_to_yaws(obstacles.orientation)
+    else:
+        yaw = obstacles.heading
+
+    dx, dy = _displacement(
+        yaw[:, None], obstacles.speed[:, None], obstacles.yaw_rate[:, None], times
+    )
+
+    new_positions = np.empty(times.shape + (3,), dtype=np.float64)
+    new_positions[..., 0] = obstacles.x[:, None] + dx
+    new_positions[..., 1] = obstacles.y[:, None] + dy
+    new_positions[..., 2] = obstacles.z[:, None] if obstacles.z is not None else 0.0
+    return new_positions
+
+def _displacement(yaw, velocity, yaw_rate, dt):
+    """Broadcasting XY displacement after dt, heading along the yaw updated by yaw_rate * dt."""
+    yaw_new = yaw + yaw_rate * dt
+    return velocity * np.cos(yaw_new) * dt, velocity * np.sin(yaw_new) * dt
@@ -1,4 +1,4 @@
-from .risk_assessment import calc_cpa
+from .risk_assessment import calc_cpa, calc_cpa_batch, calc_cpa_matrix, calc_cpa_turning_batch
 from .obstacle_metric_calculator import calculate_obstacle_metrics_for_agent
 
-__all__ = ['calc_cpa', 'calculate_obstacle_metrics_for_agent']
\ No newline at end of file
+__all__ = ['calc_cpa', 'calc_cpa_batch', 'calc_cpa_matrix', 'calc_cpa_turning_batch', 'calculate_obstacle_metrics_for_agent']
\ No newline at end of file
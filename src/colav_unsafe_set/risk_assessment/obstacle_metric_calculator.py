@@ -3,18 +3,54 @@ from colav_unsafe_set.objects import (
     DynamicObstacle,
     DynamicObstacleWithMetrics
 )
-from .risk_assessment import calc_cpa
-from typing import List
+from .risk_assessment import calc_cpa_batch, calc_cpa_turning_batch, TURNING_CPA_HORIZON
+from typing import List, Optional
 
 
-def calculate_obstacle_metrics_for_agent(agent_vessel: Agent, dynamic_obstacles: List[DynamicObstacle]) -> List[DynamicObstacleWithMetrics]:
-    """Iterates through DynamicObstacles calculating DCPA and TCPA relative to agent configuration"""
-    dynamic_obstacles_with_metrics = []
-    for dynamic_obstacle in dynamic_obstacles:
-        [dcpa, tcpa] = calc_cpa(agent_vessel, dynamic_obstacle)
-        dynamic_obstacles_with_metrics.append(
+def calculate_obstacle_metrics_for_agent(
+    agent_vessel: Agent,
+    dynamic_obstacles: List[DynamicObstacle],
+    turning_cpa: bool = False,
+    turning_horizon: float = TURNING_CPA_HORIZON,
+    out: Optional[List[DynamicObstacleWithMetrics]] = None,
+) -> List[DynamicObstacleWithMetrics]:
+    """
+    Calculates DCPA and TCPA for every DynamicObstacle relative to agent configuration.
+
+    With turning_cpa set, the CPA accounts for both vessels' yaw rates (see calc_cpa_turning_batch),
+    searched up to turning_horizon seconds ahead.
+
+    With out given, the wrappers already in that list are updated in place rather than
+    reallocated: the list is grown or truncated to one wrapper per obstacle and returned.
+    Wrappers taken from a previous call therefore change under the caller.
+    """
+    if turning_cpa:
+        dcpa, tcpa = calc_cpa_turning_batch(agent_vessel, dynamic_obstacles, horizon=turning_horizon)
+    else:
+        dcpa, tcpa = calc_cpa_batch(agent_vessel, dynamic_obstacles)
+    if out is not None:
+        reused = min(len(out), len(dynamic_obstacles))
+        del out[len(dynamic_obstacles):]
+        for metrics, dynamic_obstacle, obstacle_dcpa, obstacle_tcpa in zip(
+            out, dynamic_obstacles, dcpa.tolist(), tcpa.tolist()
+        ):
+            metrics.dynamic_obstacle = dynamic_obstacle
+            metrics.dcpa = obstacle_dcpa
+            metrics.tcpa = obstacle_tcpa
+        out.extend(
             DynamicObstacleWithMetrics(
-                dynamic_obstacle=dynamic_obstacle, dcpa=dcpa, tcpa=tcpa
+                dynamic_obstacle=dynamic_obstacle, dcpa=obstacle_dcpa, tcpa=obstacle_tcpa
+            )
+            for dynamic_obstacle, obstacle_dcpa, obstacle_tcpa in zip(
+                dynamic_obstacles[reused:], dcpa[reused:].tolist(), tcpa[reused:].tolist()
             )
         )
-    return dynamic_obstacles_with_metrics
+        return out
+    return [
+        DynamicObstacleWithMetrics(
+            dynamic_obstacle=dynamic_obstacle, dcpa=obstacle_dcpa, tcpa=obstacle_tcpa
+        )
+        for dynamic_obstacle, obstacle_dcpa, obstacle_tcpa in zip(
+            dynamic_obstacles, dcpa.tolist(), tcpa.tolist()
+        )
+    ]
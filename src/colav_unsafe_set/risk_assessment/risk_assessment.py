@@ -1,7 +1,8 @@
 import numpy as np
 import math
-from typing import Tuple
-from colav_unsafe_set.objects import Agent, DynamicObstacle
+from typing import List, Optional, Tuple, Union
+from colav_unsafe_set.objects import Agent, DynamicObstacle, ObstacleBatch
+from colav_unsafe_set.position_prediction.position_prediction import _displacement, quaternions_to_yaws
 
 def quaternion_to_heading(qx, qy, qz, qw) -> float:
     """Convert quaternion to heading angle in radians."""
@@ -47,10 +48,242 @@ def calc_cpa(agent_object: Agent, target_object: DynamicObstacle) -> Tuple[float
     else:
         tcpa = -np.dot(p_rel, v_rel) / v_rel_norm_sq
         if tcpa > 0:
-            cpa_vector = p_rel + tcpa * (-v_rel)
+            cpa_vector = p_rel + tcpa * v_rel
             dcpa = np.linalg.norm(cpa_vector)
         else:
             dcpa = float('nan')
             tcpa = float('nan')
 
     return dcpa, tcpa
+
+
+def calc_cpa_batch(
+    agent_object: Agent,
+    target_objects: Union[ObstacleBatch, List[DynamicObstacle]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate DCPA and TCPA between the agent and every target in one vectorised pass.
+
+    Element-wise equivalent to calc_cpa, including its edge cases (identical position,
+    stationary offset, future CPA and CPA in the past).
+
+    Args:
+        agent_object (Agent): The agent vessel.
+        target_objects (Union[ObstacleBatch, List[DynamicObstacle]]): The targets.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The DCPA and TCPA arrays, one entry per target.
+    """
+    if not isinstance(target_objects, ObstacleBatch):
+        target_objects = ObstacleBatch.from_obstacles(target_objects)
+
+    theta1 = normalize_angle(quaternion_to_heading(*agent_object.orientation))
+    v1x = agent_object.velocity * np.cos(theta1)
+    v1y = agent_object.velocity * np.sin(theta1)
+    v2x = target_objects.speed * np.cos(target_objects.heading)
+    v2y = target_objects.speed * np.sin(target_objects.heading)
+
+    return _cpa_kernel(
+        p_rel_x=agent_object.position[0] - target_objects.x,
+        p_rel_y=agent_object.position[1] - target_objects.y,
+        v1x=v1x,
+        v1y=v1y,
+        v_rel_x=v1x - v2x,
+        v_rel_y=v1y - v2y,
+    )
+
+
+def calc_cpa_matrix(
+    agent_objects: List[Agent],
+    target_objects: Union[ObstacleBatch, List[DynamicObstacle]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate DCPA and TCPA between every agent and every target in one vectorised pass.
+
+    Args:
+        agent_objects (List[Agent]): The agent vessels.
+        target_objects (Union[ObstacleBatch, List[DynamicObstacle]]): The targets.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (agents x targets) DCPA and TCPA arrays.
+    """
+    if not isinstance(target_objects, ObstacleBatch):
+        target_objects = ObstacleBatch.from_obstacles(target_objects)
+
+    theta1 = np.array(
+        [normalize_angle(quaternion_to_heading(*agent.orientation)) for agent in agent_objects], dtype=np.float64
+    )[:, None]
+    velocity1 = np.array([agent.velocity for agent in agent_objects], dtype=np.float64)[:, None]
+    v1x = velocity1 * np.cos(theta1)
+    v1y = velocity1 * np.sin(theta1)
+    v2x = target_objects.speed * np.cos(target_objects.heading)
+    v2y = target_objects.speed * np.sin(target_objects.heading)
+    p1x = np.array([agent.position[0] for agent in agent_objects], dtype=np.float64)[:, None]
+    p1y = np.array([agent.position[1] for agent in agent_objects], dtype=np.float64)[:, None]
+
+    return _cpa_kernel(
+        p_rel_x=p1x - target_objects.x,
+        p_rel_y=p1y - target_objects.y,
+        v1x=v1x,
+        v1y=v1y,
+        v_rel_x=v1x - v2x,
+        v_rel_y=v1y - v2y,
+    )
+
+
+# Default CPA search horizon of calc_cpa_turning_batch in seconds
+TURNING_CPA_HORIZON = 60.0
+# Default time grid spacing of calc_cpa_turning_batch in seconds (64 intervals over the default horizon)
+_TURNING_GRID_SPACING = TURNING_CPA_HORIZON / 64
+
+
+def calc_cpa_turning_batch(
+    agent_object: Agent,
+    target_objects: Union[ObstacleBatch, List[DynamicObstacle]],
+    horizon: float = TURNING_CPA_HORIZON,
+    steps: Optional[int] = None,
+    refine_iterations: int = 30,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate DCPA and TCPA between the agent and every target under constant turn rate motion.
+
+    Both vessels move as predict_position models them, so the disc predicted at TCPA sits at
+    the closest point of approach. The squared relative distance is evaluated on a grid of
+    steps + 1 times over [0, horizon] for all targets at once, and each target's grid minimum
+    is refined by a vectorised golden-section search over its neighbouring grid interval.
+    The grid spacing must resolve the relative motion for the global minimum to be found.
+
+    Pairs where neither vessel turns use the closed-form straight-line CPA instead, with the
+    same edge cases as calc_cpa_batch. Headings follow predict_position's yaw convention, which
+    agrees with calc_cpa's for yaw-only orientations. As with calc_cpa, a CPA in the past (the
+    vessels separating at t = 0 with no closer approach within the horizon) gives NaN; a CPA
+    beyond the horizon is reported at the horizon.
+
+    Args:
+        agent_object (Agent): The agent vessel.
+        target_objects (Union[ObstacleBatch, List[DynamicObstacle]]): The targets.
+        horizon (float): Latest time searched for the CPA of turning pairs, in seconds.
+        steps (Optional[int]): Number of grid intervals over the horizon. If None, the horizon is
+                               split into intervals of at most 0.9375 s (64 over 60 s).
+        refine_iterations (int): Golden-section iterations refining each grid minimum.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The DCPA and TCPA arrays, one entry per target.
+    """
+    if not isinstance(target_objects, ObstacleBatch):
+        target_objects = ObstacleBatch.from_obstacles(target_objects)
+    if steps is None and horizon > 0:
+        steps = math.ceil(horizon / _TURNING_GRID_SPACING)
+    if not horizon > 0 or steps < 1:
+        raise ValueError("horizon must be positive and steps at least 1")
+
+    yaw1 = float(quaternions_to_yaws(agent_object.orientation))
+    v1, w1 = agent_object.velocity, agent_object.yaw_rate
+    if target_objects.orientation is not None:
+        yaw2 = quaternions_to_yaws(target_objects.orientation)
+    else:
+        yaw2 = target_objects.heading
+    v2, w2 = target_objects.speed, target_objects.yaw_rate
+    p_rel_x = agent_object.position[0] - target_objects.x
+    p_rel_y = agent_object.position[1] - target_objects.y
+
+    # Straight-line pairs in closed form.
+    v1x, v1y = v1 * math.cos(yaw1), v1 * math.sin(yaw1)
+    dcpa, tcpa = _cpa_kernel(
+        p_rel_x=p_rel_x,
+        p_rel_y=p_rel_y,
+        v1x=v1x,
+        v1y=v1y,
+        v_rel_x=v1x - v2 * np.cos(yaw2),
+        v_rel_y=v1y - v2 * np.sin(yaw2),
+    )
+    turning = np.flatnonzero((w1 != 0) | (w2 != 0))
+    if turning.size == 0:
+        return dcpa, tcpa
+
+    yaw2, v2, w2 = yaw2[turning, None], v2[turning, None], w2[turning, None]
+    p_rel_x, p_rel_y = p_rel_x[turning, None], p_rel_y[turning, None]
+
+    def squared_distance(t: np.ndarray) -> np.ndarray:
+        d1x, d1y = _displacement(yaw1, v1, w1, t)
+        d2x, d2y = _displacement(yaw2, v2, w2, t)
+        x, y = p_rel_x + d1x - d2x, p_rel_y + d1y - d2y
+        return x * x + y * y
+
+    # Coarse search over the time grid.
+    grid = np.linspace(0.0, horizon, steps + 1)
+    nearest = np.argmin(squared_distance(grid[None, :]), axis=1)
+
+    # Golden-section refinement within the neighbouring grid intervals.
+    ratio = (math.sqrt(5.0) - 1.0) / 2.0
+    lower = grid[np.maximum(nearest - 1, 0)][:, None]
+    upper = grid[np.minimum(nearest + 1, steps)][:, None]
+    inner_lower = upper - ratio * (upper - lower)
+    inner_upper = lower + ratio * (upper - lower)
+    f_lower, f_upper = squared_distance(inner_lower), squared_distance(inner_upper)
+    for _ in range(refine_iterations):
+        # Keep the side of the smaller inner point; its inner point is reused, one new point is probed.
+        left = f_lower < f_upper
+        upper = np.where(left, inner_upper, upper)
+        lower = np.where(left, lower, inner_lower)
+        kept, f_kept = np.where(left, inner_lower, inner_upper), np.where(left, f_lower, f_upper)
+        probe = np.where(left, upper - ratio * (upper - lower), lower + ratio * (upper - lower))
+        f_probe = squared_distance(probe)
+        inner_lower, f_lower = np.where(left, probe, kept), np.where(left, f_probe, f_kept)
+        inner_upper, f_upper = np.where(left, kept, probe), np.where(left, f_kept, f_probe)
+    turning_tcpa = 0.5 * (lower + upper)
+    turning_dcpa = np.sqrt(squared_distance(turning_tcpa))
+    turning_tcpa, turning_dcpa = turning_tcpa[:, 0], turning_dcpa[:, 0]
+
+    # Separating at t = 0 with the grid minimum there: the CPA lies in the past.
+    v_rel_x = v1x - v2[:, 0] * np.cos(yaw2[:, 0])
+    v_rel_y = v1y - v2[:, 0] * np.sin(yaw2[:, 0])
+    separating = p_rel_x[:, 0] * v_rel_x + p_rel_y[:, 0] * v_rel_y >= 0
+    past = (nearest == 0) & separating
+
+    dcpa[turning] = np.where(past, np.nan, turning_dcpa)
+    tcpa[turning] = np.where(past, np.nan, turning_tcpa)
+    return dcpa, tcpa
+
+
+def _cpa_kernel(
+    p_rel_x: np.ndarray,
+    p_rel_y: np.ndarray,
+    v1x: np.ndarray,
+    v1y: np.ndarray,
+    v_rel_x: np.ndarray,
+    v_rel_y: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Broadcasting DCPA/TCPA kernel over relative positions and velocities (agent minus target)."""
+    p_rel_x, p_rel_y, v1x, v1y, v_rel_x, v_rel_y = np.broadcast_arrays(
+        p_rel_x, p_rel_y, v1x, v1y, v_rel_x, v_rel_y
+    )
+    v_rel_norm_sq = v_rel_x * v_rel_x + v_rel_y * v_rel_y
+    stationary = v_rel_norm_sq < 1e-6
+    # Matches np.allclose(p_rel, [0, 0]) with its default absolute tolerance.
+    identical = stationary & (np.abs(p_rel_x) <= 1e-8) & (np.abs(p_rel_y) <= 1e-8)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Case 1: no relative motion.
+        distance = np.sqrt(p_rel_x * p_rel_x + p_rel_y * p_rel_y)
+        speed = np.sqrt(v1x * v1x + v1y * v1y)
+        stationary_tcpa = np.where(speed > 0, distance / speed, np.inf)
+
+        # Case 2: relative motion, CPA in the future or in the past.
+        moving_tcpa = -(p_rel_x * v_rel_x + p_rel_y * v_rel_y) / v_rel_norm_sq
+        cpa_x = p_rel_x + moving_tcpa * v_rel_x
+        cpa_y = p_rel_y + moving_tcpa * v_rel_y
+        moving_dcpa = np.sqrt(cpa_x * cpa_x + cpa_y * cpa_y)
+    future = moving_tcpa > 0
+
+    dcpa = np.where(
+        stationary,
+        np.where(identical, np.nan, distance),
+        np.where(future, moving_dcpa, np.nan),
+    )
+    tcpa = np.where(
+        stationary,
+        np.where(identical, np.inf, stationary_tcpa),
+        np.where(future, moving_tcpa, np.nan),
+    )
+    return dcpa, tcpa
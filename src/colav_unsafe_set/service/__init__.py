@@ -0,0 +1,6 @@
+from .unsafe_set_server import UnsafeSetServer, run_server
+
+__all__ = [
+    'UnsafeSetServer',
+    'run_server'
+]
\ No newline at end of file
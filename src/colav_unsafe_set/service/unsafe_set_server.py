@@ -0,0 +1,298 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from colav_unsafe_set.objects import Agent, DynamicObstacle
+from colav_unsafe_set.unsafe_set.fleet_unsafe_sets import create_unsafe_sets
+
+_logger = logging.getLogger(__name__)
+
+# Requests that may be evaluated together: same obstacles, dsf, time of interest and hull mode
+GroupKey = Tuple[str, float, float, bool]
+# Error reply to requests that can no longer be evaluated
+_UNAVAILABLE = 'Unsafe set evaluation has stopped'
+
+
+@dataclass
+class _Request:
+    """A parsed unsafe set request."""
+    id: Any
+    agent: Agent
+    dynamic_obstacles: List[DynamicObstacle]
+    dsf: float
+    time_of_interest: float
+    exact_hull: bool
+    group_key: GroupKey
+
+
+@dataclass
+class _Connection:
+    """Per-connection state: the writer and at most one request waiting to be evaluated."""
+    writer: asyncio.StreamWriter
+    pending: Optional[_Request] = None
+    closed: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if self.closed:
+            return
+        async with self.lock:
+            try:
+                self.writer.write(json.dumps(message).encode() + b'\n')
+                await self.writer.drain()
+            except ConnectionError:
+                self.closed = True
+
+
+class UnsafeSetServer:
+    """
+    Asyncio unsafe set service speaking JSON lines over a Unix socket or localhost TCP.
+
+    Each request line is a JSON object:
+
+        {"id": 1, "agent": {...}, "dynamic_obstacles": [{...}, ...], "dsf": 10.0,
+         "time_of_interest": 15.0, "exact_hull": false}
+
+    where agent and the dynamic obstacles carry the fields of Agent and DynamicObstacle
+    (time_of_interest and exact_hull are optional). Each is answered with one line,
+    {"id": 1, "unsafe_set": [[x, y], ...]} or {"id": 1, "error": "..."}.
+
+    Requests arriving from all connections within batch_window seconds are evaluated together:
+    those sharing their obstacles, dsf, time of interest and hull mode go through a single
+    create_unsafe_sets call, off the event loop. Each connection holds at most one waiting request
+    (latest wins): a request still waiting when a newer one arrives on the same connection is
+    answered with {"id": ..., "superseded": true} and never evaluated.
+
+    If evaluating a batch fails outside create_unsafe_sets (e.g. the executor is shut down), the
+    failure is logged and the batch's requests are answered with an error. Should the batching
+    task itself stop, every waiting and later request is answered with an error rather than left
+    without a reply.
+    """
+
+    def __init__(
+        self,
+        batch_window: float = 0.002,
+        max_batch_size: int = 256,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            batch_window (float): Seconds to wait after the first waiting request before evaluating a batch.
+            max_batch_size (int): Largest number of requests evaluated in one batch.
+            executor (Optional[Executor]): Executor running the batches, defaults to the loop's default executor.
+        """
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+
+        self.batches_evaluated = 0                 # Number of batches evaluated so far
+        self.last_batch_size = 0                   # Requests in the last evaluated batch
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._ready: List[_Connection] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def start(self, path: Optional[str] = None, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+        """
+        Start listening on the Unix socket at path or, if path is None, on host:port over TCP.
+
+        Returns:
+            asyncio.AbstractServer: The listening server, e.g. to read the bound port from its sockets.
+        """
+        self._wakeup = asyncio.Event()
+        self._batcher = asyncio.ensure_future(self._run_batches())
+        self._batcher.add_done_callback(self._batcher_done)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host=host, port=port)
+        return self._server
+
+    async def close(self) -> None:
+        """Stop listening and stop evaluating batches."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass  # Already logged by _batcher_done
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read request lines from a connection, keeping only its latest waiting request."""
+        connection = _Connection(writer=writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = _parse_request(line)
+                except (ValueError, KeyError, TypeError) as error:
+                    await connection.send({'id': _request_id(line), 'error': f'Invalid request: {error}'})
+                    continue
+
+                superseded, connection.pending = connection.pending, request
+                if superseded is not None:
+                    await connection.send({'id': superseded.id, 'superseded': True})
+                elif self._batcher.done():
+                    connection.pending = None
+                    await connection.send({'id': request.id, 'error': _UNAVAILABLE})
+                else:
+                    self._ready.append(connection)
+                    self._wakeup.set()
+        except ConnectionError:
+            pass
+        finally:
+            connection.closed = True
+            connection.pending = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _run_batches(self) -> None:
+        """Evaluate waiting requests in batches, one batch at a time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.batch_window)
+            self._wakeup.clear()
+
+            connections = self._ready[:self.max_batch_size]
+            self._ready = self._ready[self.max_batch_size:]
+            if self._ready:
+                self._wakeup.set()
+            batch = [
+                (connection, connection.pending) for connection in connections
+                if connection.pending is not None and not connection.closed
+            ]
+            for connection, _ in batch:
+                connection.pending = None
+            if not batch:
+                continue
+
+            try:
+                replies = await loop.run_in_executor(
+                    self.executor, _evaluate_requests, [request for _, request in batch]
+                )
+            except Exception as error:
+                _logger.exception("Evaluating a batch of %d unsafe set requests failed", len(batch))
+                replies = [{'id': request.id, 'error': f'Evaluation failed: {error}'} for _, request in batch]
+            else:
+                self.batches_evaluated += 1
+                self.last_batch_size = len(batch)
+            await asyncio.gather(*(
+                connection.send(reply) for (connection, _), reply in zip(batch, replies)
+            ))
+
+    def _batcher_done(self, batcher: asyncio.Task) -> None:
+        """Log a batching task that stopped with an error and answer the requests it left waiting."""
+        if batcher.cancelled() or batcher.exception() is None:
+            return
+        _logger.error("Unsafe set batching stopped", exc_info=batcher.exception())
+        connections, self._ready = self._ready, []
+        for connection in connections:
+            request, connection.pending = connection.pending, None
+            if request is not None:
+                asyncio.ensure_future(connection.send({'id': request.id, 'error': _UNAVAILABLE}))
+
+
+def run_server(
+    path: Optional[str] = None,
+    host: str = '127.0.0.1',
+    port: int = 8765,
+    batch_window: float = 0.002,
+) -> None:
+    """Run an UnsafeSetServer until interrupted (see UnsafeSetServer.start for the address arguments)."""
+    async def serve() -> None:
+        server = UnsafeSetServer(batch_window=batch_window)
+        listener = await server.start(path=path, host=host, port=port)
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    asyncio.run(serve())
+
+
+def _evaluate_requests(requests: List[_Request]) -> List[Dict[str, Any]]:
+    """Evaluate a batch of requests, one create_unsafe_sets call per group of compatible requests."""
+    groups: Dict[GroupKey, List[int]] = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(request.group_key, []).append(index)
+
+    replies: List[Dict[str, Any]] = [{} for _ in requests]
+    for indices in groups.values():
+        first = requests[indices[0]]
+        try:
+            unsafe_sets = create_unsafe_sets(
+                agents=[requests[index].agent for index in indices],
+                dynamic_obstacles=first.dynamic_obstacles,
+                dsf=first.dsf,
+                time_of_interest=first.time_of_interest,
+                exact_hull=first.exact_hull,
+            )
+        except Exception as error:
+            for index in indices:
+                replies[index] = {'id': requests[index].id, 'error': str(error)}
+            continue
+        for index, unsafe_set in zip(indices, unsafe_sets):
+            replies[index] = {'id': requests[index].id, 'unsafe_set': unsafe_set}
+    return replies
+
+
+def _parse_request(line: bytes) -> _Request:
+    """Parse a JSON request line."""
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("request must be a JSON object")
+    agent = message['agent']
+    dynamic_obstacles = message['dynamic_obstacles']
+    dsf = float(message['dsf'])
+    time_of_interest = float(message.get('time_of_interest', 15))
+    exact_hull = bool(message.get('exact_hull', False))
+    return _Request(
+        id=message.get('id'),
+        agent=Agent(
+            position=tuple(agent['position']),
+            orientation=tuple(agent['orientation']),
+            velocity=float(agent['velocity']),
+            yaw_rate=float(agent['yaw_rate']),
+            safety_radius=float(agent['safety_radius']),
+        ),
+        dynamic_obstacles=[
+            DynamicObstacle(
+                tag=dynamic_obstacle['tag'],
+                position=tuple(dynamic_obstacle['position']),
+                orientation=tuple(dynamic_obstacle['orientation']),
+                velocity=float(dynamic_obstacle['velocity']),
+                yaw_rate=float(dynamic_obstacle['yaw_rate']),
+                safety_radius=float(dynamic_obstacle['safety_radius']),
+            )
+            for dynamic_obstacle in dynamic_obstacles
+        ],
+        dsf=dsf,
+        time_of_interest=time_of_interest,
+        exact_hull=exact_hull,
+        group_key=(json.dumps(dynamic_obstacles, sort_keys=True), dsf, time_of_interest, exact_hull),
+    )
+
+
+def _request_id(line: bytes) -> Any:
+    """Best-effort id of a request line that failed to parse."""
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message.get('id') if isinstance(message, dict) else None
@@ -1,5 +1,20 @@
 from .unsafe_set import create_unsafe_set
+from .unsafe_set_result import UnsafeSet, UnsafeSetQuality
+from .occupancy_grid import OccupancyGrid
+from .unsafe_set_tracker import UnsafeSetTracker
+from .fleet_unsafe_sets import create_unsafe_sets
+from .batch_evaluation import evaluate_many
+from .multi_horizon_unsafe_sets import create_multi_horizon_unsafe_sets
+from .clustered_unsafe_sets import create_clustered_unsafe_sets
 
 __all__ = [
-    'create_unsafe_set'
+    'create_unsafe_set',
+    'create_unsafe_sets',
+    'evaluate_many',
+    'create_multi_horizon_unsafe_sets',
+    'create_clustered_unsafe_sets',
+    'UnsafeSetTracker',
+    'UnsafeSet',
+    'UnsafeSetQuality',
+    'OccupancyGrid'
 ]
\ No newline at end of file
@@ -0,0 +1,50 @@
+import math
+import os
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
+from colav_unsafe_set.objects import Agent, DynamicObstacle
+from .unsafe_set import create_unsafe_set
+
+Frame = Tuple[Agent, List[DynamicObstacle], float]
+
+def evaluate_many(
+    frames: Iterable[Frame],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    exact_hull: bool = False,
+) -> List[List[List[float]]]:
+    """
+    Evaluate create_unsafe_set over many independent frames, spread across a process pool.
+
+    Frames are shipped to the workers in chunks to amortise pickling, and the results are
+    returned in the order of the frames.
+
+    Args:
+        frames (Iterable[Frame]): The (agent, dynamic_obstacles, dsf) frames to evaluate.
+        workers (Optional[int]): Number of worker processes, defaults to the CPU count.
+                                 With 1 the frames are evaluated in this process.
+        chunksize (Optional[int]): Frames per chunk sent to a worker, defaults to spreading
+                                   the frames over about four chunks per worker.
+        exact_hull (bool): Use the exact convex hull of the safety discs rather than sampled circles.
+
+    Returns:
+        List[List[List[float]]]: The convex hull vertices of each frame's unsafe set.
+    """
+    frames = list(frames)
+    workers = workers or os.cpu_count() or 1
+    evaluate = partial(_evaluate_frame, exact_hull=exact_hull)
+    if workers == 1 or len(frames) <= 1:
+        return [evaluate(frame) for frame in frames]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers, len(frames))
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(frames) / (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(evaluate, frames, chunksize=chunksize))
+
+def _evaluate_frame(frame: Frame, exact_hull: bool) -> List[List[float]]:
+    """Evaluate a single (agent, dynamic_obstacles, dsf) frame."""
+    agent, dynamic_obstacles, dsf = frame
+    return create_unsafe_set(agent=agent, dynamic_obstacles=dynamic_obstacles, dsf=dsf, exact_hull=exact_hull)
@@ -0,0 +1,105 @@
+import numpy as np
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Union
+from colav_unsafe_set.objects import Agent, DynamicObstacle, ObstacleBatch
+from colav_unsafe_set.indices_of_interest import calc_indices_of_interest_masks
+from colav_unsafe_set.indices_of_interest.indices_of_interest_masks import _neighbour_pairs
+from colav_unsafe_set.risk_assessment import calc_cpa_batch
+from colav_unsafe_set.position_prediction import predict_positions
+from colav_unsafe_set.collision_geometry import gen_disc_convhull
+from colav_unsafe_set.instrumentation import record_count, stage_timer
+from .unsafe_set_result import UnsafeSet
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+def create_clustered_unsafe_sets(
+    agent: Agent,
+    dynamic_obstacles: Union[ObstacleBatch, List[DynamicObstacle]],
+    dsf: float,
+    time_of_interest: float = 15,
+    exact_hull: bool = False,
+    executor: Optional['Executor'] = None,
+) -> List[UnsafeSet]:
+    """
+    Create the unsafe set of an agent as one convex hull per cluster of nearby obstacles.
+
+    The uIoI is found as in create_unsafe_set, then split into clusters: two obstacles are in
+    the same cluster if they are linked by a chain of obstacles each within dsf of the next
+    (safety radii subtracted), the neighbour relation calc_I2 evaluates. Each cluster gets the
+    hull of its members' current and predicted safety discs, so obstacles on opposite sides of
+    the agent no longer produce one hull spanning the whole workspace. The union of the
+    cluster hulls covers the same discs as the single unsafe set hull.
+
+    Args:
+        agent (Agent): The agent for which the unsafe sets are to be computed.
+        dynamic_obstacles (Union[ObstacleBatch, List[DynamicObstacle]]): The dynamic obstacles.
+        dsf (float): The distance safety threshold.
+        time_of_interest (float): The TCPA horizon used for I3.
+        exact_hull (bool): Use the exact convex hull of the safety discs rather than sampled circles.
+        executor (Optional[Executor]): If given, the cluster hulls are computed in parallel on it.
+
+    Returns:
+        List[UnsafeSet]: One unsafe set per cluster, ordered by their first obstacle. Empty if no
+                         unsafe regions are found.
+    """
+    if not isinstance(dynamic_obstacles, ObstacleBatch):
+        dynamic_obstacles = ObstacleBatch.from_obstacles(dynamic_obstacles)
+
+    dcpa, tcpa = calc_cpa_batch(agent, dynamic_obstacles)
+    masks = calc_indices_of_interest_masks(agent, dynamic_obstacles, dcpa, tcpa, dsf, time_of_interest)
+    members = np.flatnonzero(masks.uIoI)
+    if members.size == 0:
+        return []
+    member_batch = dynamic_obstacles.subset(members)
+
+    with stage_timer('clustering'):
+        first, second = _neighbour_pairs(member_batch, dsf)
+        labels = _union_find_labels(members.size, first, second)
+    clusters = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+    record_count('clusters', len(clusters))
+
+    predictable = np.isfinite(tcpa[members]) & (tcpa[members] > 0)
+    future_centres = np.empty((members.size, 2), dtype=np.float64)
+    if predictable.any():
+        with stage_timer('prediction'):
+            future_centres[predictable] = predict_positions(
+                member_batch.subset(predictable), tcpa[members][predictable]
+            )[:, :2]
+    current_centres = member_batch.positions[:, :2]
+    radii = member_batch.safety_radius
+
+    cluster_centres = []
+    cluster_radii = []
+    for cluster in clusters:
+        cluster_predicted = cluster[predictable[cluster]]
+        cluster_centres.append(np.concatenate([current_centres[cluster], future_centres[cluster_predicted]]))
+        cluster_radii.append(np.concatenate([radii[cluster], radii[cluster_predicted]]))
+
+    hull = partial(gen_disc_convhull, exact=exact_hull)
+    if executor is None:
+        hulls = map(hull, cluster_centres, cluster_radii)
+    else:
+        hulls = executor.map(hull, cluster_centres, cluster_radii)
+    return [UnsafeSet(vertices) for vertices in hulls]
+
+def _union_find_labels(n: int, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Label the connected components of n nodes joined by the (first, second) pairs.
+
+    Array union-find: every pair hooks the larger root onto the smaller one, then paths are
+    compressed by pointer jumping, until no pair joins two different roots. Each node ends up
+    labelled by the smallest node of its component.
+    """
+    parent = np.arange(n)
+    while True:
+        root_first, root_second = parent[first], parent[second]
+        joining = root_first != root_second
+        if not joining.any():
+            return parent
+        np.minimum.at(parent, np.maximum(root_first, root_second)[joining], np.minimum(root_first, root_second)[joining])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
@@ -0,0 +1,85 @@
+import numpy as np
+from typing import List, Union
+from colav_unsafe_set.objects import Agent, DynamicObstacle, ObstacleBatch
+from colav_unsafe_set.indices_of_interest.indices_of_interest_masks import (
+    compute_agents_obstacle_distances,
+    calc_I3_mask,
+    _neighbour_pairs
+)
+from colav_unsafe_set.risk_assessment import calc_cpa_matrix
+from colav_unsafe_set.position_prediction import predict_positions
+from colav_unsafe_set.collision_geometry import gen_disc_convhull
+
+def create_unsafe_sets(
+    agents: List[Agent],
+    dynamic_obstacles: Union[ObstacleBatch, List[DynamicObstacle]],
+    dsf: float,
+    time_of_interest: float = 15,
+    exact_hull: bool = False,
+) -> List[List[List[float]]]:
+    """
+    Create the unsafe set of every agent in a fleet against a shared set of dynamic obstacles.
+
+    Equivalent to calling create_unsafe_set once per agent, but the obstacle-side work
+    (heading extraction, the I2 neighbour search) is done once for the whole fleet and the
+    per-agent work (CPA, I1, I3) is computed as agents x obstacles arrays. Predicted positions
+    for every (agent, obstacle) pair of interest are computed in a single call.
+
+    The one exception is exact duplicates in dynamic_obstacles: I2 excludes an obstacle from
+    its own neighbourhood by row (see calc_I2_mask), where calc_I2 skips every obstacle equal
+    to it, so duplicates count as each other's neighbours here but not in create_unsafe_set.
+
+    Args:
+        agents (List[Agent]): The agents for which unsafe sets are to be computed.
+        dynamic_obstacles (Union[ObstacleBatch, List[DynamicObstacle]]): The dynamic obstacles.
+        dsf (float): The distance safety threshold.
+        time_of_interest (float): The TCPA horizon used for I3.
+        exact_hull (bool): Use the exact convex hull of the safety discs rather than sampled circles.
+
+    Returns:
+        List[List[List[float]]]: The convex hull vertices of each agent's unsafe set, in agent order.
+                                 An agent with no unsafe regions gets an empty list.
+    """
+    if not isinstance(dynamic_obstacles, ObstacleBatch):
+        dynamic_obstacles = ObstacleBatch.from_obstacles(dynamic_obstacles)
+    if not agents:
+        return []
+
+    # Per-agent metrics and indices of interest as agents x obstacles arrays.
+    dcpa, tcpa = calc_cpa_matrix(agents, dynamic_obstacles)
+    I1 = compute_agents_obstacle_distances(agents, dynamic_obstacles) <= dsf
+    I3 = calc_I3_mask(dcpa, tcpa, dsf, time_of_interest)
+
+    # I2 neighbour search, shared by every agent.
+    has_neighbour = np.zeros(len(dynamic_obstacles), dtype=bool)
+    operands, _ = _neighbour_pairs(dynamic_obstacles, dsf, query_index=np.flatnonzero(I1.any(axis=0)))
+    has_neighbour[operands] = True
+    I2 = I1 & has_neighbour
+
+    # Predict every (agent, obstacle) pair of interest with a future TCPA in one call.
+    uIoI = I1 | I2 | I3
+    predicted = uIoI & np.isfinite(tcpa) & (tcpa > 0)
+    agent_rows, obstacle_rows = np.nonzero(predicted)
+    future_centres = np.empty((len(agents), len(dynamic_obstacles), 2), dtype=np.float64)
+    if agent_rows.size:
+        future_centres[agent_rows, obstacle_rows] = predict_positions(
+            dynamic_obstacles.subset(obstacle_rows), tcpa[agent_rows, obstacle_rows]
+        )[:, :2]
+
+    unsafe_sets = []
+    for agent_row in range(len(agents)):
+        # Discs ordered as gen_uIoI_convhull orders them: I1 first, then the rest of I3.
+        members = np.concatenate([
+            np.flatnonzero(I1[agent_row] | I2[agent_row]),
+            np.flatnonzero(I3[agent_row] & ~(I1[agent_row] | I2[agent_row]))
+        ])
+        members_predicted = members[predicted[agent_row, members]]
+        centres = np.concatenate([
+            np.column_stack((dynamic_obstacles.x[members], dynamic_obstacles.y[members])),
+            future_centres[agent_row, members_predicted]
+        ])
+        radii = np.concatenate([
+            dynamic_obstacles.safety_radius[members], dynamic_obstacles.safety_radius[members_predicted]
+        ])
+        unsafe_sets.append(gen_disc_convhull(centres, radii, exact=exact_hull))
+    return unsafe_sets
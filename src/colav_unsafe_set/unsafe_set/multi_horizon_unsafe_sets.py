@@ -0,0 +1,94 @@
+import numpy as np
+from typing import List, Sequence, Union
+from colav_unsafe_set.objects import Agent, DynamicObstacle, ObstacleBatch
+from colav_unsafe_set.indices_of_interest import calc_I1_mask, calc_I2_mask
+from colav_unsafe_set.risk_assessment import calc_cpa_batch
+from colav_unsafe_set.position_prediction import predict_positions
+from colav_unsafe_set.collision_geometry import gen_disc_convhull
+from colav_unsafe_set.collision_geometry.collision_geometry import _generate_discs_vertices, _vertices_convhull
+from colav_unsafe_set.instrumentation import stage_timer
+
+def create_multi_horizon_unsafe_sets(
+    agent: Agent,
+    dynamic_obstacles: Union[ObstacleBatch, List[DynamicObstacle]],
+    dsf: float,
+    horizons: Sequence[float],
+    exact_hull: bool = False,
+) -> List[List[List[float]]]:
+    """
+    Create nested unsafe sets for several time-of-interest horizons in one pass.
+
+    Equivalent to calling create_unsafe_set once per horizon with time_of_interest set to it,
+    but CPA metrics, I1 and I2 are computed once, I3 is evaluated for every horizon as a single
+    broadcast comparison, and every disc's prediction and circle vertices are generated once
+    and shared by all the horizons whose unsafe set contains it.
+
+    Args:
+        agent (Agent): The agent for which the unsafe sets are to be computed.
+        dynamic_obstacles (Union[ObstacleBatch, List[DynamicObstacle]]): The dynamic obstacles.
+        dsf (float): The distance safety threshold.
+        horizons (Sequence[float]): The time-of-interest horizons used for I3.
+        exact_hull (bool): Use the exact convex hull of the safety discs rather than sampled circles.
+
+    Returns:
+        List[List[List[float]]]: The convex hull vertices of the unsafe set of each horizon, in the
+                                 order of horizons. A horizon with no unsafe regions gets an empty list.
+    """
+    if not isinstance(dynamic_obstacles, ObstacleBatch):
+        dynamic_obstacles = ObstacleBatch.from_obstacles(dynamic_obstacles)
+    horizons = np.asarray(horizons, dtype=np.float64).reshape(-1)
+
+    dcpa, tcpa = calc_cpa_batch(agent, dynamic_obstacles)
+    I1 = calc_I1_mask(agent, dynamic_obstacles, dsf)
+    I12 = I1 | calc_I2_mask(I1, dynamic_obstacles, dsf)
+    # horizons x obstacles
+    I3 = (dcpa <= dsf) & (tcpa <= horizons[:, None])
+    extra = I3 & ~I12
+
+    # Discs of every obstacle in any horizon's unsafe set, predicted and sampled once.
+    members = np.flatnonzero(I12 | extra.any(axis=0))
+    predictable = np.isfinite(tcpa) & (tcpa > 0)
+    predicted = members[predictable[members]]
+    future_centres = np.empty((len(dynamic_obstacles), 2), dtype=np.float64)
+    if predicted.size:
+        with stage_timer('prediction'):
+            future_centres[predicted] = predict_positions(dynamic_obstacles.subset(predicted), tcpa[predicted])[:, :2]
+    centres = np.column_stack((dynamic_obstacles.x, dynamic_obstacles.y))
+    radii = dynamic_obstacles.safety_radius
+
+    if not exact_hull:
+        num_points = 10
+        with stage_timer('vertex_generation'):
+            current_vertices = np.empty((len(dynamic_obstacles), num_points, 2), dtype=np.float64)
+            future_vertices = np.empty((len(dynamic_obstacles), num_points, 2), dtype=np.float64)
+            current_vertices[members] = _generate_discs_vertices(
+                centres[members], radii[members], num_points
+            ).reshape(-1, num_points, 2)
+            future_vertices[predicted] = _generate_discs_vertices(
+                future_centres[predicted], radii[predicted], num_points
+            ).reshape(-1, num_points, 2)
+
+    unsafe_sets = []
+    hulls = {}
+    I12_index = np.flatnonzero(I12)
+    for horizon_extra in extra:
+        # Discs ordered as gen_uIoI_convhull orders them: I1 first, then the rest of I3.
+        horizon_members = np.concatenate([I12_index, np.flatnonzero(horizon_extra)])
+        key = horizon_members.tobytes()
+        if key not in hulls:
+            horizon_predicted = horizon_members[predictable[horizon_members]]
+            if not horizon_members.size:
+                hulls[key] = []
+            elif exact_hull:
+                hulls[key] = gen_disc_convhull(
+                    np.concatenate([centres[horizon_members], future_centres[horizon_predicted]]),
+                    np.concatenate([radii[horizon_members], radii[horizon_predicted]]),
+                    exact=True,
+                )
+            else:
+                hulls[key] = _vertices_convhull(np.concatenate([
+                    current_vertices[horizon_members].reshape(-1, 2),
+                    future_vertices[horizon_predicted].reshape(-1, 2),
+                ]))
+        unsafe_sets.append(hulls[key])
+    return unsafe_sets
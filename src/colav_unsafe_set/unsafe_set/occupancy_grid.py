@@ -0,0 +1,110 @@
+import numpy as np
+from typing import Optional, Tuple
+from colav_unsafe_set.instrumentation import record_count, stage_timer
+from .unsafe_set_result import UnsafeSet
+
+# Cells evaluated per block when computing distances, bounding the (cells x edges) working set
+_CELL_BLOCK = 16384
+
+
+class OccupancyGrid:
+    """
+    Raster of an unsafe set over a fixed rectangular extent, for grid-based planners.
+
+    Cell (row, column) is the square of side resolution whose centre is
+    origin + ((column + 0.5) * resolution, (row + 0.5) * resolution), so rows run along y and
+    columns along x. By default the extent is centred on the origin, matching the
+    "matrix: width/height" block of the scenario files.
+
+    occupancy marks the cells whose centre lies inside the unsafe set. With distance_field set,
+    distance holds the signed distance from each cell centre to the unsafe set (negative inside),
+    truncated above at max_distance.
+
+    Successive updates are incremental: only the cells within the bounding box of the previous
+    and the new hull (grown by max_distance for a distance field) are recomputed, as no other
+    cell can change. An unchanged hull recomputes nothing.
+    """
+
+    def __init__(
+        self,
+        width: float,
+        height: float,
+        resolution: float,
+        origin: Optional[Tuple[float, float]] = None,
+        distance_field: bool = False,
+        max_distance: float = np.inf,
+    ):
+        """
+        Args:
+            width (float): Extent along x in meters.
+            height (float): Extent along y in meters.
+            resolution (float): Cell side in meters.
+            origin (Optional[Tuple[float, float]]): Lower-left corner of the extent, defaults to (-width / 2, -height / 2).
+            distance_field (bool): Also maintain the truncated signed distance field.
+            max_distance (float): Truncation distance of the distance field.
+        """
+        if not resolution > 0:
+            raise ValueError("resolution must be a positive number")
+        if not max_distance > 0:
+            raise ValueError("max_distance must be a positive number")
+        self.resolution = float(resolution)
+        self.origin = (-width / 2.0, -height / 2.0) if origin is None else (float(origin[0]), float(origin[1]))
+        self.shape = (int(np.ceil(height / resolution)), int(np.ceil(width / resolution)))
+        self.distance_field = distance_field
+        self.max_distance = float(max_distance)
+
+        self.x = self.origin[0] + (np.arange(self.shape[1]) + 0.5) * self.resolution   # Cell centre x per column
+        self.y = self.origin[1] + (np.arange(self.shape[0]) + 0.5) * self.resolution   # Cell centre y per row
+        self.occupancy = np.zeros(self.shape, dtype=bool)
+        self.distance = np.full(self.shape, self.max_distance) if distance_field else None
+        self.updated_cells = 0                      # Cells recomputed by the last update
+
+        self._hull = UnsafeSet()
+
+    def update(self, unsafe_set: UnsafeSet, incremental: bool = True) -> None:
+        """
+        Rasterise a new unsafe set, recomputing only the cells it can have changed.
+
+        Args:
+            unsafe_set (UnsafeSet): The unsafe set to rasterise (plain vertex lists are wrapped).
+            incremental (bool): Limit the update to the region covered by the previous and new hulls;
+                                if False, every cell is recomputed.
+        """
+        if not isinstance(unsafe_set, UnsafeSet):
+            unsafe_set = UnsafeSet(unsafe_set)
+        if incremental and unsafe_set == self._hull:
+            self.updated_cells = 0
+            return
+
+        rows, columns = (slice(None), slice(None)) if not incremental else self._changed_region(unsafe_set)
+        with stage_timer('rasterise'):
+            x, y = np.meshgrid(self.x[columns], self.y[rows])
+            centres = np.column_stack((x.ravel(), y.ravel()))
+            region_shape = x.shape
+            if self.distance_field:
+                distance = np.empty(centres.shape[0])
+                for start in range(0, centres.shape[0], _CELL_BLOCK):
+                    block = slice(start, start + _CELL_BLOCK)
+                    distance[block] = unsafe_set.signed_distance(centres[block])
+                distance = np.minimum(distance, self.max_distance).reshape(region_shape)
+                self.distance[rows, columns] = distance
+                self.occupancy[rows, columns] = distance <= 0
+            else:
+                self.occupancy[rows, columns] = unsafe_set.contains(centres).reshape(region_shape)
+        self.updated_cells = int(np.prod(region_shape))
+        record_count('raster_cells', self.updated_cells)
+        self._hull = unsafe_set
+
+    def _changed_region(self, unsafe_set: UnsafeSet) -> Tuple[slice, slice]:
+        """Row and column slices of the cells within reach of the previous or the new hull."""
+        vertices = np.concatenate([self._hull.vertices, unsafe_set.vertices])
+        if vertices.shape[0] == 0:
+            return slice(0, 0), slice(0, 0)
+        reach = self.max_distance if self.distance_field else 0.0
+        lower = vertices.min(axis=0) - reach
+        upper = vertices.max(axis=0) + reach
+        first_column = int(np.searchsorted(self.x, lower[0], side='left'))
+        last_column = int(np.searchsorted(self.x, upper[0], side='right'))
+        first_row = int(np.searchsorted(self.y, lower[1], side='left'))
+        last_row = int(np.searchsorted(self.y, upper[1], side='right'))
+        return slice(first_row, last_row), slice(first_column, last_column)
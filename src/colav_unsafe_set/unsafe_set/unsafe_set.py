@@ -1,14 +1,42 @@
-from typing import List
-from colav_unsafe_set.objects import Agent, DynamicObstacle
-from colav_unsafe_set.indices_of_interest import calc_I1, calc_I2, calc_I3, unionise_indices_of_interest
+import math
+import time
+import numpy as np
+from typing import FrozenSet, List, Optional, Tuple
+from colav_unsafe_set.objects import Agent, DynamicObstacle, DynamicObstacleWithMetrics, ObstacleBatch
+from colav_unsafe_set.indices_of_interest import (
+    calc_I1, calc_I2, calc_I3, unionise_indices_of_interest, calc_reachable_mask, PairSearchReport
+)
 from colav_unsafe_set.risk_assessment import calculate_obstacle_metrics_for_agent
-from colav_unsafe_set.collision_geometry import gen_uIoI_convhull
+from colav_unsafe_set.risk_assessment.risk_assessment import TURNING_CPA_HORIZON
+from colav_unsafe_set.collision_geometry import gen_uIoI_convhull_array, gen_disc_convhull_array
+from colav_unsafe_set.collision_geometry.collision_geometry import _uIoI_discs
+from colav_unsafe_set.instrumentation import record_count, stage_timer
+from .unsafe_set_result import UnsafeSet, UnsafeSetQuality
+from .occupancy_grid import OccupancyGrid
+
+# Vertices per disc of the conservative coarse hull
+COARSE_POINTS = 6
+# Expected cost of the full hull relative to the coarse one, used to decide whether it fits the budget
+_FULL_HULL_COST_FACTOR = 2.0
 
 def create_unsafe_set(
     agent: Agent,
     dynamic_obstacles: List[DynamicObstacle],
     dsf: float,
-) -> List[int]:
+    exact_hull: bool = False,
+    time_of_interest: float = 15,
+    swept_steps: int = 0,
+    swept_horizon: Optional[float] = None,
+    budget_ms: Optional[float] = None,
+    previous: Optional[UnsafeSet] = None,
+    occupancy_grid: Optional[OccupancyGrid] = None,
+    turning_cpa: bool = False,
+    prefilter: bool = True,
+    max_pair_bytes: Optional[int] = None,
+    pair_search_report: Optional[PairSearchReport] = None,
+    metrics_buffer: Optional[List[DynamicObstacleWithMetrics]] = None,
+    out: Optional[np.ndarray] = None,
+) -> UnsafeSet:
     """
     Create an unsafe set for an agent by computing obstacle metrics, determining indices 
     of interest, unionizing these indices, and generating a convex hull around the unsafe regions.
@@ -19,42 +47,221 @@ def create_unsafe_set(
       3. Unionizing these indices to form the unionized unsafe indices of interest (uIoI).
       4. Generating the convex hull from the unionized unsafe set.
 
+    With a time budget, the hull stage degrades gracefully to a cheaper result that still covers
+    every safety disc, and the returned UnsafeSet records the quality level achieved:
+      - BOUNDING if the budget is spent once the indices of interest are known: one disc per
+        obstacle bounding its motion up to TCPA, covering its current and predicted discs.
+        PREVIOUS instead if a previous unsafe set is given and every obstacle it was computed
+        from is still in the uIoI with the same state and TCPA: the previous unsafe set, which
+        already covers those obstacles' discs, together with the bounding discs of the new or
+        changed members only. It is never larger than the BOUNDING result.
+      - COARSE if the full hull is not expected to fit in the remaining budget: every disc
+        approximated by its circumscribed hexagon.
+      - FULL otherwise.
+    The budget only limits the hull stage. The pre-filter, metrics and indices of interest are
+    needed by every level, so they always run to completion and the budget should leave room
+    for them; it is checked before and between the hull steps.
+
     Args:
         agent (Agent): The agent for which the unsafe set is to be computed.
         dynamic_obstacles (List[DynamicObstacle]): A list of dynamic obstacles.
         dsf (float): The distance safety threshold.
+        exact_hull (bool): Use the exact convex hull of the safety discs rather than sampled circles.
+        time_of_interest (float): The TCPA horizon used for I3.
+        swept_steps (int): Sample each obstacle's trajectory up to TCPA with this many discs (see gen_uIoI_convhull).
+        swept_horizon (Optional[float]): Sweep end time for obstacles without a future TCPA.
+        budget_ms (Optional[float]): Time budget in milliseconds, unlimited if None.
+        previous (Optional[UnsafeSet]): The agent's previous unsafe set, computed with the same swept
+                          settings, used as a fallback when over budget.
+        occupancy_grid (Optional[OccupancyGrid]): If given, updated in place with the raster of the unsafe set.
+        turning_cpa (bool): Compute DCPA/TCPA under constant turn rate motion rather than straight lines,
+                            searched up to time_of_interest (at least TURNING_CPA_HORIZON) ahead.
+        prefilter (bool): Drop obstacles that provably cannot enter the uIoI (see calc_reachable_mask)
+                          before computing any metrics. This never changes the result; the number
+                          dropped is reported as culled_obstacles.
+        max_pair_bytes (Optional[int]): Memory ceiling of the I2 obstacle pair search, unbounded if None.
+        pair_search_report (Optional[PairSearchReport]): Filled in with the I2 pair search's working set if given.
+        metrics_buffer (Optional[List[DynamicObstacleWithMetrics]]): Reused across calls to update the
+                          per-obstacle metric wrappers in place instead of allocating new ones
+                          (see calculate_obstacle_metrics_for_agent).
+        out (Optional[np.ndarray]): Preallocated (rows, 2) float64 buffer the hull vertices are written
+                          into (see gen_disc_convhull_array). The result keeps its own copy of
+                          them, so it is unaffected when the buffer is reused.
 
     Returns:
-        List[int]: A list of indices representing the vertices of the convex hull of the unsafe set.
-                   Returns an empty list if no unsafe regions are found.
+        UnsafeSet: The vertices of the convex hull of the unsafe set, with the quality achieved.
+                   Empty if no unsafe regions are found.
     """
+    timestamp = time.monotonic()
+    start = time.perf_counter()
+    record_count('obstacles_in', len(dynamic_obstacles))
+
+    # Drop obstacles that cannot come within dsf of the agent before the time of interest.
+    candidate_obstacles = dynamic_obstacles
+    if prefilter and dynamic_obstacles:
+        with stage_timer('prefilter'):
+            reachable = calc_reachable_mask(
+                agent, ObstacleBatch.from_obstacles(dynamic_obstacles), dsf, time_of_interest
+            )
+            candidate_obstacles = [dynamic_obstacles[i] for i in np.flatnonzero(reachable)]
+    culled_obstacles = len(dynamic_obstacles) - len(candidate_obstacles)
+    record_count('culled', culled_obstacles)
+
     # Calculate dynamic obstacle metrics (e.g., DCPA, TCPA) relative to the agent.
-    dynamic_obstacle_metrics = calculate_obstacle_metrics_for_agent(
-        agent_vessel=agent, dynamic_obstacles=dynamic_obstacles
-    )
+    with stage_timer('metrics'):
+        dynamic_obstacle_metrics = calculate_obstacle_metrics_for_agent(
+            agent_vessel=agent, dynamic_obstacles=candidate_obstacles, turning_cpa=turning_cpa,
+            turning_horizon=max(time_of_interest, TURNING_CPA_HORIZON), out=metrics_buffer,
+        )
 
     # Compute indices of interest based on the safety threshold.
-    I1 = calc_I1(
-        agent=agent,
-        dynamic_obstacles_with_metrics=dynamic_obstacle_metrics,
-        dsf=dsf,
-    )
-    I2 = calc_I2(
-        I1=I1,
-        dynamic_obstacles_with_metrics=dynamic_obstacle_metrics,
-        dsf=dsf,
-    )
-    I3 = calc_I3(
-        dynamic_obstacles_with_metrics=dynamic_obstacle_metrics,
-        dsf=dsf,
-        time_of_interest=15
-    )
+    with stage_timer('I1'):
+        I1 = calc_I1(
+            agent=agent,
+            dynamic_obstacles_with_metrics=dynamic_obstacle_metrics,
+            dsf=dsf,
+        )
+    with stage_timer('I2'):
+        I2 = calc_I2(
+            I1=I1,
+            dynamic_obstacles_with_metrics=dynamic_obstacle_metrics,
+            dsf=dsf,
+            max_bytes=max_pair_bytes,
+            report=pair_search_report,
+        )
+    with stage_timer('I3'):
+        I3 = calc_I3(
+            dynamic_obstacles_with_metrics=dynamic_obstacle_metrics,
+            dsf=dsf,
+            time_of_interest=time_of_interest
+        )
 
     # Unionize the indices of interest.
-    uIoI = unionise_indices_of_interest(I1, I2, I3)
+    with stage_timer('union'):
+        uIoI = unionise_indices_of_interest(I1, I2, I3)
+    record_count('I1', len(I1))
+    record_count('I2', len(I2))
+    record_count('I3', len(I3))
+    record_count('uIoI', len(uIoI))
+    obstacle_states = frozenset(_obstacle_state(dynamic_obstacle) for dynamic_obstacle in uIoI)
     if not uIoI:
-        return []
+        vertices = np.empty((0, 2), dtype=np.float64) if out is None else out[:0]
+        quality = UnsafeSetQuality.FULL
+    elif budget_ms is None:
+        # Generate the convex hull of the unsafe set.
+        vertices = gen_uIoI_convhull_array(
+            uIoI, exact=exact_hull, swept_steps=swept_steps, swept_horizon=swept_horizon, out=out
+        )
+        quality = UnsafeSetQuality.FULL
+    else:
+        vertices, quality = _hull_within_budget(
+            uIoI=uIoI,
+            obstacle_states=obstacle_states,
+            deadline=start + budget_ms / 1000.0,
+            previous=previous,
+            exact_hull=exact_hull,
+            swept_steps=swept_steps,
+            swept_horizon=swept_horizon,
+            out=out,
+        )
+    record_count('hull_vertices', len(vertices))
+
+    unsafe_set = UnsafeSet(vertices, quality=quality, timestamp=timestamp, culled_obstacles=culled_obstacles)
+    unsafe_set.obstacle_states = obstacle_states
+    if occupancy_grid is not None:
+        occupancy_grid.update(unsafe_set)
+    unsafe_set.elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return unsafe_set
+
+def _hull_within_budget(
+    uIoI: List[DynamicObstacleWithMetrics],
+    obstacle_states: FrozenSet[tuple],
+    deadline: float,
+    previous: Optional[UnsafeSet],
+    exact_hull: bool,
+    swept_steps: int,
+    swept_horizon: Optional[float],
+    out: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, UnsafeSetQuality]:
+    """Generate the best hull of the uIoI that is expected to complete before the deadline."""
+    if time.perf_counter() >= deadline:
+        if previous and previous.obstacle_states <= obstacle_states:
+            return _previous_hull(
+                previous, uIoI, swept_steps, swept_horizon, out=out
+            ), UnsafeSetQuality.PREVIOUS
+        return _bounding_hull(uIoI, swept_steps, swept_horizon, out=out), UnsafeSetQuality.BOUNDING
 
-    # Generate and return the convex hull of the unsafe set.
-    return gen_uIoI_convhull(uIoI)
+    centres, radii = _uIoI_discs(uIoI, swept_steps=swept_steps, swept_horizon=swept_horizon)
+    if time.perf_counter() >= deadline:
+        return _bounding_hull(uIoI, swept_steps, swept_horizon, out=out), UnsafeSetQuality.BOUNDING
 
+    coarse_start = time.perf_counter()
+    coarse = gen_disc_convhull_array(centres, radii, coarse_points=COARSE_POINTS, out=out)
+    coarse_end = time.perf_counter()
+    if coarse_end + (coarse_end - coarse_start) * _FULL_HULL_COST_FACTOR > deadline:
+        return coarse, UnsafeSetQuality.COARSE
+    return gen_disc_convhull_array(centres, radii, exact=exact_hull, out=out), UnsafeSetQuality.FULL
+
+def _bounding_hull(
+    uIoI: List[DynamicObstacleWithMetrics],
+    swept_steps: int,
+    swept_horizon: Optional[float],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Coarse hull of the bounding discs of the uIoI (see _bounding_discs)."""
+    centres, radii = _bounding_discs(uIoI, swept_steps, swept_horizon)
+    return gen_disc_convhull_array(centres, radii, coarse_points=COARSE_POINTS, out=out)
+
+def _bounding_discs(
+    uIoI: List[DynamicObstacleWithMetrics],
+    swept_steps: int,
+    swept_horizon: Optional[float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One disc per obstacle, centred on its current position and grown by the distance it can
+    travel up to its TCPA, so it covers every predicted disc without predicting.
+    """
+    tcpa = np.array([dynamic_obstacle.tcpa for dynamic_obstacle in uIoI], dtype=np.float64)
+    travel_time = np.where(np.isfinite(tcpa) & (tcpa > 0), tcpa, np.nan)
+    travel_time[np.isnan(travel_time)] = swept_horizon if swept_steps > 0 and swept_horizon is not None else 0.0
+    centres = np.array(
+        [dynamic_obstacle.dynamic_obstacle.position[:2] for dynamic_obstacle in uIoI], dtype=np.float64
+    ).reshape(-1, 2)
+    radii = np.array(
+        [dynamic_obstacle.dynamic_obstacle.safety_radius for dynamic_obstacle in uIoI], dtype=np.float64
+    ) + np.abs([dynamic_obstacle.dynamic_obstacle.velocity for dynamic_obstacle in uIoI]) * travel_time
+    return centres, radii
+
+def _previous_hull(
+    previous: UnsafeSet,
+    uIoI: List[DynamicObstacleWithMetrics],
+    swept_steps: int,
+    swept_horizon: Optional[float],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Coarse hull of the previous unsafe set together with the bounding discs of the uIoI members
+    whose state or TCPA has changed since it was computed.
+
+    An unchanged member has the same discs as before, which the previous unsafe set covers at
+    any quality level. Each disc lies within the member's bounding disc, and each coarse hexagon
+    within the concentric bounding hexagon, so the result is never larger than _bounding_hull.
+    """
+    changed = [
+        dynamic_obstacle for dynamic_obstacle in uIoI
+        if _obstacle_state(dynamic_obstacle) not in previous.obstacle_states
+    ]
+    bounding_centres, bounding_radii = _bounding_discs(changed, swept_steps, swept_horizon)
+    centres = np.concatenate([previous.vertices, bounding_centres])
+    radii = np.concatenate([np.zeros(len(previous.vertices)), bounding_radii])
+    return gen_disc_convhull_array(centres, radii, coarse_points=COARSE_POINTS, out=out)
+
+def _obstacle_state(dynamic_obstacle: DynamicObstacleWithMetrics) -> tuple:
+    """Hashable state and TCPA of a uIoI member, which together determine its discs."""
+    obstacle = dynamic_obstacle.dynamic_obstacle
+    # NaN (no CPA) never compares equal, so it is recorded as None.
+    tcpa = None if math.isnan(dynamic_obstacle.tcpa) else dynamic_obstacle.tcpa
+    return (
+        obstacle.tag, tuple(obstacle.position), tuple(obstacle.orientation), obstacle.velocity,
+        obstacle.yaw_rate, obstacle.safety_radius, tcpa,
+    )
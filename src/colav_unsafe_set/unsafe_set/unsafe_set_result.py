@@ -0,0 +1,197 @@
+import numpy as np
+from collections.abc import Sequence
+from enum import Enum
+from typing import Iterable, Iterator, List, Tuple, Union
+
+
+class UnsafeSetQuality(Enum):
+    """Quality level of an unsafe set, from the full computation down to the cheapest fallback."""
+    FULL = 'full'                                 # Full computation
+    COARSE = 'coarse'                             # Discs approximated by circumscribed hexagons
+    BOUNDING = 'bounding'                         # Predicted discs replaced by one bounding disc per obstacle
+    PREVIOUS = 'previous'                         # Previous unsafe set reused for unchanged obstacles, bounding discs for the rest
+
+
+class UnsafeSet(Sequence):
+    """
+    Convex hull vertices of an unsafe set, with the quality level that was achieved.
+
+    The vertices are held as a read-only (H, 2) float64 array, the vertices attribute, which
+    np.asarray(unsafe_set) returns without copying. The array is the unsafe set's own copy and
+    an UnsafeSet has no mutating methods, so the vertices, half-planes and queries always agree.
+    For compatibility with the plain list of [x, y]
+    vertices returned before, an UnsafeSet is also a sequence of [x, y] lists that compares
+    equal to such a list; tolist() builds that list on demand.
+
+    The hull's half-plane representation A x <= b (one outward unit normal per edge) is
+    precomputed on construction, so point queries over many points at once are single matrix
+    operations. Clockwise vertices (negative signed area) are reversed to counter-clockwise
+    first, so the normals always point outward. Any list or (H, 2) array can be wrapped,
+    e.g. UnsafeSet(create_unsafe_sets(...)[i]), to query it.
+    """
+
+    def __init__(
+        self,
+        vertices: Union[Iterable[List[float]], np.ndarray] = (),
+        quality: UnsafeSetQuality = UnsafeSetQuality.FULL,
+        elapsed_ms: float = 0.0,
+        timestamp: float = 0.0,
+        culled_obstacles: int = 0,
+    ):
+        """
+        Args:
+            vertices (Union[Iterable[List[float]], np.ndarray]): The convex hull vertices (copied).
+            quality (UnsafeSetQuality): The quality level achieved.
+            elapsed_ms (float): Time taken to compute the unsafe set in milliseconds.
+            timestamp (float): time.monotonic() at the start of the computation, i.e. when the
+                               obstacle states it was computed from were current.
+            culled_obstacles (int): Obstacles dropped by the reachability pre-filter.
+        """
+        if not isinstance(vertices, np.ndarray):
+            vertices = list(vertices)
+        vertices = np.array(vertices, dtype=np.float64).reshape(-1, 2)
+        following = np.roll(vertices, -1, axis=0)
+        if np.sum(vertices[:, 0] * following[:, 1] - following[:, 0] * vertices[:, 1]) < 0:
+            vertices = vertices[::-1].copy()
+        vertices.flags.writeable = False
+        self.vertices = vertices                      # (H, 2) read-only float64 vertex array
+        self.quality = quality
+        self.elapsed_ms = elapsed_ms
+        self.timestamp = timestamp
+        self.culled_obstacles = culled_obstacles
+        self.obstacle_states = frozenset()           # (tag, state..., tcpa) of each uIoI member, set by create_unsafe_set
+
+        edges = np.roll(vertices, -1, axis=0) - vertices
+        lengths = np.hypot(edges[:, 0], edges[:, 1])
+        keep = lengths > 0
+        self._starts = vertices[keep]                 # (H, 2) edge start points
+        self._edges = edges[keep]                     # (H, 2) edge vectors
+        self.A = np.column_stack((self._edges[:, 1], -self._edges[:, 0])) / lengths[keep, None]
+        self.b = np.einsum('ij,ij->i', self.A, self._starts)
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """
+        Test which points lie inside the unsafe set (boundary included).
+
+        Args:
+            points (np.ndarray): The (M, 2) query points.
+
+        Returns:
+            np.ndarray: (M,) boolean mask, all False for an empty unsafe set.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.b.size < 3:
+            return np.zeros(points.shape[0], dtype=bool)
+        return np.all(points @ self.A.T <= self.b, axis=1)
+
+    def signed_distance(self, points: np.ndarray) -> np.ndarray:
+        """
+        Signed distance from each point to the unsafe set boundary: negative inside, positive outside.
+
+        Inside, it is the largest A x - b (the distance to the nearest edge line); outside, the
+        distance to the nearest edge segment.
+
+        Args:
+            points (np.ndarray): The (M, 2) query points.
+
+        Returns:
+            np.ndarray: (M,) signed distances, all +inf for an empty unsafe set.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.b.size < 3:
+            return np.full(points.shape[0], np.inf)
+        distances = np.max(points @ self.A.T - self.b, axis=1)
+        outside = np.flatnonzero(distances > 0)
+        if outside.size:
+            offsets = points[outside, None, :] - self._starts[None, :, :]
+            along = np.einsum('mhk,hk->mh', offsets, self._edges) / np.einsum('hk,hk->h', self._edges, self._edges)
+            nearest = offsets - np.clip(along, 0.0, 1.0)[:, :, None] * self._edges[None, :, :]
+            distances[outside] = np.sqrt(np.min(np.einsum('mhk,mhk->mh', nearest, nearest), axis=1))
+        return distances
+
+    def intersect_paths(self, paths: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Test many candidate paths (polylines) against the unsafe set at once.
+
+        Every segment of every path is clipped against all the hull's half-planes together
+        (Cyrus-Beck): segment p(t) = p0 + t (p1 - p0), t in [0, 1], is inside half-plane k for
+        t on one side of (b_k - A_k p0) / (A_k (p1 - p0)), so it meets the hull if the largest
+        entering t does not exceed the smallest leaving t.
+
+        Args:
+            paths (np.ndarray): (P, S, 2) array of P paths of S waypoints each.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                - (P,) boolean mask of the paths that cross or touch the unsafe set.
+                - (P,) index of each path's first intersecting segment, -1 if none.
+                - (P,) entry parameter t in [0, 1] along that segment (0 if it starts inside), NaN if none.
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        if paths.ndim != 3 or paths.shape[2] != 2:
+            raise ValueError("paths must be a (P, S, 2) array")
+        n_paths = paths.shape[0]
+        if self.b.size < 3 or paths.shape[1] < 2:
+            return np.zeros(n_paths, dtype=bool), np.full(n_paths, -1, dtype=np.intp), np.full(n_paths, np.nan)
+
+        starts = paths[:, :-1, :]
+        directions = paths[:, 1:, :] - starts
+        slack = self.b - starts @ self.A.T                                  # (P, S-1, H): b - A p0
+        rate = directions @ self.A.T                                        # (P, S-1, H): A d
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bound = slack / rate
+        t_enter = np.max(np.where(rate < 0, bound, 0.0), axis=2)
+        t_exit = np.min(np.where(rate > 0, bound, 1.0), axis=2)
+        # A segment parallel to an edge and outside its half-plane never enters.
+        parallel_outside = np.any((rate == 0) & (slack < 0), axis=2)
+        hits = (t_enter <= t_exit) & ~parallel_outside                      # (P, S-1)
+
+        crosses = hits.any(axis=1)
+        first_segment = np.where(crosses, np.argmax(hits, axis=1), -1)
+        entry = np.full(n_paths, np.nan)
+        crossing = np.flatnonzero(crosses)
+        entry[crossing] = t_enter[crossing, first_segment[crossing]]
+        return crosses, first_segment, entry
+
+    def tolist(self) -> List[List[float]]:
+        """Return the vertices as a new list of [x, y] lists."""
+        return self.vertices.tolist()
+
+    def __len__(self) -> int:
+        return self.vertices.shape[0]
+
+    def __getitem__(self, index):
+        return self.vertices[index].tolist()
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return iter(self.vertices.tolist())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UnsafeSet):
+            return np.array_equal(self.vertices, other.vertices)
+        if isinstance(other, list):
+            return self.vertices.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """Return the read-only vertex array, converted to dtype and copied only if needed or requested."""
+        if copy:
+            return np.array(self.vertices, dtype=dtype)
+        if dtype is None or np.dtype(dtype) == self.vertices.dtype:
+            return self.vertices
+        if copy is False:
+            raise ValueError(f"Cannot convert the vertices to {np.dtype(dtype)} without copying")
+        return self.vertices.astype(dtype)
+
+    def __reduce__(self):
+        return (
+            UnsafeSet,
+            (self.vertices, self.quality, self.elapsed_ms, self.timestamp, self.culled_obstacles),
+            {'obstacle_states': self.obstacle_states},
+        )
+
+    def __repr__(self) -> str:
+        return f"UnsafeSet({self.vertices.tolist()}, quality={self.quality.value}, elapsed_ms={self.elapsed_ms:.3f})"
@@ -0,0 +1,250 @@
+import numpy as np
+from typing import List, Optional, Union
+from colav_unsafe_set.objects import Agent, DynamicObstacle, ObstacleBatch
+from colav_unsafe_set.objects.obstacle_batch import quaternions_to_headings
+from colav_unsafe_set.indices_of_interest import calc_I1_mask, calc_I3_mask
+from colav_unsafe_set.indices_of_interest.indices_of_interest_masks import _neighbour_pairs
+from colav_unsafe_set.risk_assessment import calc_cpa_batch
+from colav_unsafe_set.position_prediction import predict_positions
+from colav_unsafe_set.collision_geometry import gen_disc_convhull_array
+
+# Per-obstacle state compared between ticks: x, y, z, qx, qy, qz, qw, velocity, yaw_rate, safety_radius
+_STATE_COLUMNS = 10
+
+
+class UnsafeSetTracker:
+    """
+    Long-lived unsafe set calculator that reuses work across frames.
+
+    Obstacles are tracked by tag. On every update, an obstacle whose state moved by no more than
+    `tolerance` (in every state component) since it was last recomputed keeps its cached state,
+    CPA metrics, IoI membership and predicted disc; only the others are recomputed. If the agent
+    itself moved beyond tolerance, CPA metrics are recomputed for every obstacle. The convex hull
+    is rebuilt only when the set of safety discs changes.
+
+    With the default tolerance of 0, every update returns the same hull as create_unsafe_set.
+    I2 excludes an obstacle from its own neighbourhood by row (see calc_I2_mask) rather than by
+    equality as calc_I2 does; the two only differ for exact duplicates, which unique tags rule out.
+    """
+
+    def __init__(
+        self,
+        dsf: float,
+        time_of_interest: float = 15.0,
+        tolerance: float = 0.0,
+        exact_hull: bool = False,
+    ):
+        """
+        Args:
+            dsf (float): The distance safety threshold.
+            time_of_interest (float): The TCPA horizon used for I3.
+            tolerance (float): Largest per-component state change treated as unchanged.
+            exact_hull (bool): Use the exact convex hull of the safety discs rather than sampled circles.
+        """
+        self.dsf = dsf
+        self.time_of_interest = time_of_interest
+        self.tolerance = tolerance
+        self.exact_hull = exact_hull
+
+        self.recomputed_obstacles = 0              # Obstacles recomputed by the last update
+        self.hull_rebuilt = False                  # Whether the last update rebuilt the hull
+
+        self._agent: Optional[Agent] = None
+        self._agent_state: Optional[np.ndarray] = None
+        self._rows = {}
+        self._batch: Optional[ObstacleBatch] = None
+        self._state = np.empty((0, _STATE_COLUMNS), dtype=np.float64)
+        self._dcpa = np.empty(0, dtype=np.float64)
+        self._tcpa = np.empty(0, dtype=np.float64)
+        self._I1 = np.empty(0, dtype=bool)
+        self._neighbour_counts = np.empty(0, dtype=np.intp)
+        self._future_centres = np.empty((0, 2), dtype=np.float64)
+        self._disc_centres = np.empty((0, 2), dtype=np.float64)
+        self._disc_radii = np.empty(0, dtype=np.float64)
+        self._hull = np.empty((0, 2), dtype=np.float64)
+
+    def reset(self) -> None:
+        """Forget all cached state so the next update recomputes everything."""
+        self.__init__(self.dsf, self.time_of_interest, self.tolerance, self.exact_hull)
+
+    def update(
+        self,
+        agent: Agent,
+        dynamic_obstacles: Union[ObstacleBatch, List[DynamicObstacle]],
+    ) -> List[List[float]]:
+        """
+        Update the tracker with the current agent and obstacle states.
+
+        Args:
+            agent (Agent): The agent for which the unsafe set is to be computed.
+            dynamic_obstacles (Union[ObstacleBatch, List[DynamicObstacle]]): The current obstacles,
+                identified by their unique tags.
+
+        Returns:
+            List[List[float]]: The vertices of the convex hull of the unsafe set, or an empty list
+                               if no unsafe regions are found. A new list on every call, so the
+                               caller may modify it.
+        """
+        if not isinstance(dynamic_obstacles, ObstacleBatch):
+            dynamic_obstacles = ObstacleBatch.from_obstacles(dynamic_obstacles)
+        tags = dynamic_obstacles.tag.tolist()
+        rows = {tag: row for row, tag in enumerate(tags)}
+        if len(rows) != len(tags):
+            raise ValueError("Obstacle tags must be unique")
+
+        # Match obstacles to the previous frame and find which moved beyond tolerance.
+        state = _obstacle_state(dynamic_obstacles)
+        previous_rows = np.array([self._rows.get(tag, -1) for tag in tags], dtype=np.intp)
+        changed = previous_rows < 0
+        known = np.flatnonzero(~changed)
+        changed[known] = np.any(
+            np.abs(state[known] - self._state[previous_rows[known]]) > self.tolerance, axis=1
+        )
+        unchanged = np.flatnonzero(~changed)
+        state[unchanged] = self._state[previous_rows[unchanged]]
+        batch = _batch_from_state(state, dynamic_obstacles)
+
+        agent_state = _agent_state(agent)
+        agent_changed = self._agent_state is None or bool(
+            np.any(np.abs(agent_state - self._agent_state) > self.tolerance)
+        )
+        if agent_changed:
+            self._agent, self._agent_state = agent, agent_state
+        agent = self._agent
+
+        # CPA metrics and I1 depend on the agent, so they are recomputed for every obstacle if it moved.
+        recompute = np.ones(len(batch), dtype=bool) if agent_changed else changed
+        reuse = np.flatnonzero(~recompute)
+        dcpa = np.empty(len(batch), dtype=np.float64)
+        tcpa = np.empty(len(batch), dtype=np.float64)
+        I1 = np.empty(len(batch), dtype=bool)
+        dcpa[reuse] = self._dcpa[previous_rows[reuse]]
+        tcpa[reuse] = self._tcpa[previous_rows[reuse]]
+        I1[reuse] = self._I1[previous_rows[reuse]]
+        if recompute.any():
+            recomputed_batch = batch.subset(recompute)
+            dcpa[recompute], tcpa[recompute] = calc_cpa_batch(agent, recomputed_batch)
+            I1[recompute] = calc_I1_mask(agent, recomputed_batch, self.dsf)
+
+        # I2 and I3 membership.
+        neighbour_counts = self._update_neighbour_counts(batch, changed, previous_rows)
+        I2 = I1 & (neighbour_counts > 0)
+        I3 = calc_I3_mask(dcpa, tcpa, self.dsf, self.time_of_interest)
+
+        # Predicted discs, for obstacles whose state or TCPA changed.
+        predictable = np.isfinite(tcpa) & (tcpa > 0)
+        future_centres = np.full((len(batch), 2), np.nan)
+        future_centres[unchanged] = self._future_centres[previous_rows[unchanged]]
+        repredict = predictable & (changed | ~(tcpa == _take(self._tcpa, previous_rows)))
+        if repredict.any():
+            future_centres[repredict] = predict_positions(batch.subset(repredict), tcpa[repredict])[:, :2]
+
+        # Discs ordered as gen_uIoI_convhull orders them: I1 first, then the rest of I3.
+        uIoI = np.concatenate([np.flatnonzero(I1 | I2), np.flatnonzero(I3 & ~(I1 | I2))])
+        predicted = uIoI[predictable[uIoI]]
+        disc_centres = np.concatenate([
+            np.column_stack((batch.x[uIoI], batch.y[uIoI])), future_centres[predicted]
+        ])
+        disc_radii = np.concatenate([batch.safety_radius[uIoI], batch.safety_radius[predicted]])
+
+        self.hull_rebuilt = not (
+            np.array_equal(disc_centres, self._disc_centres) and np.array_equal(disc_radii, self._disc_radii)
+        )
+        if self.hull_rebuilt:
+            self._hull = gen_disc_convhull_array(disc_centres, disc_radii, exact=self.exact_hull)
+        self.recomputed_obstacles = int(np.count_nonzero(recompute))
+
+        self._rows = rows
+        self._batch = batch
+        self._state = state
+        self._dcpa, self._tcpa, self._I1 = dcpa, tcpa, I1
+        self._neighbour_counts = neighbour_counts
+        self._future_centres = future_centres
+        self._disc_centres, self._disc_radii = disc_centres, disc_radii
+        return self._hull.tolist()
+
+    def _update_neighbour_counts(
+        self,
+        batch: ObstacleBatch,
+        changed: np.ndarray,
+        previous_rows: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Count, for every obstacle, the other obstacles within dsf of it.
+
+        Counts of unchanged obstacles are carried over and adjusted only for pairs that involve a
+        changed, new or removed obstacle, so neighbour searches are limited to those obstacles.
+        """
+        if self._batch is None:
+            operands, _ = _neighbour_pairs(batch, self.dsf)
+            return np.bincount(operands, minlength=len(batch))
+
+        # Previous rows that changed or disappeared no longer contribute their old pairs.
+        carried = np.zeros(len(self._batch), dtype=bool)
+        carried[previous_rows[~changed]] = True
+        stale = np.flatnonzero(~carried)
+        new_rows = np.full(len(self._batch), -1, dtype=np.intp)
+        new_rows[previous_rows[~changed]] = np.flatnonzero(~changed)
+
+        counts = np.zeros(len(batch), dtype=np.intp)
+        counts[~changed] = self._neighbour_counts[previous_rows[~changed]]
+        _, old_neighbours = _neighbour_pairs(self._batch, self.dsf, query_index=stale)
+        old_neighbours = new_rows[old_neighbours[carried[old_neighbours]]]
+        np.subtract.at(counts, old_neighbours, 1)
+
+        # Changed rows get fresh counts; their unchanged neighbours gain the new pairs.
+        operands, neighbours = _neighbour_pairs(batch, self.dsf, query_index=np.flatnonzero(changed))
+        counts[changed] = 0
+        np.add.at(counts, operands, 1)
+        np.add.at(counts, neighbours[~changed[neighbours]], 1)
+        return counts
+
+
+def _take(values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Gather values by previous row, NaN for rows that did not exist."""
+    taken = np.full(rows.shape, np.nan)
+    known = rows >= 0
+    taken[known] = values[rows[known]]
+    return taken
+
+
+def _obstacle_state(obstacles: ObstacleBatch) -> np.ndarray:
+    """Stack the compared per-obstacle state into an (N, 10) array."""
+    state = np.empty((len(obstacles), _STATE_COLUMNS), dtype=np.float64)
+    state[:, 0] = obstacles.x
+    state[:, 1] = obstacles.y
+    state[:, 2] = obstacles.z if obstacles.z is not None else 0.0
+    if obstacles.orientation is not None:
+        state[:, 3:7] = obstacles.orientation
+    else:
+        state[:, 3:5] = 0.0
+        state[:, 5] = np.sin(obstacles.heading / 2.0)
+        state[:, 6] = np.cos(obstacles.heading / 2.0)
+    state[:, 7] = obstacles.speed
+    state[:, 8] = obstacles.yaw_rate
+    state[:, 9] = obstacles.safety_radius
+    return state
+
+
+def _batch_from_state(state: np.ndarray, obstacles: ObstacleBatch) -> ObstacleBatch:
+    """Rebuild an ObstacleBatch from an (N, 10) state array and the tags of obstacles."""
+    return ObstacleBatch(
+        x=state[:, 0].copy(),
+        y=state[:, 1].copy(),
+        z=state[:, 2].copy() if obstacles.z is not None else None,
+        orientation=state[:, 3:7],
+        heading=quaternions_to_headings(state[:, 3:7]),
+        speed=state[:, 7].copy(),
+        yaw_rate=state[:, 8].copy(),
+        safety_radius=state[:, 9].copy(),
+        tag=obstacles.tag,
+    )
+
+
+def _agent_state(agent: Agent) -> np.ndarray:
+    """Flatten the agent's state into a fixed-length array."""
+    position = tuple(agent.position) + (0.0,) * (3 - len(agent.position))
+    return np.array(
+        position + tuple(agent.orientation) + (agent.velocity, agent.yaw_rate, agent.safety_radius),
+        dtype=np.float64,
+    )
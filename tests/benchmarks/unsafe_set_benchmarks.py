@@ -0,0 +1,128 @@
+"""
+Scaling benchmarks for the unsafe set pipeline.
+
+Times each stage of create_unsafe_set, and create_unsafe_set end to end, on seeded synthetic
+traffic (see traffic_generator.py) and writes the results as JSON so runs can be compared:
+
+    python tests/benchmarks/unsafe_set_benchmarks.py --sizes 10 100 1000 --output results.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'src'))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+import numpy as np
+import scipy
+from colav_unsafe_set import create_unsafe_set
+from colav_unsafe_set.risk_assessment import calculate_obstacle_metrics_for_agent
+from colav_unsafe_set.indices_of_interest import calc_I1, calc_I2, calc_I3, unionise_indices_of_interest
+from colav_unsafe_set.collision_geometry import gen_uIoI_convhull
+from traffic_generator import TRAFFIC_PATTERNS, generate_traffic
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+def time_call(function, repeats):
+    """Call function `repeats` times and return its result and the per-call timings in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return result, timings
+
+def summarise(timings):
+    """Summarise per-call timings in milliseconds."""
+    return {
+        'min_ms': min(timings) * 1e3,
+        'median_ms': statistics.median(timings) * 1e3,
+        'max_ms': max(timings) * 1e3,
+        'repeats': len(timings),
+    }
+
+def benchmark_case(num_obstacles, pattern, dsf, time_of_interest, repeats, seed):
+    """Benchmark every stage of the pipeline on one synthetic traffic picture."""
+    agent, dynamic_obstacles = generate_traffic(num_obstacles, pattern=pattern, seed=seed)
+    stages = {}
+
+    metrics, timings = time_call(lambda: calculate_obstacle_metrics_for_agent(agent, dynamic_obstacles), repeats)
+    stages['calculate_obstacle_metrics_for_agent'] = summarise(timings)
+    I1, timings = time_call(lambda: calc_I1(agent, metrics, dsf), repeats)
+    stages['calc_I1'] = summarise(timings)
+    I2, timings = time_call(lambda: calc_I2(I1, metrics, dsf), repeats)
+    stages['calc_I2'] = summarise(timings)
+    I3, timings = time_call(lambda: calc_I3(metrics, dsf, time_of_interest), repeats)
+    stages['calc_I3'] = summarise(timings)
+    uIoI, timings = time_call(lambda: unionise_indices_of_interest(I1, I2, I3), repeats)
+    stages['unionise_indices_of_interest'] = summarise(timings)
+    hull, timings = time_call(lambda: gen_uIoI_convhull(uIoI) if uIoI else [], repeats)
+    stages['gen_uIoI_convhull'] = summarise(timings)
+    _, timings = time_call(lambda: create_unsafe_set(agent, dynamic_obstacles, dsf), repeats)
+    stages['create_unsafe_set'] = summarise(timings)
+
+    return {
+        'num_obstacles': num_obstacles,
+        'pattern': pattern,
+        'counts': {'I1': len(I1), 'I2': len(I2), 'I3': len(I3), 'uIoI': len(uIoI), 'hull_vertices': len(hull)},
+        'stages': stages,
+    }
+
+def git_revision():
+    """Return the current git revision, if available."""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=Path(__file__).resolve().parent, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='obstacle counts to benchmark')
+    parser.add_argument('--patterns', nargs='+', default=list(TRAFFIC_PATTERNS), choices=TRAFFIC_PATTERNS)
+    parser.add_argument('--dsf', type=float, default=50.0, help='distance safety threshold in meters')
+    parser.add_argument('--time-of-interest', type=float, default=15.0, help='TCPA horizon for I3 in seconds')
+    parser.add_argument('--repeats', type=int, default=5, help='timed calls per stage (fewer above 10k obstacles)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None, help='JSON results file (default: results/<timestamp>.json)')
+    args = parser.parse_args(argv)
+
+    started = datetime.now(timezone.utc)
+    results = {
+        'started': started.isoformat(),
+        'revision': git_revision(),
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+        },
+        'parameters': {'dsf': args.dsf, 'time_of_interest': args.time_of_interest, 'seed': args.seed},
+        'cases': [],
+    }
+    for num_obstacles in args.sizes:
+        repeats = args.repeats if num_obstacles <= 10000 else max(1, args.repeats // 5)
+        for pattern in args.patterns:
+            case = benchmark_case(num_obstacles, pattern, args.dsf, args.time_of_interest, repeats, args.seed)
+            results['cases'].append(case)
+            print(
+                f"{pattern:>9} N={num_obstacles:>6}  uIoI={case['counts']['uIoI']:>5}  "
+                f"create_unsafe_set {case['stages']['create_unsafe_set']['median_ms']:10.3f} ms"
+            )
+
+    output = args.output or RESULTS_DIR / f"{started.strftime('%Y%m%dT%H%M%SZ')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from colav_unsafe_set.collision_geometry import (
+    gen_uIoI_convhull, gen_uIoI_convhull_array, gen_disc_convhull, gen_disc_convhull_array
+)
+from tests.unit_tests.traffic import random_obstacles, with_metrics
+
+
+@pytest.fixture
+def uIoI():
+    rng = np.random.default_rng(5)
+    dynamic_obstacles = random_obstacles(rng, 40, 50.0, velocity=4.0, yaw_rate=0.05)
+    return with_metrics(dynamic_obstacles, dcpa=2.0, tcpa=rng.uniform(-5, 20, len(dynamic_obstacles)))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'exact': True}, {'swept_steps': 4}])
+def test_array_matches_list_output(uIoI, kwargs):
+    hull = gen_uIoI_convhull_array(uIoI, **kwargs)
+
+    assert hull.dtype == np.float64 and hull.shape[1] == 2
+    assert hull.tolist() == gen_uIoI_convhull(uIoI, **kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'exact': True}, {'coarse_points': 6}])
+def test_out_buffer_is_filled_and_reused(kwargs):
+    rng = np.random.default_rng(6)
+    out = np.full((512, 2), np.nan)
+
+    for _ in range(3):
+        centres, radii = rng.uniform(-30, 30, (25, 2)), rng.uniform(1, 4, 25)
+        hull = gen_disc_convhull_array(centres, radii, out=out, **kwargs)
+
+        assert np.shares_memory(hull, out)
+        assert hull.tolist() == gen_disc_convhull(centres, radii, **kwargs)
+
+
+def test_out_buffer_must_fit_the_hull():
+    centres, radii = np.array([[0.0, 0.0], [10.0, 0.0]]), np.array([1.0, 1.0])
+    rows = len(gen_disc_convhull(centres, radii))
+
+    assert gen_disc_convhull_array(centres, radii, out=np.empty((rows, 2))).shape == (rows, 2)
+    with pytest.raises(ValueError):
+        gen_disc_convhull_array(centres, radii, out=np.empty((rows - 1, 2)))
+    with pytest.raises(ValueError):
+        gen_disc_convhull_array(centres, radii, out=np.empty((64, 2), dtype=np.float32))
+
+
+def test_empty_input_gives_an_empty_array():
+    out = np.empty((8, 2))
+
+    assert gen_uIoI_convhull_array([]).shape == (0, 2)
+    assert gen_disc_convhull_array(np.empty((0, 2)), np.empty(0), out=out).shape == (0, 2)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from scipy.spatial import ConvexHull
+from colav_unsafe_set.collision_geometry import disc_convex_hull
+
+
+def _outward_normals(polygon):
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    normals = np.column_stack((edges[:, 1], -edges[:, 0]))
+    return normals / np.linalg.norm(normals, axis=1)[:, None]
+
+
+def _circle_samples(centres, radii, num_points=720):
+    theta = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    unit = np.column_stack((np.cos(theta), np.sin(theta)))
+    return (centres[:, None, :] + radii[:, None, None] * unit[None]).reshape(-1, 2)
+
+
+@pytest.mark.parametrize("num_discs", [1, 2, 5, 50])
+def test_hull_covers_every_disc(num_discs):
+    rng = np.random.default_rng(num_discs)
+    centres = rng.uniform(-50, 50, (num_discs, 2))
+    radii = rng.uniform(0.5, 10, num_discs)
+
+    polygon = disc_convex_hull(centres, radii, arc_resolution=np.pi / 18)
+
+    samples = _circle_samples(centres, radii)
+    offsets = np.einsum('mhk,hk->mh', samples[:, None, :] - polygon[None], _outward_normals(polygon))
+    assert offsets.max() <= 1e-9
+    # Circumscribing polygon is only slightly larger than the true hull.
+    assert ConvexHull(polygon).volume <= ConvexHull(samples).volume * 1.01
+
+
+def test_hull_is_convex_and_counter_clockwise():
+    rng = np.random.default_rng(0)
+    polygon = disc_convex_hull(rng.uniform(-50, 50, (30, 2)), rng.uniform(1, 5, 30))
+
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    turns = edges[:, 0] * np.roll(edges, -1, axis=0)[:, 1] - edges[:, 1] * np.roll(edges, -1, axis=0)[:, 0]
+    assert (turns > 0).all()
+
+
+def test_contained_and_duplicate_discs():
+    centres = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 0.0]])
+    radii = np.array([5.0, 1.0, 5.0])
+
+    polygon = disc_convex_hull(centres, radii, arc_resolution=np.pi / 4)
+
+    # Only the outer disc contributes: a regular octagon circumscribing it.
+    assert len(polygon) == 8
+    assert np.linalg.norm(polygon, axis=1) == pytest.approx(5.0 / np.cos(np.pi / 8))
+
+
+def test_no_discs():
+    assert disc_convex_hull(np.empty((0, 2)), np.empty(0)).shape == (0, 2)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from colav_unsafe_set.collision_geometry import gen_uIoI_convhull
+from colav_unsafe_set.position_prediction import predict_position
+from tests.unit_tests.traffic import inside, make_obstacle, with_metrics
+
+
+@pytest.fixture
+def turning_obstacle():
+    turning = make_obstacle(velocity=5.0, yaw_rate=0.2, safety_radius=1.0, tag='turning')
+    return with_metrics([turning], dcpa=1.0, tcpa=10.0)[0]
+
+
+def test_single_step_matches_tcpa_disc(turning_obstacle):
+    assert gen_uIoI_convhull([turning_obstacle], swept_steps=1) == gen_uIoI_convhull([turning_obstacle])
+
+
+def test_swept_hull_covers_turning_arc(turning_obstacle):
+    obstacle = turning_obstacle.dynamic_obstacle
+    arc = np.array([
+        predict_position(obstacle.position, obstacle.orientation, obstacle.velocity, obstacle.yaw_rate, dt)[:2]
+        for dt in np.linspace(0.5, turning_obstacle.tcpa, 20)
+    ])
+
+    two_disc_hull = gen_uIoI_convhull([turning_obstacle], exact=True)
+    swept_hull = gen_uIoI_convhull([turning_obstacle], exact=True, swept_steps=8)
+
+    assert not inside(two_disc_hull, arc, tolerance=0).all()
+    assert inside(swept_hull, arc, tolerance=0).all()
+
+
+def test_swept_horizon_sweeps_obstacles_without_future_tcpa(turning_obstacle):
+    turning_obstacle.tcpa = float('nan')
+
+    assert gen_uIoI_convhull([turning_obstacle], swept_steps=4) == gen_uIoI_convhull([turning_obstacle])
+    assert gen_uIoI_convhull([turning_obstacle], swept_steps=4, swept_horizon=10.0) != gen_uIoI_convhull(
+        [turning_obstacle]
+    )
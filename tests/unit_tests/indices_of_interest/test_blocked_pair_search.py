@@ -0,0 +1,110 @@
+import tracemalloc
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set
+from colav_unsafe_set.instrumentation import enable_instrumentation, disable_instrumentation, get_registry
+from colav_unsafe_set.objects import ObstacleBatch
+from colav_unsafe_set.indices_of_interest import calc_I2, calc_I2_mask, PairSearchReport
+from colav_unsafe_set.indices_of_interest.indices_of_interest_masks import PAIR_BYTES, _neighbour_pairs
+from tests.unit_tests.traffic import make_agent, with_metrics
+
+
+def _dense_batch(n, seed=0):
+    rng = np.random.default_rng(seed)
+    side = np.sqrt(n) * 4.0
+    return ObstacleBatch.from_arrays(
+        x=rng.uniform(0, side, n),
+        y=rng.uniform(0, side, n),
+        heading=np.zeros(n),
+        speed=np.zeros(n),
+        yaw_rate=np.zeros(n),
+        safety_radius=rng.uniform(0.5, 3.0, n),
+        tag=[f'obstacle_{i}' for i in range(n)],
+        z=np.zeros(n),
+    )
+
+
+@pytest.mark.parametrize("max_bytes", [1, 64 * PAIR_BYTES, 1 << 20])
+def test_blocked_pairs_match_unblocked(max_bytes):
+    batch = _dense_batch(3000)
+    query_index = np.flatnonzero(np.arange(len(batch)) % 3 == 0)
+
+    unblocked = _neighbour_pairs(batch, 10.0, query_index=query_index)
+    report = PairSearchReport()
+    blocked = _neighbour_pairs(batch, 10.0, query_index=query_index, max_bytes=max_bytes, report=report)
+
+    assert sorted(zip(*map(np.ndarray.tolist, blocked))) == sorted(zip(*map(np.ndarray.tolist, unblocked)))
+    assert report.blocks > 1
+    if max_bytes >= 1 << 20:
+        assert report.peak_bytes <= max_bytes
+
+
+def test_blocked_I2_mask_and_list_match_unblocked():
+    batch = _dense_batch(2000, seed=1)
+    I1 = np.random.default_rng(2).random(len(batch)) < 0.5
+
+    np.testing.assert_array_equal(
+        calc_I2_mask(I1, batch, 6.0, max_bytes=4096), calc_I2_mask(I1, batch, 6.0)
+    )
+
+    obstacles = with_metrics(batch.to_obstacles(), dcpa=1.0, tcpa=1.0)
+    operands = [obstacle for obstacle, member in zip(obstacles, I1) if member]
+    assert calc_I2(operands, obstacles, 6.0, max_bytes=4096) == calc_I2(operands, obstacles, 6.0)
+
+
+def test_blocked_I2_mask_keeps_working_set_under_ceiling():
+    batch = _dense_batch(20000, seed=3)
+    I1 = np.ones(len(batch), dtype=bool)
+
+    def traced_peak(**kwargs):
+        tracemalloc.start()
+        calc_I2_mask(I1, batch, 20.0, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    ceiling = 4 << 20
+    unblocked_peak = traced_peak()
+    report = PairSearchReport()
+    blocked_peak = traced_peak(max_bytes=ceiling, report=report)
+
+    assert report.peak_bytes <= ceiling
+    assert blocked_peak < 2 * ceiling < unblocked_peak
+
+
+@pytest.mark.parametrize("max_bytes", [None, 64 * PAIR_BYTES])
+def test_I2_list_path_reports_its_working_set(max_bytes):
+    batch = _dense_batch(2000, seed=4)
+    obstacles = with_metrics(batch.to_obstacles(), dcpa=1.0, tcpa=1.0)
+    registry = get_registry()
+    registry.reset()
+    enable_instrumentation()
+    try:
+        report = PairSearchReport()
+        calc_I2(obstacles[::2], obstacles, 6.0, max_bytes=max_bytes, report=report)
+        recorded = registry.snapshot()['counts']['pair_peak_bytes']
+    finally:
+        disable_instrumentation()
+        registry.reset()
+
+    assert report.candidate_pairs > 0
+    assert report.blocks == 1 if max_bytes is None else report.blocks > 1
+    if max_bytes is None:
+        assert report.peak_bytes == report.candidate_pairs * PAIR_BYTES
+    else:
+        assert 0 < report.peak_bytes <= max_bytes
+    assert recorded['count'] == 1 and recorded['max'] == report.peak_bytes
+
+
+def test_unsafe_set_surfaces_the_pair_search_report():
+    agent = make_agent(velocity=0.0)
+    report = PairSearchReport()
+
+    unsafe_set = create_unsafe_set(
+        agent, _dense_batch(500, seed=5).to_obstacles(), dsf=15.0, max_pair_bytes=256 * PAIR_BYTES,
+        pair_search_report=report
+    )
+
+    assert len(unsafe_set) > 0
+    assert report.blocks > 1
+    assert 0 < report.peak_bytes <= 256 * PAIR_BYTES
@@ -0,0 +1,33 @@
+import pytest
+from colav_unsafe_set.indices_of_interest import calc_I2
+from colav_unsafe_set.indices_of_interest.indices_of_interest import compute_obstacle_distance
+from tests.unit_tests.traffic import random_obstacles, with_metrics
+
+
+def _all_pairs_I2(I1, dynamic_obstacles_with_metrics, dsf):
+    # Reference all-pairs implementation.
+    I2 = []
+    for operand in I1:
+        for arg in dynamic_obstacles_with_metrics:
+            if operand == arg:
+                continue
+            if compute_obstacle_distance(operand, arg) <= dsf:
+                I2.append(operand)
+                break
+    return I2
+
+
+@pytest.mark.parametrize("dsf", [0.0, 2.0, 10.0])
+def test_calc_I2_matches_all_pairs(dsf):
+    dynamic_obstacles = with_metrics(
+        random_obstacles(7, 300, (0.0, 500.0), velocity=1.0, safety_radius=(0.5, 5.0), yaw=0.0), dcpa=1.0, tcpa=2.0
+    )
+    I1 = dynamic_obstacles[::3]
+
+    assert calc_I2(I1, dynamic_obstacles, dsf) == _all_pairs_I2(I1, dynamic_obstacles, dsf)
+
+
+def test_calc_I2_ignores_self():
+    dynamic_obstacles = with_metrics(random_obstacles(0, 1, (0.0, 1.0)), dcpa=1.0, tcpa=2.0)
+
+    assert calc_I2(dynamic_obstacles, dynamic_obstacles, 10.0) == []
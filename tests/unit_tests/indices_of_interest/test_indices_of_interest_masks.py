@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from colav_unsafe_set.objects import ObstacleBatch
+from colav_unsafe_set.risk_assessment import calculate_obstacle_metrics_for_agent, calc_cpa_batch
+from colav_unsafe_set.indices_of_interest import (
+    calc_I1, calc_I2, calc_I3, unionise_indices_of_interest,
+    calc_I3_mask, calc_indices_of_interest_masks
+)
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+@pytest.fixture
+def agent_vessel():
+    return make_agent(position=(250.0, 250.0))
+
+
+@pytest.fixture
+def dynamic_obstacles():
+    return random_obstacles(3, 400, (0.0, 500.0), safety_radius=(1.0, 8.0))
+
+
+def _tags(obstacles_with_metrics):
+    return sorted(obstacle.dynamic_obstacle.tag for obstacle in obstacles_with_metrics)
+
+
+def test_masks_match_list_pipeline(agent_vessel, dynamic_obstacles):
+    dsf = 40.0
+    metrics = calculate_obstacle_metrics_for_agent(agent_vessel, dynamic_obstacles)
+    I1 = calc_I1(agent_vessel, metrics, dsf)
+    I2 = calc_I2(I1, metrics, dsf)
+    I3 = calc_I3(metrics, dsf, time_of_interest=15)
+    uIoI = unionise_indices_of_interest(I1, I2, I3)
+
+    batch = ObstacleBatch.from_obstacles(dynamic_obstacles)
+    dcpa, tcpa = calc_cpa_batch(agent_vessel, batch)
+    masks = calc_indices_of_interest_masks(agent_vessel, batch, dcpa, tcpa, dsf, time_of_interest=15)
+
+    assert sorted(batch.tag[masks.I1]) == _tags(I1)
+    assert sorted(batch.tag[masks.I2]) == _tags(I2)
+    assert sorted(batch.tag[masks.I3]) == _tags(I3)
+    assert sorted(batch.tag[masks.uIoI]) == _tags(uIoI)
+    assert np.array_equal(masks.uIoI, masks.I1 | masks.I2 | masks.I3)
+
+
+def test_I3_mask_excludes_nan_metrics():
+    dcpa = np.array([1.0, np.nan, 1.0, 20.0])
+    tcpa = np.array([5.0, np.nan, np.inf, 5.0])
+
+    assert calc_I3_mask(dcpa, tcpa, dsf=10.0, time_of_interest=15).tolist() == [True, False, False, False]
@@ -0,0 +1,71 @@
+import json
+import math
+import pytest
+from colav_unsafe_set import create_unsafe_set, create_clustered_unsafe_sets
+from colav_unsafe_set.instrumentation import (
+    Histogram,
+    enable_instrumentation,
+    disable_instrumentation,
+    get_registry
+)
+from tests.unit_tests.traffic import make_agent, make_obstacle
+
+
+@pytest.fixture
+def registry():
+    registry = get_registry()
+    registry.reset()
+    yield registry
+    disable_instrumentation()
+    registry.reset()
+
+
+@pytest.fixture
+def scenario():
+    dynamic_obstacles = [
+        make_obstacle((10 * i, 5), yaw=math.pi, velocity=2.0, safety_radius=2.0, tag=f'obstacle_{i}')
+        for i in range(1, 4)
+    ]
+    return make_agent(), dynamic_obstacles
+
+
+def test_records_stages_and_counts_when_enabled(registry, scenario):
+    enable_instrumentation()
+    for _ in range(3):
+        create_unsafe_set(*scenario, dsf=20.0)
+
+    snapshot = registry.snapshot()
+    for stage in ('metrics', 'I1', 'I2', 'I3', 'union', 'prediction', 'vertex_generation', 'hull'):
+        assert snapshot['stages_ms'][stage]['count'] == 3
+    assert snapshot['counts']['obstacles_in']['max'] == 3
+    assert snapshot['counts']['hull_vertices']['count'] == 3
+    assert json.loads(registry.to_json())['counts']['uIoI']['count'] == 3
+    assert 'vertex_generation' in registry.to_text()
+
+
+def test_counts_only_the_returned_hull(registry, scenario):
+    enable_instrumentation()
+    # The budgeted path builds a coarse hull before the full one, and a cluster a hull of its own.
+    unsafe_sets = [create_unsafe_set(*scenario, dsf=20.0, budget_ms=1e6) for _ in range(3)]
+    create_clustered_unsafe_sets(*scenario, dsf=20.0)
+
+    hull_vertices = registry.snapshot()['counts']['hull_vertices']
+    assert hull_vertices['count'] == 3
+    assert hull_vertices['max'] == max(len(unsafe_set) for unsafe_set in unsafe_sets)
+
+
+def test_records_nothing_when_disabled(registry, scenario):
+    create_unsafe_set(*scenario, dsf=20.0)
+
+    assert registry.snapshot() == {'stages_ms': {}, 'counts': {}}
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert histogram.count == 100 and histogram.mean == pytest.approx(50.5)
+    assert histogram.percentile(50) == pytest.approx(50, rel=0.13)
+    assert histogram.percentile(99) == pytest.approx(99, rel=0.13)
+    assert histogram.percentile(100) == 100
@@ -0,0 +1,65 @@
+import dataclasses
+import pickle
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set, calculate_obstacle_metrics_for_agent
+from colav_unsafe_set.objects import Agent, FrozenAgent, FrozenDynamicObstacle, DynamicObstacleWithMetrics
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+AGENT_FIELDS = dataclasses.asdict(make_agent())
+
+
+@pytest.mark.parametrize("obj", [
+    Agent(**AGENT_FIELDS),
+    FrozenAgent(**AGENT_FIELDS),
+    random_obstacles(0, 1, 100.0)[0],
+    random_obstacles(0, 1, 100.0, cls=FrozenDynamicObstacle)[0],
+    DynamicObstacleWithMetrics(dynamic_obstacle=random_obstacles(0, 1, 100.0)[0], tcpa=1.0, dcpa=2.0),
+])
+def test_objects_are_slotted_and_picklable(obj):
+    assert not hasattr(obj, '__dict__')
+    with pytest.raises(AttributeError):
+        obj.unexpected = 1
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_frozen_variants_are_immutable_and_hashable():
+    agent = FrozenAgent(**AGENT_FIELDS)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        agent.velocity = 1.0
+    assert hash(agent) == hash(FrozenAgent(**AGENT_FIELDS))
+    frozen_obstacles = random_obstacles(1, 10, 100.0, cls=FrozenDynamicObstacle)
+    assert len(set(frozen_obstacles + random_obstacles(1, 10, 100.0, cls=FrozenDynamicObstacle))) == 10
+
+
+def test_frozen_variants_give_the_same_unsafe_set():
+    frozen_obstacles = random_obstacles(2, 60, 100.0, cls=FrozenDynamicObstacle)
+    assert create_unsafe_set(FrozenAgent(**AGENT_FIELDS), frozen_obstacles, dsf=20.0) == \
+        create_unsafe_set(Agent(**AGENT_FIELDS), random_obstacles(2, 60, 100.0), dsf=20.0)
+
+
+@pytest.mark.parametrize("previous_size", [0, 20, 40, 80])
+def test_metrics_are_updated_in_place(previous_size):
+    agent = Agent(**AGENT_FIELDS)
+    out = calculate_obstacle_metrics_for_agent(agent, random_obstacles(3, previous_size, 100.0))
+    wrappers = list(out)
+
+    dynamic_obstacles = random_obstacles(4, 40, 100.0)
+    result = calculate_obstacle_metrics_for_agent(agent, dynamic_obstacles, out=out)
+
+    expected = calculate_obstacle_metrics_for_agent(agent, dynamic_obstacles)
+    assert result is out
+    assert [metrics.dynamic_obstacle for metrics in result] == dynamic_obstacles
+    np.testing.assert_array_equal([metrics.dcpa for metrics in result], [metrics.dcpa for metrics in expected])
+    np.testing.assert_array_equal([metrics.tcpa for metrics in result], [metrics.tcpa for metrics in expected])
+    assert all(new is old for new, old in zip(result, wrappers))
+
+
+def test_metrics_buffer_gives_the_same_unsafe_set():
+    agent = Agent(**AGENT_FIELDS)
+    metrics_buffer = []
+    for seed in range(3):
+        dynamic_obstacles = random_obstacles(seed, 50 + 10 * seed, 100.0)
+        assert create_unsafe_set(agent, dynamic_obstacles, dsf=20.0, metrics_buffer=metrics_buffer) == \
+            create_unsafe_set(agent, dynamic_obstacles, dsf=20.0)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from colav_unsafe_set.objects import DynamicObstacle, ObstacleBatch
+
+
+@pytest.fixture
+def dynamic_obstacles():
+    return [
+        DynamicObstacle(
+            tag='obstacle_1',
+            position=(float(10), float(20), float(0)),
+            orientation=(float(0), float(0), float(0.3826834), float(0.9238795)),
+            velocity=float(5),
+            yaw_rate=float(0.1),
+            safety_radius=float(3)
+        ),
+        DynamicObstacle(
+            tag='obstacle_2',
+            position=(float(-5), float(7), float(1)),
+            orientation=(float(0), float(0), float(0), float(1)),
+            velocity=float(0),
+            yaw_rate=float(0),
+            safety_radius=float(1.5)
+        ),
+    ]
+
+
+def test_round_trip_is_lossless(dynamic_obstacles):
+    batch = ObstacleBatch.from_obstacles(dynamic_obstacles)
+
+    assert len(batch) == 2
+    assert batch.to_obstacles() == dynamic_obstacles
+
+
+def test_round_trip_keeps_planar_positions():
+    dynamic_obstacle = DynamicObstacle(
+        tag='planar', position=(1.0, 2.0), orientation=(0.0, 0.0, 0.0, 1.0),
+        velocity=1.0, yaw_rate=0.0, safety_radius=1.0
+    )
+    batch = ObstacleBatch.from_obstacles([dynamic_obstacle])
+
+    assert batch.z is None
+    assert batch.to_obstacles() == [dynamic_obstacle]
+
+
+def test_heading_is_extracted_from_quaternion(dynamic_obstacles):
+    batch = ObstacleBatch.from_obstacles(dynamic_obstacles)
+
+    assert batch.heading == pytest.approx([np.pi / 4, 0.0], abs=1e-6)
+
+
+def test_from_arrays_is_zero_copy():
+    x = np.array([1.0, 2.0])
+    y = np.array([3.0, 4.0])
+    heading = np.array([0.0, np.pi / 2])
+    speed = np.array([1.0, 2.0])
+    yaw_rate = np.zeros(2)
+    safety_radius = np.ones(2)
+
+    batch = ObstacleBatch.from_arrays(x, y, heading, speed, yaw_rate, safety_radius, tag=['a', 'b'])
+
+    assert batch.x is x
+    assert np.shares_memory(batch.heading, heading)
+    obstacles = batch.to_obstacles()
+    assert ObstacleBatch.from_obstacles(obstacles).heading == pytest.approx(heading)
+
+
+def test_mismatched_lengths_raise():
+    with pytest.raises(ValueError):
+        ObstacleBatch.from_arrays([1.0], [1.0, 2.0], [0.0], [0.0], [0.0], [1.0], tag=['a'])
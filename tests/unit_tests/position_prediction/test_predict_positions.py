@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from colav_unsafe_set.objects import DynamicObstacle, ObstacleBatch
+from colav_unsafe_set.position_prediction import predict_position, predict_positions, predict_trajectories
+
+
+@pytest.fixture
+def dynamic_obstacles():
+    rng = np.random.default_rng(11)
+    return [
+        DynamicObstacle(
+            tag=f'obstacle_{i}',
+            position=tuple(float(value) for value in rng.uniform(-100, 100, 3)),
+            orientation=tuple(float(value) for value in rng.normal(size=4)),
+            velocity=float(rng.uniform(0, 10)),
+            yaw_rate=float(rng.uniform(-0.3, 0.3)),
+            safety_radius=float(1)
+        )
+        for i in range(50)
+    ]
+
+
+def test_matches_predict_position(dynamic_obstacles):
+    dt = np.linspace(0.5, 30.0, len(dynamic_obstacles))
+
+    predicted = predict_positions(ObstacleBatch.from_obstacles(dynamic_obstacles), dt)
+
+    expected = [
+        predict_position(
+            position=obstacle.position,
+            quaternion_orientation=obstacle.orientation,
+            velocity=obstacle.velocity,
+            yaw_rate=obstacle.yaw_rate,
+            dt=step
+        )
+        for obstacle, step in zip(dynamic_obstacles, dt)
+    ]
+    assert predicted.shape == (len(dynamic_obstacles), 3)
+    np.testing.assert_allclose(predicted, expected, rtol=1e-12, atol=1e-9)
+
+
+def test_heading_only_batch():
+    batch = ObstacleBatch.from_arrays(
+        x=[0.0], y=[0.0], heading=[np.pi / 2], speed=[2.0], yaw_rate=[0.0], safety_radius=[1.0], tag=['a']
+    )
+
+    np.testing.assert_allclose(predict_positions(batch, 3.0), [[0.0, 6.0, 0.0]], atol=1e-12)
+
+
+@pytest.mark.parametrize("dt", [0.0, -1.0, float('nan')])
+def test_invalid_dt_raises(dynamic_obstacles, dt):
+    with pytest.raises(ValueError):
+        predict_positions(ObstacleBatch.from_obstacles(dynamic_obstacles), dt)
+
+
+def test_trajectories_match_predict_positions(dynamic_obstacles):
+    batch = ObstacleBatch.from_obstacles(dynamic_obstacles)
+    times = np.linspace(0.5, 30.0, len(dynamic_obstacles))[:, None] * np.array([0.25, 0.5, 1.0])
+
+    trajectories = predict_trajectories(batch, times)
+
+    assert trajectories.shape == (len(dynamic_obstacles), 3, 3)
+    for step in range(times.shape[1]):
+        np.testing.assert_array_equal(trajectories[:, step], predict_positions(batch, times[:, step]))
+
+
+def test_trajectories_reject_non_positive_times(dynamic_obstacles):
+    with pytest.raises(ValueError):
+        predict_trajectories(ObstacleBatch.from_obstacles(dynamic_obstacles), np.array([1.0, 0.0]))
@@ -0,0 +1,49 @@
+import math
+import numpy as np
+import pytest
+from colav_unsafe_set.risk_assessment import calc_cpa, calc_cpa_batch
+from tests.unit_tests.traffic import make_agent, make_obstacle
+
+
+@pytest.fixture
+def agent_vessel():
+    return make_agent(velocity=10.0, safety_radius=1.0)
+
+
+def test_readme_edge_cases(agent_vessel):
+    stationary_agent = make_agent(velocity=0.0, safety_radius=1.0)
+    dcpa, tcpa = calc_cpa_batch(stationary_agent, [
+        make_obstacle((0.0, 0.0), safety_radius=1.0),      # 1.1 identical position
+        make_obstacle((3.0, 4.0), safety_radius=1.0),      # 1.2 stationary, offset
+    ])
+    assert math.isnan(dcpa[0]) and tcpa[0] == math.inf
+    assert dcpa[1] == pytest.approx(5.0) and tcpa[1] == math.inf
+
+    dcpa, tcpa = calc_cpa_batch(agent_vessel, [
+        make_obstacle((100.0, 100.0), -np.pi / 2, 10.0, safety_radius=1.0),   # 2.1 future CPA
+        make_obstacle((-100.0, 0.0), np.pi, 10.0, safety_radius=1.0),         # 2.2 CPA in past
+        make_obstacle((30.0, 40.0), 0.0, 10.0, safety_radius=1.0),            # 1.2 same velocity, offset
+    ])
+    assert dcpa[0] == pytest.approx(0.0, abs=1e-9) and tcpa[0] == pytest.approx(10.0)
+    assert math.isnan(dcpa[1]) and math.isnan(tcpa[1])
+    assert dcpa[2] == pytest.approx(50.0) and tcpa[2] == pytest.approx(5.0)
+
+
+def test_matches_calc_cpa(agent_vessel):
+    rng = np.random.default_rng(0)
+    obstacles = [
+        make_obstacle(rng.uniform(-200, 200, 3), rng.uniform(-np.pi, np.pi), rng.uniform(0, 15), safety_radius=1.0)
+        for _ in range(200)
+    ]
+
+    dcpa, tcpa = calc_cpa_batch(agent_vessel, obstacles)
+
+    expected = np.array([calc_cpa(agent_vessel, obstacle) for obstacle in obstacles], dtype=np.float64)
+    np.testing.assert_allclose(dcpa, expected[:, 0], rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(tcpa, expected[:, 1], rtol=1e-9, atol=1e-9)
+
+
+def test_empty_obstacle_set(agent_vessel):
+    dcpa, tcpa = calc_cpa_batch(agent_vessel, [])
+
+    assert dcpa.shape == (0,) and tcpa.shape == (0,)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set
+from colav_unsafe_set.objects import ObstacleBatch
+from colav_unsafe_set.risk_assessment import calc_cpa_batch, calc_cpa_turning_batch
+from colav_unsafe_set.position_prediction import predict_position, predict_trajectories
+from tests.unit_tests.traffic import make_agent, make_obstacle, random_obstacles
+
+
+@pytest.fixture
+def agent_vessel():
+    return make_agent(yaw=0.3, velocity=6.0)
+
+
+def test_matches_linear_cpa_without_turning(agent_vessel):
+    dynamic_obstacles = random_obstacles(1, 300, 200.0, velocity=(0.0, 8.0))
+
+    dcpa, tcpa = calc_cpa_turning_batch(agent_vessel, dynamic_obstacles)
+
+    expected_dcpa, expected_tcpa = calc_cpa_batch(agent_vessel, dynamic_obstacles)
+    np.testing.assert_allclose(dcpa, expected_dcpa, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(tcpa, expected_tcpa, rtol=1e-12, atol=1e-9)
+
+
+def test_turning_cpa_matches_dense_search(agent_vessel):
+    agent_vessel.yaw_rate = 0.02
+    dynamic_obstacles = random_obstacles(2, 300, 200.0, velocity=(0.0, 8.0), yaw_rate=(-0.1, 0.1))
+
+    dcpa, tcpa = calc_cpa_turning_batch(agent_vessel, dynamic_obstacles, horizon=60.0)
+
+    n = len(dynamic_obstacles)
+    agent_batch = ObstacleBatch.from_arrays(
+        x=np.full(n, agent_vessel.position[0]), y=np.full(n, agent_vessel.position[1]), heading=np.full(n, 0.3),
+        speed=np.full(n, agent_vessel.velocity), yaw_rate=np.full(n, agent_vessel.yaw_rate),
+        safety_radius=np.full(n, agent_vessel.safety_radius), tag=['agent'] * n
+    )
+    obstacle_batch = ObstacleBatch.from_obstacles(dynamic_obstacles)
+
+    def distances(times):
+        return np.linalg.norm(
+            predict_trajectories(agent_batch, times)[:, :, :2] - predict_trajectories(obstacle_batch, times)[:, :, :2],
+            axis=2
+        )
+
+    times = np.linspace(0.01, 60.0, 6000)
+    nearest = np.argmin(distances(times), axis=1)
+    past = nearest == 0
+    # Near misses sweep past within one 10 ms sample, so refine around the coarse minimum.
+    fine_times = np.clip(times[nearest][:, None] + np.linspace(-0.01, 0.01, 201), 0.01, 60.0)
+    fine_distances = distances(fine_times)
+    fine_nearest = np.argmin(fine_distances, axis=1)
+    rows = np.arange(n)
+
+    assert np.all(np.isnan(dcpa[past]) & np.isnan(tcpa[past]))
+    np.testing.assert_allclose(dcpa[~past], fine_distances[rows, fine_nearest][~past], atol=1e-3)
+    np.testing.assert_allclose(tcpa[~past], fine_times[rows, fine_nearest][~past], atol=0.05)
+
+
+def test_predicted_disc_sits_at_turning_cpa(agent_vessel):
+    dynamic_obstacles = random_obstacles(3, 50, 200.0, velocity=(0.0, 8.0), yaw_rate=0.08)
+    batch = ObstacleBatch.from_obstacles(dynamic_obstacles)
+
+    dcpa, tcpa = calc_cpa_turning_batch(agent_vessel, batch)
+
+    for obstacle, obstacle_dcpa, obstacle_tcpa in zip(dynamic_obstacles, dcpa, tcpa):
+        if not np.isfinite(obstacle_tcpa):
+            continue
+        agent_at_cpa = predict_position(
+            agent_vessel.position, agent_vessel.orientation, agent_vessel.velocity, agent_vessel.yaw_rate, obstacle_tcpa
+        )[:2]
+        obstacle_at_cpa = predict_position(
+            obstacle.position, obstacle.orientation, obstacle.velocity, obstacle.yaw_rate, obstacle_tcpa
+        )[:2]
+        assert np.linalg.norm(agent_at_cpa - obstacle_at_cpa) == pytest.approx(obstacle_dcpa, abs=1e-9)
+
+
+def test_unsafe_set_searches_turning_cpa_up_to_time_of_interest():
+    agent_vessel = make_agent(velocity=0.0)
+    # On a collision course with its CPA at t = 90 s, beyond the default 60 s search horizon.
+    dynamic_obstacles = [
+        make_obstacle((900.0, 5.0), np.pi, 10.0, yaw_rate=1e-6, safety_radius=6.0, tag='late_crossing')
+    ]
+
+    linear = create_unsafe_set(agent_vessel, dynamic_obstacles, dsf=20.0, time_of_interest=120)
+    turning = create_unsafe_set(agent_vessel, dynamic_obstacles, dsf=20.0, time_of_interest=120, turning_cpa=True)
+
+    assert len(linear) > 0
+    assert len(turning) == len(linear)
+    assert turning.contains(np.array([[0.0, 0.0]])).all()
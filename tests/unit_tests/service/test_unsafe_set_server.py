@@ -0,0 +1,140 @@
+import asyncio
+import dataclasses
+import json
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from colav_unsafe_set import create_unsafe_set
+from colav_unsafe_set.objects import Agent, DynamicObstacle
+from colav_unsafe_set.service import UnsafeSetServer
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+def _scenario(seed, n_agents):
+    """Agents and obstacles as the JSON-ready dicts of the request protocol."""
+    rng = np.random.default_rng(seed)
+    dynamic_obstacles = random_obstacles(rng, 40, 150.0, velocity=(0.0, 8.0))
+    agents = [
+        make_agent(position=rng.uniform(-50, 50, 2), yaw=rng.uniform(-np.pi, np.pi)) for _ in range(n_agents)
+    ]
+    return (
+        [dataclasses.asdict(agent) for agent in agents],
+        [dataclasses.asdict(obstacle) for obstacle in dynamic_obstacles]
+    )
+
+
+def _expected(agent, dynamic_obstacles, dsf):
+    return create_unsafe_set(
+        Agent(**{key: tuple(value) if isinstance(value, list) else value for key, value in agent.items()}),
+        [
+            DynamicObstacle(**{key: tuple(value) if isinstance(value, list) else value for key, value in obstacle.items()})
+            for obstacle in dynamic_obstacles
+        ],
+        dsf=dsf
+    )
+
+
+async def _with_server(batch_window, client, **kwargs):
+    server = UnsafeSetServer(batch_window=batch_window, **kwargs)
+    listener = await server.start(host='127.0.0.1', port=0)
+    port = listener.sockets[0].getsockname()[1]
+    try:
+        return server, await client(port)
+    finally:
+        await server.close()
+
+
+def test_concurrent_clients_are_batched():
+    agents, dynamic_obstacles = _scenario(seed=5, n_agents=6)
+
+    async def request(port, request_id, agent):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        message = {'id': request_id, 'agent': agent, 'dynamic_obstacles': dynamic_obstacles, 'dsf': 30.0}
+        writer.write(json.dumps(message).encode() + b'\n')
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+        writer.close()
+        return reply
+
+    async def client(port):
+        return await asyncio.gather(*(request(port, i, agent) for i, agent in enumerate(agents)))
+
+    server, replies = asyncio.run(_with_server(0.1, client))
+
+    assert server.batches_evaluated == 1
+    assert server.last_batch_size == len(agents)
+    for i, reply in enumerate(replies):
+        assert reply['id'] == i
+        assert reply['unsafe_set'] == _expected(agents[i], dynamic_obstacles, dsf=30.0)
+
+
+def test_latest_request_wins_per_connection():
+    agents, dynamic_obstacles = _scenario(seed=6, n_agents=3)
+
+    async def client(port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        lines = [
+            json.dumps({'id': i, 'agent': agent, 'dynamic_obstacles': dynamic_obstacles, 'dsf': 30.0}).encode() + b'\n'
+            for i, agent in enumerate(agents)
+        ]
+        writer.write(b''.join(lines) + b'not json\n')
+        await writer.drain()
+        replies = [json.loads(await reader.readline()) for _ in range(len(agents) + 1)]
+        writer.close()
+        return replies
+
+    _, replies = asyncio.run(_with_server(0.1, client))
+
+    assert [reply for reply in replies if reply.get('superseded')] == [
+        {'id': 0, 'superseded': True}, {'id': 1, 'superseded': True}
+    ]
+    assert any('error' in reply and reply['id'] is None for reply in replies)
+    final = [reply for reply in replies if 'unsafe_set' in reply]
+    assert len(final) == 1 and final[0]['id'] == 2
+    assert final[0]['unsafe_set'] == _expected(agents[2], dynamic_obstacles, dsf=30.0)
+
+
+async def _request_replies(port, messages):
+    """Send each message on its own connection and return the replies (None if none arrives)."""
+    async def request(message):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(json.dumps(message).encode() + b'\n')
+        await writer.drain()
+        try:
+            return json.loads(await asyncio.wait_for(reader.readline(), timeout=5.0))
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    return [await request(message) for message in messages]
+
+
+def test_failed_batch_is_answered_with_an_error(caplog):
+    agents, dynamic_obstacles = _scenario(seed=7, n_agents=2)
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    messages = [
+        {'id': i, 'agent': agent, 'dynamic_obstacles': dynamic_obstacles, 'dsf': 30.0} for i, agent in enumerate(agents)
+    ]
+
+    server, replies = asyncio.run(_with_server(0.01, lambda port: _request_replies(port, messages), executor=executor))
+
+    assert [reply['id'] for reply in replies] == [0, 1]
+    assert all('error' in reply for reply in replies)
+    assert server.batches_evaluated == 0
+    assert 'failed' in caplog.text
+
+
+def test_stopped_batcher_answers_waiting_and_later_requests(caplog):
+    agents, dynamic_obstacles = _scenario(seed=8, n_agents=2)
+    messages = [
+        {'id': i, 'agent': agent, 'dynamic_obstacles': dynamic_obstacles, 'dsf': 30.0} for i, agent in enumerate(agents)
+    ]
+
+    # An invalid batch window makes the batching task itself raise on its first wakeup.
+    _, replies = asyncio.run(_with_server('invalid', lambda port: _request_replies(port, messages)))
+
+    assert [reply['id'] for reply in replies] == [0, 1]
+    assert all('error' in reply for reply in replies)
+    assert 'batching stopped' in caplog.text
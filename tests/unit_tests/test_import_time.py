@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2] / 'src'
+
+# Cold start budget for `import colav_unsafe_set` in a fresh interpreter, numpy included.
+IMPORT_BUDGET_SECONDS = 1.0
+
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import colav_unsafe_set
+elapsed = time.perf_counter() - start
+heavy = sorted({name.split('.')[0] for name in sys.modules} & {'scipy', 'matplotlib', 'pandas', 'yaml'})
+print(elapsed)
+print(','.join(heavy))
+"""
+
+
+def _cold_import():
+    environment = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_PROBE], env=environment, text=True)
+    elapsed, heavy = (output.splitlines() + [''])[:2]
+    return float(elapsed), heavy
+
+
+def test_import_does_not_load_heavy_modules():
+    _, heavy = _cold_import()
+
+    assert heavy == ''
+
+
+def test_import_within_budget():
+    # Best of a few runs to keep noisy CI machines from failing the budget spuriously.
+    elapsed = min(_cold_import()[0] for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET_SECONDS
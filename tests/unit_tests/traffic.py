@@ -0,0 +1,125 @@
+"""Seeded agents, obstacles and polygon checks shared by the unit tests."""
+import math
+import numpy as np
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from colav_unsafe_set.objects import Agent, DynamicObstacle, DynamicObstacleWithMetrics
+
+# A constant, or a (low, high) range sampled uniformly per obstacle
+Value = Union[float, Tuple[float, float]]
+
+
+def yaw_quaternion(yaw: float) -> Tuple[float, float, float, float]:
+    """Quaternion (x, y, z, w) of a rotation by yaw radians about the z axis."""
+    return (float(0), float(0), math.sin(yaw / 2), math.cos(yaw / 2))
+
+
+def _position(position: Sequence[float]) -> Tuple[float, float, float]:
+    return (float(position[0]), float(position[1]), float(position[2]) if len(position) > 2 else float(0))
+
+
+def make_agent(
+    position: Sequence[float] = (0.0, 0.0),
+    yaw: float = 0.0,
+    velocity: float = 5.0,
+    yaw_rate: float = 0.0,
+    safety_radius: float = 5.0,
+    cls: type = Agent,
+) -> Agent:
+    """Build an agent, in the XY plane unless a z coordinate is given (cls may be e.g. FrozenAgent)."""
+    return cls(
+        position=_position(position),
+        orientation=yaw_quaternion(yaw),
+        velocity=float(velocity),
+        yaw_rate=float(yaw_rate),
+        safety_radius=float(safety_radius)
+    )
+
+
+def make_obstacle(
+    position: Sequence[float] = (0.0, 0.0),
+    yaw: float = 0.0,
+    velocity: float = 0.0,
+    yaw_rate: float = 0.0,
+    safety_radius: float = 3.0,
+    tag: str = 'obstacle',
+    cls: type = DynamicObstacle,
+) -> DynamicObstacle:
+    """Build an obstacle, in the XY plane unless a z coordinate is given."""
+    return cls(
+        tag=tag,
+        position=_position(position),
+        orientation=yaw_quaternion(yaw),
+        velocity=float(velocity),
+        yaw_rate=float(yaw_rate),
+        safety_radius=float(safety_radius)
+    )
+
+
+def random_obstacles(
+    seed: Union[int, np.random.Generator],
+    n: int,
+    extent: Value,
+    velocity: Value = (0.0, 10.0),
+    yaw_rate: Value = 0.0,
+    safety_radius: Value = 3.0,
+    yaw: Optional[float] = None,
+    cls: type = DynamicObstacle,
+) -> List[DynamicObstacle]:
+    """
+    Seeded obstacles in the XY plane, tagged obstacle_0 ... obstacle_{n-1}.
+
+    Args:
+        seed (Union[int, np.random.Generator]): Seed, or a generator to draw from.
+        n (int): Number of obstacles.
+        extent (Value): Positions are uniform over [-extent, extent] on both axes, or over
+                        [low, high] if a range is given.
+        velocity (Value): Speed in m/s.
+        yaw_rate (Value): Yaw rate in rad/s.
+        safety_radius (Value): Safety radius in meters.
+        yaw (Optional[float]): Common heading, uniform over [-pi, pi] if None.
+        cls (type): Obstacle class, e.g. FrozenDynamicObstacle.
+
+    Returns:
+        List[DynamicObstacle]: The obstacles.
+    """
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+    def sample(value: Value) -> np.ndarray:
+        if isinstance(value, tuple):
+            return rng.uniform(value[0], value[1], n)
+        return np.full(n, float(value))
+
+    low, high = extent if isinstance(extent, tuple) else (-extent, extent)
+    positions = rng.uniform(low, high, (n, 2))
+    yaws = rng.uniform(-np.pi, np.pi, n) if yaw is None else np.full(n, yaw)
+    velocities, yaw_rates, safety_radii = sample(velocity), sample(yaw_rate), sample(safety_radius)
+    return [
+        make_obstacle(
+            positions[i], yaws[i], velocities[i], yaw_rates[i], safety_radii[i], tag=f'obstacle_{i}', cls=cls
+        )
+        for i in range(n)
+    ]
+
+
+def with_metrics(
+    dynamic_obstacles: Iterable[DynamicObstacle],
+    dcpa: Union[float, Sequence[float]],
+    tcpa: Union[float, Sequence[float]],
+) -> List[DynamicObstacleWithMetrics]:
+    """Wrap obstacles with fixed metrics, either one value for all or one per obstacle."""
+    dynamic_obstacles = list(dynamic_obstacles)
+    dcpa = np.broadcast_to(np.asarray(dcpa, dtype=np.float64), len(dynamic_obstacles))
+    tcpa = np.broadcast_to(np.asarray(tcpa, dtype=np.float64), len(dynamic_obstacles))
+    return [
+        DynamicObstacleWithMetrics(dynamic_obstacle=obstacle, dcpa=float(obstacle_dcpa), tcpa=float(obstacle_tcpa))
+        for obstacle, obstacle_dcpa, obstacle_tcpa in zip(dynamic_obstacles, dcpa, tcpa)
+    ]
+
+
+def inside(polygon, points, tolerance: float = 1e-9) -> np.ndarray:
+    """Whether each point lies inside a counter-clockwise convex polygon."""
+    polygon = np.asarray(polygon)
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    offsets = np.asarray(points)[:, None, :] - polygon[None, :, :]
+    cross = edges[None, :, 0] * offsets[:, :, 1] - edges[None, :, 1] * offsets[:, :, 0]
+    return np.all(cross >= -tolerance, axis=1)
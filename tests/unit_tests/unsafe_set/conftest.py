@@ -0,0 +1,8 @@
+import pytest
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+@pytest.fixture
+def scenario():
+    """An agent among 200 seeded, slowly turning obstacles."""
+    return make_agent(velocity=6.0), random_obstacles(12, 200, 200.0, yaw_rate=0.05, safety_radius=4.0)
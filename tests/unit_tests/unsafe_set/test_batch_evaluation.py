@@ -0,0 +1,25 @@
+import numpy as np
+from colav_unsafe_set import create_unsafe_set, evaluate_many
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+def _frames(num_frames):
+    rng = np.random.default_rng(8)
+    return [
+        (make_agent(), random_obstacles(rng, 10, 100.0, velocity=3.0, safety_radius=2.0), 20.0)
+        for _ in range(num_frames)
+    ]
+
+
+def test_parallel_results_are_in_frame_order():
+    frames = _frames(12)
+
+    results = evaluate_many(frames, workers=2, chunksize=3)
+
+    assert results == [create_unsafe_set(*frame) for frame in frames]
+
+
+def test_single_worker_runs_in_process():
+    frames = _frames(3)
+
+    assert evaluate_many(iter(frames), workers=1) == [create_unsafe_set(*frame) for frame in frames]
@@ -0,0 +1,63 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from colav_unsafe_set import create_unsafe_set, create_clustered_unsafe_sets
+from colav_unsafe_set.unsafe_set.clustered_unsafe_sets import _union_find_labels
+from tests.unit_tests.traffic import make_agent, make_obstacle, random_obstacles
+
+
+AGENT = make_agent()
+
+
+def _area(polygon):
+    x, y = np.asarray(polygon).T
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def test_obstacles_on_opposite_sides_get_separate_hulls():
+    dynamic_obstacles = [
+        make_obstacle((25, 0), np.pi / 2, 2.0, tag='east_1'), make_obstacle((30, 8), np.pi / 2, 2.0, tag='east_2'),
+        make_obstacle((-25, 0), -np.pi / 2, 2.0, tag='west_1'), make_obstacle((-30, -8), -np.pi / 2, 2.0, tag='west_2'),
+    ]
+
+    unsafe_sets = create_clustered_unsafe_sets(AGENT, dynamic_obstacles, dsf=30.0)
+    single = create_unsafe_set(AGENT, dynamic_obstacles, dsf=30.0)
+
+    assert len(unsafe_sets) == 2
+    assert not unsafe_sets[0].contains(np.array([[0.0, 0.0]])).any()
+    assert sum(_area(unsafe_set) for unsafe_set in unsafe_sets) < _area(single) / 2
+    centres = np.array([obstacle.position[:2] for obstacle in dynamic_obstacles])
+    assert np.all(unsafe_sets[0].contains(centres) | unsafe_sets[1].contains(centres))
+
+
+def test_single_cluster_matches_unsafe_set():
+    dynamic_obstacles = [make_obstacle((10 + 6 * i, 5), 1.0, 2.0, tag=f'obstacle_{i}') for i in range(5)]
+
+    unsafe_sets = create_clustered_unsafe_sets(AGENT, dynamic_obstacles, dsf=20.0)
+
+    assert unsafe_sets == [create_unsafe_set(AGENT, dynamic_obstacles, dsf=20.0)]
+
+
+def test_executor_gives_the_same_hulls():
+    dynamic_obstacles = random_obstacles(10, 150, 120.0, velocity=2.0)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = create_clustered_unsafe_sets(AGENT, dynamic_obstacles, dsf=25.0, executor=executor)
+
+    assert parallel == create_clustered_unsafe_sets(AGENT, dynamic_obstacles, dsf=25.0)
+    assert len(parallel) > 1
+
+
+def test_union_find_matches_connected_components():
+    rng = np.random.default_rng(2)
+    n = 500
+    first, second = rng.integers(0, n, 400), rng.integers(0, n, 400)
+
+    labels = _union_find_labels(n, first, second)
+
+    graph = coo_matrix((np.ones(first.size), (first, second)), shape=(n, n))
+    count, expected = connected_components(graph, directed=False)
+    assert np.unique(labels).size == count
+    # Same partition: labels map one-to-one onto the reference components.
+    assert np.unique(np.column_stack((labels, expected)), axis=0).shape[0] == count
@@ -0,0 +1,23 @@
+import numpy as np
+from colav_unsafe_set import create_unsafe_set, create_unsafe_sets
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+def test_fleet_matches_per_agent_unsafe_sets():
+    rng = np.random.default_rng(4)
+    dynamic_obstacles = random_obstacles(rng, 200, 300.0, velocity=(0.0, 8.0), yaw_rate=0.02)
+    agents = [
+        make_agent(position=rng.uniform(-100, 100, 2), yaw=rng.uniform(-np.pi, np.pi))
+        for _ in range(6)
+    ]
+
+    unsafe_sets = create_unsafe_sets(agents, dynamic_obstacles, dsf=40.0)
+
+    assert unsafe_sets == [create_unsafe_set(agent, dynamic_obstacles, dsf=40.0) for agent in agents]
+
+
+def test_no_agents_or_obstacles():
+    agent = make_agent()
+
+    assert create_unsafe_sets([], [], dsf=10.0) == []
+    assert create_unsafe_sets([agent], [], dsf=10.0) == [[]]
@@ -0,0 +1,28 @@
+import pytest
+from colav_unsafe_set import create_unsafe_set, create_multi_horizon_unsafe_sets
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+@pytest.fixture
+def scenario():
+    return make_agent(yaw=0.8, velocity=6.0), random_obstacles(6, 300, 400.0, yaw_rate=0.01, safety_radius=4.0)
+
+
+@pytest.mark.parametrize("exact_hull", [False, True])
+def test_matches_one_call_per_horizon(scenario, exact_hull):
+    agent, dynamic_obstacles = scenario
+    horizons = [5, 15, 30, 60]
+
+    unsafe_sets = create_multi_horizon_unsafe_sets(agent, dynamic_obstacles, 40.0, horizons, exact_hull=exact_hull)
+
+    assert unsafe_sets == [
+        create_unsafe_set(agent, dynamic_obstacles, 40.0, exact_hull=exact_hull, time_of_interest=horizon)
+        for horizon in horizons
+    ]
+    assert len(unsafe_sets[-1]) > 0
+
+
+def test_no_obstacles(scenario):
+    agent, _ = scenario
+
+    assert create_multi_horizon_unsafe_sets(agent, [], 40.0, [5, 15]) == [[], []]
@@ -0,0 +1,56 @@
+import dataclasses
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set, OccupancyGrid, UnsafeSet
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+def _frame(step):
+    dynamic_obstacles = [
+        dataclasses.replace(obstacle, position=(obstacle.position[0] + 2.0 * step,) + obstacle.position[1:])
+        for obstacle in random_obstacles(21, 80, 150.0, velocity=4.0, yaw_rate=0.02, safety_radius=4.0)
+    ]
+    return make_agent(velocity=6.0), dynamic_obstacles
+
+
+def _cell_centres(grid):
+    x, y = np.meshgrid(grid.x, grid.y)
+    return np.column_stack((x.ravel(), y.ravel()))
+
+
+def test_grid_matches_scenario_matrix_extent():
+    grid = OccupancyGrid(width=400.0, height=300.0, resolution=2.0)
+
+    assert grid.shape == (150, 200)
+    assert grid.x[0] == -199.0 and grid.y[-1] == 149.0
+
+
+@pytest.mark.parametrize("distance_field", [False, True])
+def test_incremental_updates_match_full_rasterisation(distance_field):
+    grid = OccupancyGrid(width=400.0, height=400.0, resolution=2.0, distance_field=distance_field, max_distance=20.0)
+
+    for step in range(4):
+        unsafe_set = create_unsafe_set(*_frame(step), dsf=30.0, occupancy_grid=grid)
+
+        centres = _cell_centres(grid)
+        np.testing.assert_array_equal(grid.occupancy.ravel(), unsafe_set.contains(centres))
+        if distance_field:
+            np.testing.assert_allclose(
+                grid.distance.ravel(), np.minimum(unsafe_set.signed_distance(centres), 20.0)
+            )
+        assert 0 < grid.updated_cells < grid.occupancy.size
+    assert grid.occupancy.any()
+
+
+def test_unchanged_and_empty_unsafe_sets():
+    grid = OccupancyGrid(width=100.0, height=100.0, resolution=1.0, distance_field=True)
+    square = UnsafeSet([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0]])
+
+    grid.update(square)
+    assert grid.occupancy.sum() == 100
+    grid.update([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0]])
+    assert grid.updated_cells == 0
+
+    grid.update(UnsafeSet())
+    assert not grid.occupancy.any()
+    assert np.all(grid.distance == np.inf)
@@ -0,0 +1,92 @@
+import dataclasses
+import pickle
+import numpy as np
+from colav_unsafe_set import create_unsafe_set, UnsafeSet, UnsafeSetQuality
+from colav_unsafe_set.unsafe_set import unsafe_set as unsafe_set_module
+from tests.unit_tests.traffic import inside, make_agent, make_obstacle
+
+
+def test_unbudgeted_result_is_full_quality(scenario):
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0)
+
+    assert isinstance(unsafe_set, UnsafeSet)
+    assert unsafe_set.quality is UnsafeSetQuality.FULL
+    assert unsafe_set.elapsed_ms > 0
+    assert create_unsafe_set(*scenario, dsf=40.0, budget_ms=1e6) == unsafe_set
+
+
+def test_spent_budget_falls_back_to_bounding_discs(scenario):
+    full = create_unsafe_set(*scenario, dsf=40.0)
+
+    bounding = create_unsafe_set(*scenario, dsf=40.0, budget_ms=0)
+
+    assert bounding.quality is UnsafeSetQuality.BOUNDING
+    assert inside(bounding, full).all()
+
+
+def test_spent_budget_reuses_previous_for_unchanged_obstacles(scenario):
+    previous = create_unsafe_set(*scenario, dsf=40.0)
+    bounding = create_unsafe_set(*scenario, dsf=40.0, budget_ms=0)
+
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0, budget_ms=0, previous=previous)
+
+    assert unsafe_set.quality is UnsafeSetQuality.PREVIOUS
+    assert inside(unsafe_set, previous).all()
+    assert np.isclose(_area(unsafe_set), _area(previous))
+    assert _area(unsafe_set) < _area(bounding)
+
+
+def test_spent_budget_ignores_previous_once_an_obstacle_moved(scenario):
+    agent, dynamic_obstacles = scenario
+    previous = create_unsafe_set(agent, dynamic_obstacles, dsf=40.0)
+    moved = [
+        dataclasses.replace(obstacle, position=(obstacle.position[0] + 1.0, *obstacle.position[1:]))
+        for obstacle in dynamic_obstacles
+    ]
+
+    unsafe_set = create_unsafe_set(agent, moved, dsf=40.0, budget_ms=0, previous=previous)
+
+    assert unsafe_set.quality is UnsafeSetQuality.BOUNDING
+    assert unsafe_set == create_unsafe_set(agent, moved, dsf=40.0, budget_ms=0)
+
+
+def test_coarse_hull_when_full_hull_does_not_fit(scenario, monkeypatch):
+    monkeypatch.setattr(unsafe_set_module, '_FULL_HULL_COST_FACTOR', 1e12)
+    full = create_unsafe_set(*scenario, dsf=40.0)
+
+    coarse = create_unsafe_set(*scenario, dsf=40.0, budget_ms=1e6)
+
+    assert coarse.quality is UnsafeSetQuality.COARSE
+    assert inside(coarse, full).all()
+
+
+def test_unsafe_set_pickles_with_its_quality(scenario):
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0, budget_ms=0)
+
+    restored = pickle.loads(pickle.dumps(unsafe_set))
+
+    assert restored == unsafe_set
+    assert restored.quality is UnsafeSetQuality.BOUNDING
+    assert restored.timestamp == unsafe_set.timestamp
+    assert restored.obstacle_states == unsafe_set.obstacle_states
+
+
+def test_previous_covers_an_obstacle_entering_between_frames():
+    agent = make_agent(velocity=0.0)
+    static = make_obstacle((20.0, 0.0), tag='static')
+    entering = make_obstacle((0.0, 100.0), yaw=-np.pi / 2, velocity=10.0, tag='entering')
+    previous = create_unsafe_set(agent, [static], dsf=30.0)
+
+    full = create_unsafe_set(agent, [static, entering], dsf=30.0)
+    bounding = create_unsafe_set(agent, [static, entering], dsf=30.0, budget_ms=0)
+    unsafe_set = create_unsafe_set(agent, [static, entering], dsf=30.0, budget_ms=0, previous=previous)
+
+    assert unsafe_set.quality is UnsafeSetQuality.PREVIOUS
+    assert inside(unsafe_set, full).all()
+    assert inside(bounding, unsafe_set, tolerance=1e-6).all()
+    assert unsafe_set.contains(np.array([[0.0, 2.0]])).all()
+
+
+def _area(polygon) -> float:
+    x, y = np.asarray(polygon).T
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set
+from colav_unsafe_set.objects import ObstacleBatch
+from colav_unsafe_set.indices_of_interest import calc_indices_of_interest_masks, calc_reachable_mask
+from colav_unsafe_set.risk_assessment import calc_cpa_batch
+from tests.unit_tests.traffic import make_agent, random_obstacles
+
+
+@pytest.fixture
+def agent():
+    return make_agent(yaw=0.4, velocity=8.0)
+
+
+@pytest.mark.parametrize("turning_cpa", [False, True])
+def test_prefilter_does_not_change_the_unsafe_set(agent, turning_cpa):
+    dynamic_obstacles = random_obstacles(
+        7, 3000, 10000.0, velocity=(0.0, 12.0), yaw_rate=(-0.05, 0.05), safety_radius=(2.0, 8.0)
+    )
+
+    filtered = create_unsafe_set(agent, dynamic_obstacles, dsf=500.0, turning_cpa=turning_cpa)
+    unfiltered = create_unsafe_set(agent, dynamic_obstacles, dsf=500.0, turning_cpa=turning_cpa, prefilter=False)
+
+    assert len(filtered) > 0
+    assert filtered == unfiltered
+    assert filtered.culled_obstacles > 0.95 * len(dynamic_obstacles)
+    assert unfiltered.culled_obstacles == 0
+
+
+def test_reachable_mask_covers_indices_of_interest(agent):
+    batch = ObstacleBatch.from_obstacles(
+        random_obstacles(8, 5000, 600.0, velocity=(0.0, 12.0), yaw_rate=(-0.05, 0.05), safety_radius=(2.0, 8.0))
+    )
+
+    for dsf, time_of_interest in [(20.0, 15.0), (80.0, 5.0), (5.0, 60.0), (0.0, 0.0)]:
+        dcpa, tcpa = calc_cpa_batch(agent, batch)
+        masks = calc_indices_of_interest_masks(agent, batch, dcpa, tcpa, dsf, time_of_interest)
+        reachable = calc_reachable_mask(agent, batch, dsf, time_of_interest)
+
+        assert not np.any(masks.uIoI & ~reachable)
+        assert not reachable.all()
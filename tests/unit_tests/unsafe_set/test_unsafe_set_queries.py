@@ -0,0 +1,108 @@
+import math
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set, UnsafeSet
+from tests.unit_tests.traffic import inside
+
+
+def test_contains_and_signed_distance_of_square():
+    square = UnsafeSet([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]])
+    points = np.array([[1.0, 1.0], [1.0, 0.5], [2.0, 1.0], [3.0, 1.0], [3.0, 3.0], [-1.0, 1.0]])
+
+    np.testing.assert_array_equal(square.contains(points), [True, True, True, False, False, False])
+    np.testing.assert_allclose(square.signed_distance(points), [-1.0, -0.5, 0.0, 1.0, math.sqrt(2), 1.0])
+
+
+def test_clockwise_vertices_are_reversed():
+    square = UnsafeSet([[0.0, 0.0], [0.0, 2.0], [2.0, 2.0], [2.0, 0.0]])
+
+    assert square == [[2.0, 0.0], [2.0, 2.0], [0.0, 2.0], [0.0, 0.0]]
+    assert square.contains(np.array([[1.0, 1.0]]))[0]
+    np.testing.assert_allclose(square.signed_distance(np.array([[1.0, 1.0]])), [-1.0])
+
+
+def test_unsafe_set_cannot_be_modified():
+    triangle = UnsafeSet([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0]])
+
+    with pytest.raises(AttributeError):
+        triangle.append([0.0, 2.0])
+    with pytest.raises(TypeError):
+        triangle[0] = [1.0, 1.0]
+    with pytest.raises(ValueError):
+        triangle.vertices[0] = 1.0
+    assert triangle.contains(np.array([[1.5, 0.5], [0.5, 1.5]])).tolist() == [True, False]
+
+
+def test_queries_agree_with_hull_edges(scenario):
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0)
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-250, 250, (2000, 2))
+
+    np.testing.assert_array_equal(unsafe_set.contains(points), inside(unsafe_set, points, tolerance=0))
+    np.testing.assert_array_equal(unsafe_set.signed_distance(points) <= 0, unsafe_set.contains(points))
+    assert not UnsafeSet([]).contains(points).any()
+
+
+def test_intersect_paths_with_square():
+    square = UnsafeSet([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]])
+    paths = np.array([
+        [[-2.0, 1.0], [-1.0, 1.0], [3.0, 1.0]],                   # Enters a quarter of the way along segment 1
+        [[-2.0, 3.0], [4.0, 3.0], [5.0, 3.0]],                    # Passes above
+        [[1.0, 1.0], [5.0, 1.0], [6.0, 1.0]],                     # Starts inside
+        [[-1.0, 0.0], [-0.5, 0.0], [-0.5, 0.0]],                  # Stops short, with a zero-length segment
+    ])
+
+    crosses, first_segment, entry = square.intersect_paths(paths)
+
+    np.testing.assert_array_equal(crosses, [True, False, True, False])
+    np.testing.assert_array_equal(first_segment, [1, -1, 0, -1])
+    np.testing.assert_allclose(entry, [0.25, np.nan, 0.0, np.nan])
+
+
+def test_intersect_paths_agrees_with_dense_sampling(scenario):
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0)
+    rng = np.random.default_rng(8)
+    paths = np.cumsum(rng.normal(0, 25, (300, 6, 2)), axis=1) + rng.uniform(-200, 200, (300, 1, 2))
+
+    crosses, first_segment, entry = unsafe_set.intersect_paths(paths)
+
+    t = np.linspace(0, 1, 2001)
+    samples = paths[:, :-1, None, :] + t[:, None] * (paths[:, 1:, None, :] - paths[:, :-1, None, :])
+    sampled_hits = unsafe_set.contains(samples.reshape(-1, 2)).reshape(300, 5, t.size).any(axis=2)
+    np.testing.assert_array_equal(crosses, sampled_hits.any(axis=1))
+    np.testing.assert_array_equal(first_segment[crosses], np.argmax(sampled_hits[crosses], axis=1))
+    assert np.all(unsafe_set.signed_distance(
+        paths[crosses, first_segment[crosses]] + entry[crosses, None] * (
+            paths[crosses, first_segment[crosses] + 1] - paths[crosses, first_segment[crosses]]
+        )
+    ) <= 1e-9)
+
+
+def test_vertex_array_is_kept(scenario):
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0)
+
+    assert unsafe_set.vertices.dtype == np.float64
+    assert not unsafe_set.vertices.flags.writeable
+    assert unsafe_set.tolist() == unsafe_set.vertices.tolist() == unsafe_set
+    assert unsafe_set.tolist() is not unsafe_set.tolist()
+    assert np.asarray(unsafe_set) is unsafe_set.vertices
+    assert UnsafeSet(unsafe_set.tolist()) == unsafe_set
+    assert np.asarray(unsafe_set, dtype=np.float32).dtype == np.float32
+    with pytest.raises(ValueError):
+        np.array(unsafe_set, dtype=np.float32, copy=False)
+
+
+@pytest.mark.parametrize("budget_ms", [None, 0])
+def test_out_buffer_is_not_shared(scenario, budget_ms):
+    out = np.empty((256, 2))
+    previous = create_unsafe_set(*scenario, dsf=40.0, out=out)
+
+    unsafe_set = create_unsafe_set(*scenario, dsf=40.0, budget_ms=budget_ms, previous=previous, out=out)
+    vertices = unsafe_set.tolist()
+    out[:] = np.nan
+
+    assert not np.shares_memory(unsafe_set.vertices, out)
+    assert unsafe_set == vertices
+    assert unsafe_set == create_unsafe_set(*scenario, dsf=40.0, budget_ms=budget_ms, previous=previous)
+    with pytest.raises(ValueError):
+        create_unsafe_set(*scenario, dsf=40.0, out=np.empty((2, 2)))
@@ -0,0 +1,74 @@
+import dataclasses
+import numpy as np
+import pytest
+from colav_unsafe_set import create_unsafe_set, UnsafeSetTracker
+from tests.unit_tests.traffic import make_agent, make_obstacle, random_obstacles
+
+
+AGENT = make_agent(yaw=0.4, velocity=3.0)
+
+
+def test_tracker_matches_create_unsafe_set_across_frames():
+    rng = np.random.default_rng(2)
+    n = 60
+    positions = rng.uniform(-150, 150, (n, 2))
+    yaws = rng.uniform(-np.pi, np.pi, n)
+    speeds = np.where(np.arange(n) < 40, 0.0, rng.uniform(0, 5, n))
+    agent_position = np.zeros(2)
+    tracker = UnsafeSetTracker(dsf=30.0)
+
+    for frame in range(30):
+        # Move a random subset of obstacles, the agent every few frames, and drop some obstacles.
+        moving = rng.random(n) < 0.3
+        positions[moving] += rng.normal(size=(moving.sum(), 2))
+        if frame % 5 == 0:
+            agent_position += 1.0
+        rows = rng.permutation(n)[:n - frame % 3]
+        agent = make_agent(agent_position, yaw=0.4, velocity=3.0)
+        dynamic_obstacles = [
+            make_obstacle(positions[i], yaws[i], speeds[i], yaw_rate=0.01, tag=f'obstacle_{i}') for i in rows
+        ]
+
+        assert tracker.update(agent, dynamic_obstacles) == create_unsafe_set(agent, dynamic_obstacles, dsf=30.0)
+
+
+def test_unchanged_frame_reuses_everything():
+    dynamic_obstacles = random_obstacles(0, 20, 50.0, velocity=1.0, yaw_rate=0.01, yaw=0.0)
+    tracker = UnsafeSetTracker(dsf=30.0)
+
+    first = tracker.update(AGENT, dynamic_obstacles)
+    assert tracker.recomputed_obstacles == 20 and tracker.hull_rebuilt
+
+    second = tracker.update(AGENT, dynamic_obstacles)
+    assert second == first
+    assert tracker.recomputed_obstacles == 0 and not tracker.hull_rebuilt
+
+
+def test_returned_hull_is_a_copy():
+    dynamic_obstacles = random_obstacles(1, 20, 50.0, velocity=1.0, yaw=0.0)
+    tracker = UnsafeSetTracker(dsf=30.0)
+
+    first = tracker.update(AGENT, dynamic_obstacles)
+    first[0][0] += 100.0
+    first.append([0.0, 0.0])
+
+    assert tracker.update(AGENT, dynamic_obstacles) == create_unsafe_set(AGENT, dynamic_obstacles, dsf=30.0)
+    assert not tracker.hull_rebuilt
+
+
+def test_movement_within_tolerance_is_ignored():
+    first = make_obstacle((10.0, 0.0), velocity=1.0, tag='obstacle_0')
+    second = make_obstacle((20.0, 5.0), velocity=1.0, tag='obstacle_1')
+    tracker = UnsafeSetTracker(dsf=30.0, tolerance=0.5)
+    tracker.update(AGENT, [first, second])
+
+    tracker.update(AGENT, [dataclasses.replace(first, position=(10.1, 0.0, 0.0)), second])
+
+    assert tracker.recomputed_obstacles == 0 and not tracker.hull_rebuilt
+
+
+def test_duplicate_tags_raise():
+    dynamic_obstacles = [make_obstacle(velocity=1.0, tag='obstacle_0'), make_obstacle(velocity=1.0, tag='obstacle_0')]
+
+    with pytest.raises(ValueError):
+        UnsafeSetTracker(dsf=10.0).update(AGENT, dynamic_obstacles)